@@ -25,5 +25,15 @@ def health_check(request):
     except Exception as e:
         status["database"] = f"error: {str(e)}"
         status["status"] = "error"
-    
+
+    # Per-stage ranking latency (rolling window, this process only)
+    from jobs.metrics import summary
+    status["latency"] = summary()
+
+    from jobs.circuit_breaker import encoder_breaker
+    status["encoder_circuit"] = encoder_breaker().stats()
+
+    from jobs.query_cache import query_cache
+    status["query_embedding_cache"] = query_cache().stats()
+
     return JsonResponse(status)
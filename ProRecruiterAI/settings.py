@@ -143,6 +143,83 @@ STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Resume text extraction (bounded process pool, see jobs/resume_extraction.py)
+RESUME_EXTRACT_WORKERS = config('RESUME_EXTRACT_WORKERS', default=2, cast=int)
+RESUME_EXTRACT_TIMEOUT = config('RESUME_EXTRACT_TIMEOUT', default=10, cast=int)  # seconds per file
+RESUME_EXTRACT_MAX_PAGES = config('RESUME_EXTRACT_MAX_PAGES', default=20, cast=int)
+RESUME_EXTRACT_MAX_CHARS = config('RESUME_EXTRACT_MAX_CHARS', default=20000, cast=int)
+RESUME_EXTRACT_MAX_TOKENS = config('RESUME_EXTRACT_MAX_TOKENS', default=0, cast=int)  # whitespace tokens, 0 = no limit
+RESUME_EXTRACT_MEMORY_MB = config('RESUME_EXTRACT_MEMORY_MB', default=512, cast=int)
+
+# Embedding registry: how often workers re-check which model version is serving
+EMBEDDING_VERSION_TTL = config('EMBEDDING_VERSION_TTL', default=30, cast=int)  # seconds
+
+# Compiled upskilling dataset (built by `manage.py compile_upskilling`; empty = media/models)
+UPSKILLING_ARTIFACT = config('UPSKILLING_ARTIFACT', default='')
+
+# Recommendation candidate generation (jobs/candidate_generation.py)
+RECOMMEND_CANDIDATE_LIMIT = config('RECOMMEND_CANDIDATE_LIMIT', default=200, cast=int)
+RECOMMEND_EXPERIENCE_SLACK = config('RECOMMEND_EXPERIENCE_SLACK', default=2, cast=int)  # years above the seeker's
+
+# Ranking cascades: lexical shortlist size N for the encoder, full XAI for the top K
+RANK_CASCADE_N = config('RANK_CASCADE_N', default=100, cast=int)
+RANK_CASCADE_K = config('RANK_CASCADE_K', default=20, cast=int)
+RECOMMEND_CASCADE_N = config('RECOMMEND_CASCADE_N', default=50, cast=int)
+RECOMMEND_CASCADE_K = config('RECOMMEND_CASCADE_K', default=10, cast=int)
+
+# Anytime applicant ranking (ranking API): encode the shortlist in chunks until the budget
+# is spent; candidates not reached stay "pending" for the background worker
+RANK_TIME_BUDGET = config('RANK_TIME_BUDGET', default=0.8, cast=float)  # seconds per request, 0 = unlimited
+# Streaming ranking API: keep it under the gunicorn --timeout in the Procfile
+RANK_STREAM_TIME_BUDGET = config('RANK_STREAM_TIME_BUDGET', default=90.0, cast=float)  # seconds
+RANK_CHUNK_SIZE = config('RANK_CHUNK_SIZE', default=32, cast=int)
+
+# Encoder circuit breaker (jobs/circuit_breaker.py) and per-request encoding deadline
+ENCODE_DEADLINE = config('ENCODE_DEADLINE', default=5.0, cast=float)  # seconds
+ENCODER_BREAKER_WINDOW = config('ENCODER_BREAKER_WINDOW', default=20, cast=int)  # recent calls considered
+ENCODER_BREAKER_MIN_CALLS = config('ENCODER_BREAKER_MIN_CALLS', default=5, cast=int)
+ENCODER_BREAKER_FAILURE_RATIO = config('ENCODER_BREAKER_FAILURE_RATIO', default=0.5, cast=float)
+ENCODER_BREAKER_SLOW_MS = config('ENCODER_BREAKER_SLOW_MS', default=2000, cast=int)
+ENCODER_BREAKER_SLOW_RATIO = config('ENCODER_BREAKER_SLOW_RATIO', default=0.5, cast=float)
+ENCODER_BREAKER_COOLDOWN = config('ENCODER_BREAKER_COOLDOWN', default=30, cast=int)  # seconds open before a trial call
+
+# Per-process LRU of ad-hoc job description embeddings (jobs/query_cache.py)
+QUERY_EMBEDDING_CACHE_MB = config('QUERY_EMBEDDING_CACHE_MB', default=16, cast=float)
+
+# Lexical (BM25) index: cascade stage one and the scorer when the AI model is unavailable
+LEXICAL_RESUME_INDEX_SIZE = config('LEXICAL_RESUME_INDEX_SIZE', default=5000, cast=int)  # resumes kept in memory
+
+# Materialized recommendation feeds (jobs/feed.py)
+FEED_SIZE = config('FEED_SIZE', default=50, cast=int)  # jobs stored per seeker
+FEED_REFRESH_DELAY = config('FEED_REFRESH_DELAY', default=30, cast=int)  # seconds; coalesces bursts of events
+
+# Job detail match scores, cached per seeker/job/model version (jobs/match_scores.py)
+MATCH_SCORE_TTL = config('MATCH_SCORE_TTL', default=3600, cast=int)  # seconds
+
+# browse_jobs keyset pagination over session ranking snapshots (jobs/snapshots.py)
+BROWSE_PAGE_SIZE = config('BROWSE_PAGE_SIZE', default=20, cast=int)
+BROWSE_SNAPSHOT_TTL = config('BROWSE_SNAPSHOT_TTL', default=900, cast=int)  # seconds a ranking stays stable
+BROWSE_SNAPSHOT_LIMIT = config('BROWSE_SNAPSHOT_LIMIT', default=1000, cast=int)  # job ids kept per snapshot
+
+# Background task queue (jobs/task_queue.py, `manage.py run_worker`)
+TASK_POLL_SECONDS = config('TASK_POLL_SECONDS', default=2.0, cast=float)  # worker sleep when the queue is empty
+TASK_RETRY_BACKOFF = config('TASK_RETRY_BACKOFF', default=30, cast=int)  # seconds, doubled per failed attempt
+TASK_LEASE_SECONDS = config('TASK_LEASE_SECONDS', default=900, cast=int)  # running longer = worker presumed dead
+TASK_RETENTION_DAYS = config('TASK_RETENTION_DAYS', default=7, cast=int)  # finished tasks kept this long
+
+# Periodic maintenance scheduler (jobs/scheduler.py, `manage.py run_scheduler`)
+SCHEDULER_TICK_SECONDS = config('SCHEDULER_TICK_SECONDS', default=30, cast=int)
+SCHEDULER_LEASE_SECONDS = config('SCHEDULER_LEASE_SECONDS', default=1800, cast=int)  # longer than the slowest job
+SCHEDULER_IN_PROCESS = config('SCHEDULER_IN_PROCESS', default=False, cast=bool)  # also run it inside each web process
+SCHEDULER_LOCAL_JOBS = config('SCHEDULER_LOCAL_JOBS', default=True, cast=bool)  # per-process jobs (warm_caches) in web processes
+JOB_VIEW_RETENTION_DAYS = config('JOB_VIEW_RETENTION_DAYS', default=180, cast=int)  # recommendations look back 90
+
+# Hash resume uploads while they stream in (content-addressed storage)
+FILE_UPLOAD_HANDLERS = [
+    'jobs.resume_storage.HashingMemoryFileUploadHandler',
+    'jobs.resume_storage.HashingTemporaryFileUploadHandler',
+]
+
 # Auth Redirects
 LOGIN_URL = 'accounts:jobseeker_login'
 LOGIN_REDIRECT_URL = 'project_home'
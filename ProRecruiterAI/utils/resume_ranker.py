@@ -1,9 +1,7 @@
 import os
-import pandas as pd
 import numpy as np
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 from django.conf import settings
+from jobs.similarity import normalize, top_k_cosine
 import pickle
 import logging
 import sys
@@ -37,14 +35,20 @@ class ResumeRanker:
         
         self.model = None
         self.df = None
+        self.resume_matrix = None  # L2-normalised resume embeddings, built once
         self._load_model()
         self._initialized = True
     
     def _load_model(self):
         """Load model and data ONCE at startup"""
+        # Heavy ML imports live here so importing this module stays cheap
+        import pandas as pd
+        from sentence_transformers import SentenceTransformer
+
         try:
             self.model = SentenceTransformer(self.model_path)
             self.df = pd.read_pickle(self.data_path)
+            self.resume_matrix = normalize(np.stack(self.df['resume_embedding'].values))
             logger.info(f"✅ Loaded {len(self.df)} resumes and model")
         except Exception as e:
             logger.error(f"❌ Model loading failed: {e}")
@@ -58,15 +62,14 @@ class ResumeRanker:
         # Encode job description
         jd_emb = self.model.encode(job_description)
         
-        # Compute similarity scores
-        resume_embs = np.stack(self.df['resume_embedding'].values)
-        scores = cosine_similarity(resume_embs, [jd_emb]).flatten() * 100
+        # Similarity against the pre-normalised corpus, then select the top K only
+        indices, scores = top_k_cosine(self.resume_matrix, normalize(jd_emb), top_k, normalized=True)
         
         # Create results
-        self.df['rank_score'] = scores
-        results = self.df.nlargest(top_k, 'rank_score')
+        results = self.df.iloc[indices][['skills_list', 'full_resume_text']].copy()
+        results.insert(0, 'rank_score', scores * 100)
         
-        return results[['rank_score', 'skills_list', 'full_resume_text']].to_dict('records')
+        return results.to_dict('records')
 
 # Helper for true lazy loading
 _ranker_instance = None
@@ -14,3 +14,14 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ProRecruiterAI.settings')
 
 application = get_wsgi_application()
+
+from django.conf import settings  # noqa: E402
+
+# Per-process jobs (cache warming) always run here; the exclusive ones only
+# with SCHEDULER_IN_PROCESS, otherwise the `scheduler` process runs them
+if settings.SCHEDULER_IN_PROCESS or settings.SCHEDULER_LOCAL_JOBS:
+    import socket
+
+    from jobs.scheduler import start_in_process
+
+    start_in_process(f"{socket.gethostname()}:{os.getpid()}", exclusive_jobs=settings.SCHEDULER_IN_PROCESS)
@@ -0,0 +1,20 @@
+# Generated by Django 6.0.2 on 2026-10-18 22:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_emailconfiguration'),
+        ('jobs', '0007_resumeblob_jobapplication_resume_blob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profile',
+            name='resume_blob',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='profiles', to='jobs.resumeblob'),
+        ),
+    ]
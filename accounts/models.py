@@ -24,6 +24,9 @@ class Profile(models.Model):
     experience_years = models.PositiveIntegerField(default=0)
     education = models.TextField(blank=True)
     resume = models.FileField(upload_to='resumes/', blank=True, null=True)
+    resume_blob = models.ForeignKey(
+        'jobs.ResumeBlob', on_delete=models.SET_NULL, blank=True, null=True, related_name='profiles'
+    )
     phone = models.CharField(max_length=20, blank=True)
     location = models.CharField(max_length=100, blank=True)
     linkedin_url = models.URLField(blank=True)
@@ -35,6 +38,11 @@ class Profile(models.Model):
 
     def __str__(self):
         return f"{self.user.username} ({self.user_type})"
+
+    def save(self, *args, **kwargs):
+        from jobs.models import attach_resume_blob
+        attach_resume_blob(self)
+        super().save(*args, **kwargs)
     
     def get_skills_list(self):
         if self.skills:
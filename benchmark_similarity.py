@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+"""
+Benchmark: jobs.similarity (NumPy) vs sklearn cosine_similarity
+
+Compares import cost, matrix-vector, matrix-matrix and top-K ranking on
+random 384-d embeddings (the size our sentence-transformer emits).
+
+Usage:
+    python benchmark_similarity.py [--rows 5000] [--repeat 20]
+"""
+import argparse
+import importlib
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from jobs.similarity import cosine_matrix, cosine_to_vector, normalize, top_k
+
+DIM = 384
+
+
+def timeit(func, repeat):
+    func()  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def import_cost(module):
+    """Cold import time in a fresh interpreter, in ms."""
+    code = f"import time; t = time.perf_counter(); import {module}; print((time.perf_counter() - t) * 1000)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    if result.returncode != 0:
+        return None
+    return float(result.stdout.strip())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--top-k", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    resumes = rng.standard_normal((args.rows, DIM)).astype(np.float32)
+    jobs = rng.standard_normal((200, DIM)).astype(np.float32)
+    query = rng.standard_normal(DIM).astype(np.float32)
+    resumes_n = normalize(resumes)
+    query_n = normalize(query)
+
+    try:
+        sklearn_pairwise = importlib.import_module("sklearn.metrics.pairwise")
+        sk_cosine = sklearn_pairwise.cosine_similarity
+    except ImportError:
+        sk_cosine = None
+
+    print("=" * 70)
+    print(f"COSINE SIMILARITY BENCHMARK ({args.rows} x {DIM}, repeat={args.repeat})")
+    print("=" * 70)
+
+    print("\nCold import (fresh interpreter):")
+    print(f"   jobs.similarity           {import_cost('jobs.similarity') or float('nan'):8.1f} ms")
+    sk_import = import_cost("sklearn.metrics.pairwise")
+    print(f"   sklearn.metrics.pairwise  {sk_import if sk_import is not None else float('nan'):8.1f} ms")
+
+    rows = [
+        ("matrix-vector", lambda: cosine_to_vector(resumes, query),
+         lambda: sk_cosine(resumes, [query]).ravel()),
+        ("matrix-vector (pre-normalised)", lambda: cosine_to_vector(resumes_n, query_n, normalized=True),
+         None),
+        ("matrix-matrix (200 jobs)", lambda: cosine_matrix(jobs, resumes),
+         lambda: sk_cosine(jobs, resumes)),
+        (f"top-{args.top_k} (pre-normalised)", lambda: top_k(resumes_n @ query_n, args.top_k),
+         lambda: np.argsort(-sk_cosine(resumes, [query]).ravel())[:args.top_k]),
+    ]
+
+    print(f"\n{'operation':34} {'numpy ms':>10} {'sklearn ms':>11} {'speedup':>8}")
+    print("-" * 70)
+    for name, ours, theirs in rows:
+        ours_ms = timeit(ours, args.repeat)
+        if theirs is not None and sk_cosine is not None:
+            theirs_ms = timeit(theirs, args.repeat)
+            print(f"{name:34} {ours_ms:10.3f} {theirs_ms:11.3f} {theirs_ms / ours_ms:7.1f}x")
+        else:
+            print(f"{name:34} {ours_ms:10.3f} {'-':>11} {'-':>8}")
+
+    if sk_cosine is not None:
+        diff = np.abs(cosine_to_vector(resumes, query) - sk_cosine(resumes, [query]).ravel()).max()
+        same_top = list(top_k(cosine_to_vector(resumes, query), args.top_k)) == list(
+            np.argsort(-sk_cosine(resumes, [query]).ravel(), kind="stable")[:args.top_k]
+        )
+        print(f"\nMax abs difference vs sklearn: {diff:.2e}; identical top-{args.top_k}: {same_top}")
+    else:
+        print("\nscikit-learn not installed; comparison columns skipped.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+"""
+Cold-start benchmark for web workers
+
+Measures, in fresh interpreters:
+1. Import cost of booting Django and loading the URLconf (python -X importtime)
+2. Wall time from interpreter start to the first response from /health/
+
+Fails (exit code 1) when:
+- any heavy ML module (numpy, pandas, pypdf, sklearn, torch,
+  sentence_transformers) is imported before the first request,
+- import time or time-to-first-response exceeds its budget.
+
+Usage:
+    python benchmark_startup.py
+    python benchmark_startup.py --max-import-ms 800 --max-first-response-ms 2500
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+HEAVY_MODULES = ("numpy", "pandas", "pypdf", "sklearn", "torch", "sentence_transformers", "scipy")
+
+BOOT = (
+    "import os, django; "
+    "os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ProRecruiterAI.settings'); "
+    "django.setup(); "
+    "import ProRecruiterAI.urls"
+)
+
+FIRST_RESPONSE = BOOT + (
+    "; from django.test import Client; "
+    "response = Client().get('/health/'); "
+    "print(response.status_code)"
+)
+
+
+def _env():
+    env = dict(os.environ)
+    env["ALLOWED_HOSTS"] = "testserver,localhost"
+    env.setdefault("PYTHONPATH", os.path.dirname(os.path.abspath(__file__)))
+    return env
+
+
+def measure_imports():
+    """Return (total_import_ms, {top-level package: cumulative ms})."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", BOOT],
+        capture_output=True, text=True, env=_env(),
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"Boot failed:\n{result.stderr[-2000:]}")
+
+    total_us = 0
+    packages = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, self_us, cumulative_us, name = (part.strip() for part in line.replace("import time:", "|").split("|"))
+        total_us += int(self_us)
+        top = name.split(".")[0]
+        packages[top] = max(packages.get(top, 0), int(cumulative_us))
+    return total_us / 1000, {name: us / 1000 for name, us in packages.items()}
+
+
+def measure_first_response():
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", FIRST_RESPONSE],
+        capture_output=True, text=True, env=_env(),
+    )
+    elapsed = (time.perf_counter() - start) * 1000
+    if result.returncode != 0 or not result.stdout.strip().endswith("200"):
+        raise SystemExit(f"First request failed:\n{result.stdout[-500:]}\n{result.stderr[-2000:]}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--max-import-ms", type=float, default=1000.0)
+    parser.add_argument("--max-first-response-ms", type=float, default=3000.0)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("WEB WORKER COLD START")
+    print("=" * 60)
+
+    import_runs = [measure_imports() for _ in range(args.runs)]
+    import_ms = statistics.median(run[0] for run in import_runs)
+    packages = import_runs[-1][1]
+    first_response_ms = statistics.median(measure_first_response() for _ in range(args.runs))
+
+    print(f"\nImport time (median of {args.runs}): {import_ms:.0f} ms (budget {args.max_import_ms:.0f} ms)")
+    print(f"Time to first response:          {first_response_ms:.0f} ms (budget {args.max_first_response_ms:.0f} ms)")
+    print("\nHeaviest top-level packages:")
+    for name, ms in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:10]:
+        print(f"   {name:28} {ms:8.1f} ms")
+
+    failures = []
+    heavy = sorted(name for name in packages if name in HEAVY_MODULES)
+    if heavy:
+        failures.append(f"heavy modules imported at boot: {', '.join(heavy)}")
+    if import_ms > args.max_import_ms:
+        failures.append(f"import time {import_ms:.0f} ms > {args.max_import_ms:.0f} ms")
+    if first_response_ms > args.max_first_response_ms:
+        failures.append(f"first response {first_response_ms:.0f} ms > {args.max_first_response_ms:.0f} ms")
+
+    if failures:
+        print("\n❌ Cold start regressed:")
+        for failure in failures:
+            print(f"   - {failure}")
+        sys.exit(1)
+
+    print("\n✅ Cold start within budget")
+
+
+if __name__ == "__main__":
+    main()
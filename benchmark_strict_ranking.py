@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""
+Benchmark: set-based strict ranker vs the per-row loop it replaced
+
+Scores synthetic applicants (skills, experience, education, resume flag)
+against one job, in memory only, so the numbers show scoring cost without
+database round-trips.
+
+Usage:
+    python benchmark_strict_ranking.py [--applicants 5000] [--repeat 20]
+"""
+import argparse
+import logging
+import os
+import random
+import time
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "ProRecruiterAI.settings")
+django.setup()
+
+from jobs.ai_service import calculate_skill_match  # noqa: E402
+from jobs.strict_ranker import _notes, score_profiles  # noqa: E402
+
+SKILLS = [
+    "python", "django", "flask", "java", "spring", "sql", "postgresql", "aws", "docker", "kubernetes",
+    "react", "javascript", "typescript", "go", "rust", "machine learning", "pandas", "git", "linux", "c++",
+]
+
+
+def per_row(job_skills, applicants, required):
+    """The old loop: one calculate_skill_match and one set of notes per applicant."""
+    results = []
+    for skills, years, education, resume in applicants:
+        skill_score = calculate_skill_match(skills, job_skills)
+        gap = years - required
+        exp_score = 100 if gap >= 0 else (max(0, 50 + gap * 25) if gap >= -2 else 0)
+        score = skill_score * 0.5 + exp_score * 0.35 + (10 if education else 0) + (5 if resume else 0)
+        results.append((round(min(100, max(0, score)), 1), _notes(skill_score, years, required, education, resume)))
+    return results
+
+
+def set_based(job_skills, applicants, required):
+    skill_pct, _, total = score_profiles(
+        job_skills,
+        [skills for skills, _, _, _ in applicants],
+        [years for _, years, _, _ in applicants],
+        required,
+        [education for _, _, education, _ in applicants],
+        [resume for _, _, _, resume in applicants],
+    )
+    return [
+        (round(float(total[i]), 1), _notes(skill_pct[i], years, required, education, resume))
+        for i, (_, years, education, resume) in enumerate(applicants)
+    ]
+
+
+def timeit(func, repeat):
+    func()  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--applicants", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    # The old path logged every pair; measure the scoring, not the log handler
+    logging.getLogger("jobs").setLevel(logging.WARNING)
+
+    rng = random.Random(42)
+    job_skills = rng.sample(SKILLS, 6)
+    applicants = [
+        (rng.sample(SKILLS, rng.randint(0, 8)), rng.randint(0, 12), rng.random() < 0.6, rng.random() < 0.8)
+        for _ in range(args.applicants)
+    ]
+
+    assert per_row(job_skills, applicants, 3) == set_based(job_skills, applicants, 3)
+
+    print("=" * 70)
+    print(f"STRICT RANKING BENCHMARK ({args.applicants} applicants, repeat={args.repeat})")
+    print("=" * 70)
+    old = timeit(lambda: per_row(job_skills, applicants, 3), args.repeat)
+    new = timeit(lambda: set_based(job_skills, applicants, 3), args.repeat)
+    columns = (
+        [skills for skills, _, _, _ in applicants],
+        [years for _, years, _, _ in applicants],
+        3,
+        [education for _, _, education, _ in applicants],
+        [resume for _, _, _, resume in applicants],
+    )
+    scores_only = timeit(lambda: score_profiles(job_skills, *columns), args.repeat)
+    print(f"   per-row loop             {old:8.2f} ms")
+    print(f"   set-based                {new:8.2f} ms   ({old / new:.1f}x)")
+    print(f"   set-based, scores only   {scores_only:8.2f} ms")
+    print("\nScores and notes are identical. In production the per-row loop also")
+    print("paid one profile query and one UPDATE per applicant; rank_strict uses")
+    print("one SELECT and one bulk UPDATE of the changed rows.")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,9 @@ mkdir -p staticfiles
 # Collect static files with verbose output
 python manage.py collectstatic --no-input --clear --no-post-process
 
+echo "==> Compiling upskilling dataset..."
+python manage.py compile_upskilling
+
 echo "==> Creating/Updating Admin User..."
 # Create admin user automatically
 python create_admin.py
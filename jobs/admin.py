@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Job, JobApplication
+from .models import EmbeddingModel, Job, JobApplication, ResumeBlob, ScheduledJob, Task
 
 
 @admin.register(Job)
@@ -82,3 +82,79 @@ class JobApplicationAdmin(admin.ModelAdmin):
         queryset.update(status='rejected')
         self.message_user(request, f'{queryset.count()} applications rejected.')
     mark_rejected.short_description = "Reject selected"
+
+
+@admin.register(ResumeBlob)
+class ResumeBlobAdmin(admin.ModelAdmin):
+    list_display = ('sha256', 'size', 'application_count', 'text_extracted_at', 'created_at')
+    search_fields = ('sha256',)
+    readonly_fields = ('sha256', 'file', 'size', 'text', 'text_extracted_at', 'created_at')
+
+    def application_count(self, obj):
+        return obj.applications.count()
+    application_count.short_description = 'Applications'
+
+
+@admin.register(EmbeddingModel)
+class EmbeddingModelAdmin(admin.ModelAdmin):
+    list_display = ('model_id', 'version', 'status', 'coverage_display', 'created_at', 'activated_at')
+    list_filter = ('status', 'model_id')
+    readonly_fields = ('status', 'fingerprint', 'progress', 'created_at', 'activated_at')
+
+    def coverage_display(self, obj):
+        from .embedding_store import coverage
+        return ", ".join(f"{kind} {done}/{total}" for kind, (done, total) in coverage(obj).items())
+    coverage_display.short_description = 'Coverage'
+
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    list_display = ('name', 'status', 'priority', 'attempts', 'run_after', 'locked_by', 'finished_at')
+    list_filter = ('status', 'name')
+    search_fields = ('name', 'dedupe_key', 'last_error')
+    readonly_fields = ('locked_by', 'locked_at', 'last_error', 'created_at', 'finished_at')
+    actions = ['retry_tasks']
+
+    def retry_tasks(self, request, queryset):
+        from django.utils import timezone
+        count = queryset.exclude(status='running').update(
+            status='queued', attempts=0, run_after=timezone.now(), finished_at=None
+        )
+        self.message_user(request, f'{count} tasks re-queued.')
+    retry_tasks.short_description = "Re-queue selected"
+
+
+@admin.register(ScheduledJob)
+class ScheduledJobAdmin(admin.ModelAdmin):
+    list_display = (
+        'name', 'enabled', 'interval_seconds', 'last_status', 'last_started_at', 'last_duration_ms',
+        'avg_duration_display', 'max_duration_ms', 'run_count', 'failure_count', 'consecutive_failures', 'next_run_at',
+    )
+    list_filter = ('enabled', 'last_status')
+    list_editable = ('enabled', 'interval_seconds')
+    readonly_fields = (
+        'name', 'lease_owner', 'lease_expires_at', 'last_started_at', 'last_status', 'last_error',
+        'last_duration_ms', 'max_duration_ms', 'total_duration_ms', 'run_count', 'failure_count',
+        'consecutive_failures',
+    )
+    actions = ['run_now', 'reset_stats']
+
+    def has_add_permission(self, request):
+        return False  # rows are created from the jobs registered in code
+
+    def avg_duration_display(self, obj):
+        return f"{obj.avg_duration_ms:.0f}" if obj.avg_duration_ms is not None else "-"
+    avg_duration_display.short_description = 'Avg duration ms'
+
+    def run_now(self, request, queryset):
+        from django.utils import timezone
+        count = queryset.update(next_run_at=timezone.now())
+        self.message_user(request, f'{count} jobs will run on the next scheduler tick.')
+    run_now.short_description = "Run on next tick"
+
+    def reset_stats(self, request, queryset):
+        count = queryset.update(
+            max_duration_ms=0, total_duration_ms=0, run_count=0, failure_count=0, consecutive_failures=0
+        )
+        self.message_user(request, f'Statistics reset for {count} jobs.')
+    reset_stats.short_description = "Reset statistics"
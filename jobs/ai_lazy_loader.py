@@ -8,7 +8,6 @@ logger = logging.getLogger('jobs')
 
 # Global cache for loaded models
 _ranker = None
-_sklearn_loaded = False
 
 
 def get_ranker():
@@ -19,6 +18,7 @@ def get_ranker():
             # Use the getter function instead of direct import
             from ProRecruiterAI.utils.resume_ranker import get_ranker_instance
             _ranker = get_ranker_instance()
+            _record_model_fingerprint(_ranker)
             logger.info("Resume ranker model loaded successfully via getter")
         except Exception as e:
             logger.warning(f"Failed to load resume ranker: {e}")
@@ -26,21 +26,14 @@ def get_ranker():
     return _ranker
 
 
-def get_sklearn():
-    """Lazy load sklearn modules"""
-    global _sklearn_loaded
-    if not _sklearn_loaded:
-        try:
-            from sklearn.metrics.pairwise import cosine_similarity
-            _sklearn_loaded = True
-            logger.info("Sklearn loaded successfully")
-            return cosine_similarity
-        except Exception as e:
-            logger.warning(f"Failed to load sklearn: {e}")
-            return None
-    else:
-        from sklearn.metrics.pairwise import cosine_similarity
-        return cosine_similarity
+def _record_model_fingerprint(ranker):
+    """Note which model files the ranker loaded, so the embedding store can tell if they change later."""
+    import os
+    from .embedding_store import fingerprint_model_dir
+
+    path = getattr(ranker, "model_path", None)
+    if ranker is not None and path and os.path.isdir(path):
+        ranker.model_fingerprint = fingerprint_model_dir(path)
 
 
 def is_ai_available():
@@ -48,7 +41,6 @@ def is_ai_available():
     try:
         import torch
         import sentence_transformers
-        import sklearn
         return True
     except ImportError:
         return False
@@ -2,23 +2,31 @@
 AI Service for Job Recommendations and CV Ranking
 Enhanced with semantic skill matching and comprehensive profile analysis
 """
+import heapq
 import logging
 import os
 import re
+import time
 from functools import lru_cache
-from pathlib import Path
 
 import numpy as np
-import pandas as pd
-from pypdf import PdfReader
 
 # Lazy load heavy AI dependencies
-from .ai_lazy_loader import get_ranker, get_sklearn
+from .ai_lazy_loader import get_ranker
+from .circuit_breaker import CircuitOpenError, DeadlineExceeded, encoder_breaker
+from .resume_extraction import extract_resume_text, extract_resume_texts
+from .resume_extractors import is_supported as is_supported_resume
+from .lexical import job_index, resume_index, tokenize
+from .metrics import timed
+from .query_cache import query_cache, query_key
+from .resume_features import EDUCATION_LABELS, extract_features, keyword_tokens, skill_vocabulary
+from .similarity import cosine_to_vector, top_k
+from .embedding_store import get_encoder, get_vector, get_vectors, serving_version, text_hash
 
 from django.conf import settings
 from datetime import timedelta
 from django.utils import timezone
-from django.db.models import Q, Sum, Count, Avg
+from django.db.models import Q, Sum, Count, Avg, prefetch_related_objects
 
 logger = logging.getLogger('jobs')
 
@@ -33,8 +41,8 @@ def calculate_keyword_similarity(text1, text2):
     if not text1 or not text2:
         return 0.0
     
-    words1 = set(w.lower().strip() for w in str(text1).split() if len(w) > 2)
-    words2 = set(w.lower().strip() for w in str(text2).split() if len(w) > 2)
+    words1 = keyword_tokens(text1)
+    words2 = keyword_tokens(text2)
     
     if not words1 or not words2:
         return 0.0
@@ -66,47 +74,162 @@ def calculate_skill_match(user_skills, job_skills):
     
     # Percentage of required skills matched (not user skills matched)
     score = (exact_matches / len(job_skills_list)) * 100
-    logger.info(f"STRICT Skill match - User: {user_skills_list}, Job: {job_skills_list}, Exact: {exact_matches}/{len(job_skills_list)}, Score: {score:.1f}%")
+    logger.debug(f"STRICT Skill match - User: {user_skills_list}, Job: {job_skills_list}, Exact: {exact_matches}/{len(job_skills_list)}, Score: {score:.1f}%")
     return score
 
 
-def _read_text_resume(file_field):
+def _resume_path(file_field):
+    """Return the on-disk path of a resume we can extract (PDF/DOCX), or None."""
     if not file_field:
-        return ""
+        return None
 
     try:
         path = file_field.path
     except Exception:
-        return ""
+        return None
 
     if not path or not os.path.exists(path):
-        return ""
+        return None
 
-    _, ext = os.path.splitext(path)
-    ext = ext.lower()
-    if ext != ".pdf":
-        return ""
+    if not is_supported_resume(path):
+        return None
 
-    try:
-        reader = PdfReader(path)
-        pages = []
-        for page in reader.pages:
-            text = page.extract_text() or ""
-            pages.append(text)
-        return "\n".join(pages).strip()
-    except Exception as exc:
-        logger.warning(f"Resume text read failed: {exc}")
+    return path
+
+
+def _read_text_resume(file_field):
+    path = _resume_path(file_field)
+    if not path:
         return ""
+    return extract_resume_text(path)
+
+
+def _blob_texts(blobs):
+    """
+    Return {blob.id: text} for ResumeBlobs, extracting (in parallel) and
+    persisting text only for content seen for the first time.
+    """
+    from jobs.models import ResumeBlob
+    from jobs.signals import resume_text_extracted
+
+    texts = {}
+    todo = {}
+    for blob in blobs:
+        if blob.id in texts or blob.id in todo:
+            continue
+        if blob.text_extracted_at:
+            texts[blob.id] = blob.text
+            continue
+        path = _resume_path(blob.file)
+        if path:
+            todo[blob.id] = (blob, path)
+        else:
+            texts[blob.id] = ""
+
+    if todo:
+        extracted = extract_resume_texts([path for _, path in todo.values()])
+        fresh = []
+        for blob_id, (blob, path) in todo.items():
+            text = extracted.get(path, "")
+            texts[blob_id] = text
+            if text:
+                blob.text = text
+                blob.text_extracted_at = timezone.now()
+                fresh.append(blob)
+        if fresh:
+            ResumeBlob.objects.bulk_update(fresh, ["text", "text_extracted_at"])
+            resume_text_extracted.send(sender=ResumeBlob, blob_ids=[blob.id for blob in fresh])
+
+    return texts
+
+
+def _profile_resume_text(profile):
+    if profile.resume_blob_id:
+        return _blob_texts([profile.resume_blob]).get(profile.resume_blob_id, "")
+    return _read_text_resume(profile.resume)
+
+
+def _prefetch_resume_texts(applications):
+    """Resolve every application's resume text in one batch; returns {application.id: text}."""
+    blob_texts = _blob_texts([app.resume_blob for app in applications if app.resume_blob_id])
+
+    legacy_paths = {
+        app.id: _resume_path(app.resume) for app in applications if not app.resume_blob_id
+    }
+    legacy_texts = extract_resume_texts([path for path in legacy_paths.values() if path])
+
+    texts = {}
+    for app in applications:
+        if app.resume_blob_id:
+            texts[app.id] = blob_texts.get(app.resume_blob_id, "")
+        else:
+            path = legacy_paths.get(app.id)
+            texts[app.id] = legacy_texts.get(path, "") if path else ""
+    return texts
 
 
-def _build_resume_text(application):
-    resume_text = _read_text_resume(application.resume)
+def _build_resume_text(application, prefetched=None):
+    if prefetched is None:
+        prefetched = _prefetch_resume_texts([application])
+    resume_text = prefetched.get(application.id, "")
     if resume_text:
         return resume_text, "application resume"
 
     return "", "none"
 
 
+def _resume_key(application):
+    """Embedding-store key: the content hash when the resume is deduplicated."""
+    if application.resume_blob_id:
+        return application.resume_blob.sha256
+    return f"application:{application.id}"
+
+
+def _encode_resumes(applications, resume_texts):
+    """
+    Resume vectors from the versioned embedding store; an identical CV is
+    encoded once no matter how many jobs it was sent to.
+    """
+    items = [(_resume_key(app), text) for app, text in zip(applications, resume_texts)]
+    return get_vectors("resume", items)
+
+
+def _profile_vector(profile, resume_text):
+    key = profile.resume_blob.sha256 if profile.resume_blob_id else f"profile:{profile.user_id}"
+    return get_vector("resume", key, resume_text)
+
+
+def _is_open(job):
+    return job.is_active and (job.deadline is None or job.deadline >= timezone.localdate())
+
+
+def _job_vectors(jobs, texts=None):
+    """
+    Stored job vectors (serving model version), keyed by job id. Closed
+    postings (e.g. in a seeker's history) are encoded but not stored, so
+    the expiry sweep's eviction sticks.
+    """
+    if texts is None:
+        texts = [_build_job_text(job) for job in jobs]
+    closed = [job.id for job in jobs if not _is_open(job)]
+    return get_vectors("job", [(job.id, text) for job, text in zip(jobs, texts)], transient=closed)
+
+
+def _encode_query(text):
+    """
+    Encode free text that has no stable identity (e.g. an ad-hoc job
+    description), reusing the vector from the query cache for a text seen before.
+    """
+    version = serving_version()
+    key = query_key(version.pk, text)
+    vector = query_cache().get(key)
+    if vector is None:
+        encoder = get_encoder(version)
+        vector = np.asarray(encoder.encode(text), dtype=np.float32)
+        query_cache().put(key, vector)
+    return vector
+
+
 def _build_job_text(job, job_description=None):
     parts = []
     if job_description:
@@ -125,55 +248,23 @@ def _split_skills(skills_text):
     return [s.strip() for s in skills_text.split(",") if s.strip()]
 
 
-def _extract_skill_matches(resume_text, job_skills):
+def _extract_skill_matches(resume_text, job_skills, features=None):
     """
     Extract matched and missing skills using simple string matching.
     Compatible with all Python versions, no spaCy dependency.
+    Pass the resume's ``features`` record to avoid rescanning the text.
     """
     if not resume_text or not job_skills:
         return [], list(job_skills)
 
-    # Normalize resume text for case-insensitive matching
-    resume_lower = resume_text.lower()
-    
-    matched = []
-    missing = []
-    
-    for skill in job_skills:
-        if not skill:
-            continue
-        
-        # Check for exact match (case-insensitive) with word boundaries
-        skill_lower = skill.lower()
-        
-        # Check if skill appears as whole word or in common variations
-        # e.g., "python" matches "Python", "python,", "python.", etc.
-        if skill_lower in resume_lower:
-            matched.append(skill)
-        else:
-            missing.append(skill)
-    
-    return matched, missing
+    features = features or extract_features(resume_text)
+    return features.match_skills(job_skills)
 
 
-def _infer_years_experience(resume_text):
+def _infer_years_experience(resume_text, features=None):
     if not resume_text:
         return None
-
-    patterns = [
-        r"(\d{1,2})\+?\s*(?:years|yrs)\s+(?:of\s+)?experience",
-        r"(\d{1,2})\+?\s*(?:years|yrs)",
-    ]
-
-    years = []
-    for pattern in patterns:
-        for match in re.findall(pattern, resume_text, flags=re.IGNORECASE):
-            try:
-                years.append(int(match))
-            except ValueError:
-                continue
-
-    return max(years) if years else None
+    return (features or extract_features(resume_text)).years
 
 
 def _normalize_title(text):
@@ -184,72 +275,48 @@ def _normalize_title(text):
 
 @lru_cache(maxsize=1)
 def _load_upskilling_data():
-    """Load the Employee Upskilling Dataset for market insights"""
-    dataset_path = Path(getattr(settings, "MEDIA_ROOT", "media")) / "models" / "Employee_Upskilling_Dataset.csv"
-
-    if not dataset_path.exists():
-        logger.warning(f"Upskilling dataset not found at {dataset_path}; skipping market insights.")
-        return None
+    """Load the compiled Employee Upskilling Dataset for market insights"""
+    from .upskilling import load
 
     try:
-        df = pd.read_csv(dataset_path)
-        df.columns = [col.strip().lower().replace(" ", "_") for col in df.columns]
-        
-        # Ensure success column is numeric
-        if "success_in_hiring_process" in df.columns:
-            df["success_in_hiring_process"] = pd.to_numeric(df["success_in_hiring_process"], errors="coerce").fillna(0)
-        
-        logger.info(f"Loaded upskilling dataset: {len(df)} records")
-        return df
+        data = load()
     except Exception as exc:
         logger.error(f"Failed to load upskilling dataset: {exc}")
         return None
+    if data is not None:
+        logger.info(f"Loaded upskilling dataset: {len(data)} records")
+    return data
 
 
-def _get_market_success_rate(job_title, industry=None):
-    """Get market success rate for similar roles from upskilling dataset"""
-    df = _load_upskilling_data()
-    if df is None or "success_in_hiring_process" not in df.columns:
-        return None
-
+def _match_upskilling_roles(data, job_title):
+    """Mask of dataset groups whose job role or current title resembles ``job_title``"""
     title_tokens = _normalize_title(job_title)
-    if not title_tokens:
+    if not title_tokens or not data.role_tokens:
         return None
+    mask = data.match_groups(title_tokens)
+    return mask if mask.any() else None
 
-    # Match by job role or current job title
-    role_cols = [col for col in ["job_role", "current_job_title"] if col in df.columns]
-    if not role_cols:
-        return None
 
-    matched_rows = []
-    for col in role_cols:
-        for idx, val in df[col].items():
-            if pd.isna(val):
-                continue
-            val_tokens = _normalize_title(str(val))
-            overlap = len(title_tokens & val_tokens) / max(len(title_tokens | val_tokens), 1)
-            if overlap >= 0.4:
-                matched_rows.append(idx)
+def _get_market_success_rate(job_title, industry=None):
+    """Get market success rate for similar roles from upskilling dataset"""
+    data = _load_upskilling_data()
+    if data is None or not data.has_success:
+        return None
 
-    if not matched_rows:
+    mask = _match_upskilling_roles(data, job_title)
+    if mask is None:
         return None
 
-    subset = df.loc[list(set(matched_rows))]
-    
     # Filter by industry if provided
-    if industry and "industry" in df.columns:
-        industry_match = subset[subset["industry"].str.lower() == industry.lower()]
-        if not industry_match.empty:
-            subset = industry_match
+    if industry:
+        mask = data.restrict_industry(mask, industry)
 
-    if subset.empty:
+    success_rate, total_count = data.success(mask)
+    if not total_count:
         return None
 
-    success_rate = subset["success_in_hiring_process"].mean() * 100
-    total_count = len(subset)
-
     return {
-        "success_rate": success_rate,
+        "success_rate": success_rate * 100,
         "sample_size": total_count,
         "role_match": True,
     }
@@ -257,48 +324,24 @@ def _get_market_success_rate(job_title, industry=None):
 
 def _get_upskilling_recommendations(job_title, current_skills=None):
     """Get AI upskilling recommendations based on market data"""
-    df = _load_upskilling_data()
-    if df is None:
+    data = _load_upskilling_data()
+    if data is None or not data.has_success:
         return []
 
-    title_tokens = _normalize_title(job_title)
-    if not title_tokens:
-        return []
-
-    # Match similar roles
-    role_cols = [col for col in ["job_role", "current_job_title"] if col in df.columns]
-    if not role_cols or "ai_upskilling_type" not in df.columns or "success_in_hiring_process" not in df.columns:
-        return []
-
-    matched_rows = []
-    for col in role_cols:
-        for idx, val in df[col].items():
-            if pd.isna(val):
-                continue
-            val_tokens = _normalize_title(str(val))
-            overlap = len(title_tokens & val_tokens) / max(len(title_tokens | val_tokens), 1)
-            if overlap >= 0.4:
-                matched_rows.append(idx)
-
-    if not matched_rows:
-        return []
-
-    subset = df.loc[list(set(matched_rows))]
-    if subset.empty:
+    mask = _match_upskilling_roles(data, job_title)
+    if mask is None:
         return []
 
     # Get upskilling types with success rates
-    upskilling_success = subset.groupby("ai_upskilling_type")["success_in_hiring_process"].agg(["mean", "count"]).reset_index()
-    upskilling_success = upskilling_success[upskilling_success["count"] >= 5]  # Min sample size
-    upskilling_success = upskilling_success.sort_values("mean", ascending=False)
+    upskilling_success = [row for row in data.success_by_upskilling(mask) if row[2] >= 5]  # Min sample size
+    upskilling_success.sort(key=lambda row: row[1], reverse=True)
 
     recommendations = []
-    for _, row in upskilling_success.head(3).iterrows():
-        skill_type = row["ai_upskilling_type"]
-        success_rate = row["mean"] * 100
-        if pd.notna(skill_type) and success_rate > 50:
+    for skill_type, mean, _ in upskilling_success[:3]:
+        success_rate = mean * 100
+        if success_rate > 50:
             recommendations.append({
-                "skill": str(skill_type),
+                "skill": skill_type,
                 "success_rate": success_rate,
             })
 
@@ -320,17 +363,16 @@ def _get_market_insights(job_title, industry=None):
     }
 
 
-def _build_xai(job, resume_text, candidate_id=None, job_description=None):
+def _build_xai(job, resume_text, candidate_id=None, job_description=None, features=None):
     job_skills = _split_skills(job.skills_required if job else "")
-    matched_skills, missing_skills = _extract_skill_matches(resume_text, job_skills)
-    years = _infer_years_experience(resume_text)
+    if resume_text and features is None:
+        features = extract_features(resume_text)
+    matched_skills, missing_skills = _extract_skill_matches(resume_text, job_skills, features)
+    years = _infer_years_experience(resume_text, features)
+    education = features.education if features is not None else ()
     market_insights = _get_market_insights(job.title if job else "", getattr(job, "company", None))
 
-    lines = []
-    if job_skills:
-        lines.append(f"{len(matched_skills)}/{len(job_skills)} required skills")
-    if years is not None:
-        lines.append(f"{years} years relevant experience (resume)")
+    lines = _profile_lines(job_skills, matched_skills, years, education)
     
     if market_insights:
         if market_insights["market_success_rate"]:
@@ -348,6 +390,7 @@ def _build_xai(job, resume_text, candidate_id=None, job_description=None):
         "matched_skills": matched_skills,
         "missing_skills": missing_skills,
         "experience_years": years,
+        "education": list(education),
         "similar_role": market_insights is not None,
         "similar_role_success": market_insights,
         "market_insights": market_insights,
@@ -355,6 +398,140 @@ def _build_xai(job, resume_text, candidate_id=None, job_description=None):
     }
 
 
+def _profile_lines(job_skills, matched_skills, years, education):
+    """Explanation lines for skills, experience and education (resume feature record)."""
+    lines = []
+    if job_skills:
+        lines.append(f"{len(matched_skills)}/{len(job_skills)} required skills")
+    if years is not None:
+        lines.append(f"{years} years relevant experience (resume)")
+    if education:
+        lines.append(f"{EDUCATION_LABELS[education[0]]} (resume)")
+    return lines
+
+
+def _build_light_xai(job_skills, matched_skills, missing_skills, years, education=()):
+    """XAI summary without market insights, for candidates below the cascade's top K."""
+    lines = _profile_lines(job_skills, matched_skills, years, education)
+    explanation = "Matched because:\n- " + "\n- ".join(lines) if lines else "Matched because: resume similarity"
+    return {
+        "matched_skills": matched_skills,
+        "missing_skills": missing_skills,
+        "experience_years": years,
+        "education": list(education),
+        "similar_role": False,
+        "similar_role_success": None,
+        "market_insights": None,
+        "explanation": explanation,
+    }
+
+
+def _skill_and_experience(job, features):
+    """(job_skills, matched, missing, skill_pct, exp_score) for one job/resume pair."""
+    job_skills = _split_skills(job.skills_required if job else "")
+    matched, missing = features.match_skills(job_skills) if job_skills else ([], [])
+    skill_pct = (len(matched) / len(job_skills)) * 100 if job_skills else 0.0
+    exp_score = 0.0
+    if job and job.experience_required and features.years is not None:
+        exp_score = min(100.0, (features.years / job.experience_required) * 100)
+    return job_skills, matched, missing, skill_pct, exp_score
+
+
+def _blend_score(similarity, skill_pct, exp_score, has_skills, similarity_weight, skills_weight):
+    weights = {
+        "similarity": similarity_weight,
+        "skills": skills_weight if has_skills else 0.0,
+        "experience": 0.1 if exp_score else 0.0,
+    }
+    total_weight = sum(weights.values()) or 1.0
+    score = (
+        similarity * weights["similarity"]
+        + skill_pct * weights["skills"]
+        + exp_score * weights["experience"]
+    ) / total_weight
+    return score, weights
+
+
+def _importance_note(similarity, skill_pct, exp_score, weights):
+    importance = _calculate_feature_importance(
+        [similarity, skill_pct, exp_score],
+        [weights["similarity"], weights["skills"], weights["experience"]],
+    )
+    if not importance:
+        return ""
+    return (
+        "\n- Feature importance: similarity "
+        f"{importance[0]:.0f}%, skills {importance[1]:.0f}%, experience {importance[2]:.0f}%"
+    )
+
+
+def _cascade_sizes(prefix):
+    """(shortlist N, full-XAI K) for a cascade, from settings."""
+    n = getattr(settings, f"{prefix}_CASCADE_N", 100)
+    k = getattr(settings, f"{prefix}_CASCADE_K", 20)
+    return max(1, n), max(1, k)
+
+
+def _lexical_relevance(bm25, keyword):
+    """Text relevance (0-100) from BM25 and shared keywords; stands in for embedding similarity."""
+    return 0.7 * np.asarray(bm25, dtype=np.float32) + 0.3 * np.asarray(keyword, dtype=np.float32)
+
+
+def _job_relevance(resume_text, resume_features, jobs, job_texts):
+    """Lexical relevance of one resume to each job, via the shared job index."""
+    index = job_index()
+    for job, text in zip(jobs, job_texts):
+        index.add(job.pk, text, version=job.updated_at)
+    bm25 = index.normalized_scores(tokenize(resume_text), [job.pk for job in jobs])
+    keyword = [resume_features.keyword_similarity(keyword_tokens(text)) for text in job_texts]
+    return _lexical_relevance(bm25, keyword)
+
+
+def _resume_relevance(job_text, resume_texts, features_list):
+    """Lexical relevance of each resume to one job, via the shared resume index."""
+    index = resume_index()
+    keys = [text_hash(text) for text in resume_texts]
+    for key, text in zip(keys, resume_texts):
+        index.add(key, text, version=key)
+    bm25 = index.normalized_scores(tokenize(job_text), keys)
+    query_tokens = keyword_tokens(job_text)
+    keyword = [features.keyword_similarity(query_tokens) for features in features_list]
+    return _lexical_relevance(bm25, keyword)
+
+
+def _lexical_stage(relevance, skill_pcts):
+    """Cascade stage one (0-100): text relevance plus required-skill overlap."""
+    return 0.7 * relevance + 0.3 * np.asarray(skill_pcts, dtype=np.float32)
+
+
+def _model_ready(ranker):
+    return bool(ranker) and getattr(ranker, "model", None) is not None
+
+
+def _encode_deadline():
+    """Monotonic time by which this request's encoder calls must finish (ENCODE_DEADLINE seconds)."""
+    return time.monotonic() + getattr(settings, "ENCODE_DEADLINE", 5.0)
+
+
+def _guarded_encode(deadline, fn, *args):
+    """Run an encoding step under the encoder circuit breaker and the request deadline (None = no deadline)."""
+    timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+    return encoder_breaker().call(fn, *args, timeout=timeout)
+
+
+def _fallback_reason(exc):
+    if isinstance(exc, CircuitOpenError):
+        return "AI scoring paused after repeated encoder failures"
+    if isinstance(exc, DeadlineExceeded):
+        return "AI scoring timed out"
+    return "AI scoring failed"
+
+
+def _prescreen_score(lexical_score, floor):
+    """Scale a lexical-only score below the lowest neurally scored candidate, keeping its order."""
+    return round(float(lexical_score) * floor / 100 * 0.99, 1)
+
+
 def _calculate_feature_importance(features, weights):
     """
     Calculate feature importance percentages based on weighted contributions.
@@ -394,23 +571,20 @@ def _build_user_embedding(user, resume_text):
     from jobs.models import JobApplication, JobPreference, JobView
     
     # Base embedding from resume
-    base_embedding = ranker.model.encode(resume_text)
-    weighted_embeddings = [base_embedding * 1.0]  # Base weight 1.0
+    base_embedding = _profile_vector(user.profile, resume_text)
+    if base_embedding is None:
+        return None
     
     # Get behavioral data (last 90 days)
     cutoff_date = timezone.now() - timedelta(days=90)
+    signals = []  # (job, weight)
     
     # Positive signals: Applied jobs (weight: 0.5 per job)
     applied_jobs = JobApplication.objects.filter(
         applicant=user,
         applied_at__gte=cutoff_date
     ).select_related('job')[:20]
-    
-    for app in applied_jobs:
-        job_text = _build_job_text(app.job)
-        if job_text:
-            job_emb = ranker.model.encode(job_text)
-            weighted_embeddings.append(job_emb * 0.5)  # Strong positive signal
+    signals.extend((app.job, 0.5) for app in applied_jobs)  # Strong positive signal
     
     # Negative signals: Rejected preferences (weight: -0.3)
     rejected_prefs = JobPreference.objects.filter(
@@ -418,12 +592,7 @@ def _build_user_embedding(user, resume_text):
         preference_type='rejected',
         created_at__gte=cutoff_date
     ).select_related('job')[:10]
-    
-    for pref in rejected_prefs:
-        job_text = _build_job_text(pref.job)
-        if job_text:
-            job_emb = ranker.model.encode(job_text)
-            weighted_embeddings.append(job_emb * -0.3)  # Negative signal
+    signals.extend((pref.job, -0.3) for pref in rejected_prefs)  # Negative signal
     
     # Engagement signals: Viewed jobs (weight based on time spent)
     viewed_jobs = JobView.objects.filter(
@@ -431,14 +600,8 @@ def _build_user_embedding(user, resume_text):
         viewed_at__gte=cutoff_date,
         time_spent_seconds__gte=10  # At least 10 seconds
     ).select_related('job').order_by('-time_spent_seconds')[:15]
-    
-    for view in viewed_jobs:
-        job_text = _build_job_text(view.job)
-        if job_text:
-            job_emb = ranker.model.encode(job_text)
-            # Weight by engagement: 0.1 to 0.4 based on time spent
-            engagement_weight = min(0.4, view.time_spent_seconds / 300)  # Max at 5 minutes
-            weighted_embeddings.append(job_emb * engagement_weight)
+    # Weight by engagement: 0.1 to 0.4 based on time spent (max at 5 minutes)
+    signals.extend((view.job, min(0.4, view.time_spent_seconds / 300)) for view in viewed_jobs)
     
     # Saved jobs (weight: 0.4)
     saved_prefs = JobPreference.objects.filter(
@@ -446,17 +609,21 @@ def _build_user_embedding(user, resume_text):
         preference_type='saved',
         created_at__gte=cutoff_date
     ).select_related('job')[:10]
+    signals.extend((pref.job, 0.4) for pref in saved_prefs)
     
-    for pref in saved_prefs:
-        job_text = _build_job_text(pref.job)
-        if job_text:
-            job_emb = ranker.model.encode(job_text)
-            weighted_embeddings.append(job_emb * 0.4)
-    
-    # Compute weighted average
-    if len(weighted_embeddings) == 1:
+    signals = [(job, weight, _build_job_text(job)) for job, weight in signals]
+    signals = [signal for signal in signals if signal[2]]
+    if not signals:
         return base_embedding  # No behavioral data, use base only
     
+    # One batched lookup for every job vector (cached per model version)
+    job_embs = _job_vectors([job for job, _, _ in signals], [text for _, _, text in signals])
+    if job_embs is None:
+        return base_embedding
+    
+    # Compute weighted average
+    weights = np.array([weight for _, weight, _ in signals], dtype=np.float32)
+    weighted_embeddings = np.vstack([base_embedding[np.newaxis, :], job_embs * weights[:, np.newaxis]])
     user_embedding = np.mean(weighted_embeddings, axis=0)
     return user_embedding
 
@@ -505,7 +672,38 @@ def _get_collaborative_boost(user, job, max_boost=10.0):
     return 0.0
 
 
-def get_job_recommendations(user_profile, jobs, use_personalization=True):
+def _recommendation(job, score, xai, personalized):
+    improvements = []
+    if xai["missing_skills"]:
+        improvements.extend(xai["missing_skills"][:3])
+    if job.experience_required and (xai["experience_years"] or 0) < job.experience_required:
+        improvements.append(f"Gain {job.experience_required - (xai['experience_years'] or 0)} more years experience")
+    
+    # Add upskilling recommendations from market data
+    if xai.get("market_insights") and xai["market_insights"].get("upskilling_recommendations"):
+        for rec in xai["market_insights"]["upskilling_recommendations"][:2]:
+            improvements.append(f"{rec['skill']} (AI upskilling)")
+
+    return {
+        "job": job,
+        "score": round(min(100, max(0, score))),
+        "reason": xai["explanation"],
+        "improvements": improvements,
+        "personalized": personalized,
+        "degraded": bool(xai.get("degraded")),
+    }
+
+
+def _seeker_vector(user_profile, resume_text, use_personalization):
+    user_embedding = None
+    if use_personalization:
+        user_embedding = _build_user_embedding(user_profile.user, resume_text)
+    if user_embedding is None:
+        user_embedding = _profile_vector(user_profile, resume_text)
+    return user_embedding
+
+
+def get_job_recommendations(user_profile, jobs, use_personalization=True, seeker_vector=None):
     """
     Netflix-style personalized job feed.
     
@@ -521,54 +719,55 @@ def get_job_recommendations(user_profile, jobs, use_personalization=True):
     - Time spent on job posts (engagement signal)
     - Saved jobs (interest signal)
     
+    ``jobs`` is expected to come from jobs.candidate_generation, which has
+    already removed applied, rejected, ignored and expired postings in SQL.
+    Scoring is a cascade: BM25/skill overlap shortlists RECOMMEND_CASCADE_N
+    jobs for the embedding model, and full XAI runs on the top
+    RECOMMEND_CASCADE_K only. Without the model, or when the encoder circuit
+    is open or misses ENCODE_DEADLINE, BM25 relevance stands in for
+    embedding similarity and results are marked degraded.
+    ``seeker_vector`` replaces _seeker_vector() for building the user
+    embedding (jobs.match_scores passes a cached one).
+    
     Returns ranked list of jobs personalized to the user.
     """
-    from jobs.models import JobApplication, JobPreference, JobView
-    
     recommendations = []
-    resume_text = _read_text_resume(user_profile.resume)
+    resume_text = _profile_resume_text(user_profile)
     ranker = get_ranker()
 
-    if not resume_text or not ranker or not hasattr(ranker, "model") or ranker.model is None:
+    if not resume_text:
         for job in jobs:
             recommendations.append({
                 "job": job,
                 "score": 0,
-                "reason": "Upload a PDF resume to enable AI matching.",
+                "reason": "Upload a PDF or DOCX resume to enable AI matching.",
                 "improvements": [],
             })
         return recommendations
 
-    # Build personalized user embedding (Netflix-style)
-    if use_personalization:
-        user_embedding = _build_user_embedding(user_profile.user, resume_text)
-        if user_embedding is None:
-            user_embedding = ranker.model.encode(resume_text)
-    else:
-        user_embedding = ranker.model.encode(resume_text)
+    model_ready = _model_ready(ranker)
+    fallback_reason = "AI model unavailable"
+    deadline = _encode_deadline()
+    user_embedding = None
+    if model_ready:
+        # Build personalized user embedding (Netflix-style)
+        try:
+            user_embedding = _guarded_encode(
+                deadline, seeker_vector or _seeker_vector, user_profile, resume_text, use_personalization
+            )
+        except Exception as exc:
+            model_ready = False
+            fallback_reason = _fallback_reason(exc)
+            logger.warning(f"Encoder unavailable for recommendations: {exc}")
+    if not model_ready:
+        logger.warning(f"{fallback_reason}; recommending by lexical relevance")
     
-    # Get jobs user already interacted with to filter out
-    applied_job_ids = set(
-        JobApplication.objects.filter(applicant=user_profile.user)
-        .values_list('job_id', flat=True)
-    )
-    rejected_job_ids = set(
-        JobPreference.objects.filter(user=user_profile.user, preference_type='rejected')
-        .values_list('job_id', flat=True)
-    )
-    ignored_job_ids = set(
-        JobPreference.objects.filter(user=user_profile.user, preference_type='ignored')
-        .values_list('job_id', flat=True)
-    )
-
     # Batch collect job texts for encoding
     job_list = list(jobs)
     job_texts = []
     job_valid_indices = []
     
     for i, job in enumerate(job_list):
-        if job.id in applied_job_ids or job.id in rejected_job_ids or job.id in ignored_job_ids:
-            continue
         text = _build_job_text(job)
         if text:
             job_texts.append(text)
@@ -577,177 +776,183 @@ def get_job_recommendations(user_profile, jobs, use_personalization=True):
     if not job_texts:
         return recommendations
 
-    # Batch encode all valid jobs
-    job_embs = []
-    if ranker and hasattr(ranker, "model") and ranker.model:
-        try:
-            job_embs = ranker.model.encode(job_texts, batch_size=32, show_progress_bar=False)
-        except Exception as e:
-            logger.error(f"Batch encoding failed: {e}")
-            job_embs = [None] * len(job_texts)
-    else:
-        job_embs = [None] * len(job_texts)
-
-    cosine_sim_func = get_sklearn()
-
-    for idx, job_emb in enumerate(job_embs):
-        job = job_list[job_valid_indices[idx]]
-        
-        if job_emb is not None and cosine_sim_func:
-            similarity = float(cosine_sim_func([user_embedding], [job_emb]).flatten()[0] * 100)
-        else:
-            similarity = 0.0
+    # One feature pass over the resume, reused for every job below
+    resume_features = extract_features(resume_text)
+    valid_jobs = [job_list[i] for i in job_valid_indices]
+    n, k = _cascade_sizes("RECOMMEND")
+    timings = {}
+
+    # Stage 1: lexical shortlist of the top N jobs (every job when the model is unavailable)
+    with timed("recommend.lexical", timings):
+        components = [_skill_and_experience(job, resume_features) for job in valid_jobs]
+        relevance = _job_relevance(resume_text, resume_features, valid_jobs, job_texts)
+        lexical = _lexical_stage(relevance, [c[3] for c in components])
+        shortlist = top_k(lexical, n if model_ready else None)
+
+    # Stage 2: embeddings (and collaborative boost) for the shortlist only
+    if model_ready:
+        with timed("recommend.embed", timings):
+            try:
+                job_embs = _guarded_encode(
+                    deadline, _job_vectors, [valid_jobs[i] for i in shortlist], [job_texts[i] for i in shortlist]
+                )
+                similarities = cosine_to_vector(job_embs, user_embedding) * 100
+            except Exception as exc:
+                model_ready = False
+                fallback_reason = _fallback_reason(exc)
+                logger.warning(f"Batch encoding failed, using lexical relevance: {exc}")
+    if not model_ready:
+        similarities = relevance[shortlist]
+
+    scored = []
+    for i, similarity in zip(shortlist, similarities):
+        job = valid_jobs[i]
+        similarity = float(similarity)
         
         # Apply collaborative filtering boost
         if use_personalization:
             collab_boost = _get_collaborative_boost(user_profile.user, job)
             similarity = min(100, similarity + collab_boost)
 
-        xai = _build_xai(job, resume_text, candidate_id=user_profile.user.id)
-        job_skills = _split_skills(job.skills_required)
-        skill_pct = 0.0
-        if job_skills:
-            skill_pct = (len(xai["matched_skills"]) / len(job_skills)) * 100
-
-        exp_score = 0.0
-        if job.experience_required and xai["experience_years"] is not None:
-            exp_score = min(100.0, (xai["experience_years"] / job.experience_required) * 100)
-
-        weights = {
-            "similarity": 0.6,
-            "skills": 0.3 if job_skills else 0.0,
-            "experience": 0.1 if exp_score else 0.0,
-        }
-        total_weight = sum(weights.values()) or 1.0
-        score = (
-            similarity * weights["similarity"]
-            + skill_pct * weights["skills"]
-            + exp_score * weights["experience"]
-        ) / total_weight
-
-        importance = _calculate_feature_importance(
-            [similarity, skill_pct, exp_score],
-            [weights["similarity"], weights["skills"], weights["experience"]],
-        )
-        if importance:
-            xai["explanation"] += (
-                "\n- Feature importance: similarity "
-                f"{importance[0]:.0f}%, skills {importance[1]:.0f}%, experience {importance[2]:.0f}%"
-            )
-
-        improvements = []
-        if xai["missing_skills"]:
-            improvements.extend(xai["missing_skills"][:3])
-        if job.experience_required and (xai["experience_years"] or 0) < job.experience_required:
-            improvements.append(f"Gain {job.experience_required - (xai['experience_years'] or 0)} more years experience")
-        
-        # Add upskilling recommendations from market data
-        if xai.get("market_insights") and xai["market_insights"].get("upskilling_recommendations"):
-            for rec in xai["market_insights"]["upskilling_recommendations"][:2]:
-                improvements.append(f"{rec['skill']} (AI upskilling)")
-
-        recommendations.append({
-            "job": job,
-            "score": round(min(100, max(0, score))),
-            "reason": xai["explanation"],
-            "improvements": improvements,
-            "personalized": use_personalization,
-        })
-
-        logger.info(f"PERSONALIZED AI: {job.title} for {user_profile.user.username}: {score:.1f}%")
+        job_skills, _, _, skill_pct, exp_score = components[i]
+        score, weights = _blend_score(similarity, skill_pct, exp_score, bool(job_skills), 0.6, 0.3)
+        scored.append((score, i, similarity, weights))
+    scored.sort(key=lambda item: item[0], reverse=True)
+
+    # Stage 3: full XAI (market insights) for the top K only
+    with timed("recommend.xai", timings):
+        for position, (score, i, similarity, weights) in enumerate(scored):
+            job = valid_jobs[i]
+            job_skills, matched, missing, skill_pct, exp_score = components[i]
+            if position < k:
+                xai = _build_xai(job, resume_text, candidate_id=user_profile.user.id, features=resume_features)
+            else:
+                xai = _build_light_xai(job_skills, matched, missing, resume_features.years, resume_features.education)
+            if not model_ready:
+                xai["degraded"] = True
+                xai["explanation"] += f"\n- Keyword relevance only ({fallback_reason})"
+            xai["explanation"] += _importance_note(similarity, skill_pct, exp_score, weights)
+            recommendations.append(_recommendation(job, score, xai, use_personalization))
+            logger.info(f"PERSONALIZED AI: {job.title} for {user_profile.user.username}: {score:.1f}%")
+
+    # Below the shortlist: lexical pre-screen only
+    floor = min((item[0] for item in scored), default=100.0)
+    shortlisted = set(int(i) for i in shortlist)
+    for i, job in enumerate(valid_jobs):
+        if i in shortlisted:
+            continue
+        job_skills, matched, missing, _, _ = components[i]
+        xai = _build_light_xai(job_skills, matched, missing, resume_features.years, resume_features.education)
+        recommendations.append(_recommendation(job, _prescreen_score(lexical[i], floor), xai, use_personalization))
 
+    logger.info(
+        f"Recommendation cascade for {user_profile.user.username}: "
+        f"{len(valid_jobs)} -> {len(shortlist)} -> {min(k, len(shortlist))} {timings}"
+    )
     recommendations.sort(key=lambda x: x["score"], reverse=True)
     return recommendations
 
 
-def _rank_applications_strict(job, applications):
-    """Fallback ranking based on profile skills and experience."""
-    job_skills = job.get_skills_list()
-    ranked = []
-
-    for application in applications:
-        try:
-            profile = application.applicant.profile
-        except Exception:
-            application.match_score = 0.0
-            application.ranking_notes = "No profile"
-            application.save()
-            ranked.append(application)
-            continue
-
-        user_skills = profile.get_skills_list()
-        score = 0.0
-        notes = []
-
-        skill_score = calculate_skill_match(user_skills, job_skills)
-        score += skill_score * 0.5
-        notes.append(f"Skills: {skill_score:.0f}%")
+def _rank_applications_strict(job, applications, degraded=None, transient=False):
+    """Fallback ranking based on profile skills and experience (see jobs.strict_ranker)."""
+    from .strict_ranker import rank_strict
+    return rank_strict(job, applications, degraded=degraded, transient=transient)
 
-        experience_gap = profile.experience_years - job.experience_required
 
-        if experience_gap >= 0:
-            exp_score = 100
-            notes.append(f"Exp: ✓ ({profile.experience_years}y)")
-        elif experience_gap >= -2:
-            exp_score = max(0, 50 + (experience_gap * 25))
-            notes.append(f"Exp: {profile.experience_years}y (need {job.experience_required}y)")
-        else:
-            exp_score = 0
-            notes.append(f"Exp: {abs(experience_gap)}y below")
+def _rank_budget_end(time_budget):
+    """Monotonic end of the ranking time budget (RANK_TIME_BUDGET seconds), or None for unlimited."""
+    if time_budget is None:
+        time_budget = getattr(settings, "RANK_TIME_BUDGET", 0.8)
+    return time.monotonic() + time_budget if time_budget and time_budget > 0 else None
 
-        score += exp_score * 0.35
 
-        if profile.education:
-            edu_score = 10
-            notes.append("Edu: ✓")
-        else:
-            edu_score = 0
-        score += edu_score
+def _persist_rankings(applications, pending_ids=(), transient=False):
+    """Set ranking_status and store the rankings (``transient``: on the instances only)."""
+    from .models import JobApplication
 
-        if application.resume or profile.resume:
-            score += 5
-            notes.append("Resume: ✓")
+    for application in applications:
+        application.ranking_status = "pending" if application.id in pending_ids else "scored"
+    if transient:
+        return
+    JobApplication.objects.bulk_update(
+        applications, ["match_score", "ranking_notes", "ranking_status"], batch_size=500
+    )
 
-        score = min(100, max(0, score))
-        application.match_score = round(score, 1)
-        application.ranking_notes = " | ".join(notes)
-        application.save()
 
-        ranked.append(application)
-        logger.info(
-            f"STRICT RANK: {application.applicant.get_full_name()} for {job.title}: {score:.1f}%"
-            f" (S:{skill_score:.0f}% E:{exp_score:.0f}%)"
-        )
+def rank_applications(job, applications, job_description=None, time_budget=None):
+    """
+    Rank job applications using the resume AI model.
+    Falls back to strict profile scoring if resume text or model is unavailable.
 
-    ranked.sort(key=lambda x: x.match_score, reverse=True)
-    return ranked
+    Resumes go through a cascade: BM25/skill overlap shortlists
+    RANK_CASCADE_N of them for the embedding model, and full XAI runs on the
+    top RANK_CASCADE_K only. The rest keep a lexical pre-screen score below
+    every shortlisted candidate. Without the model, BM25 relevance stands in
+    for embedding similarity on every resume and results are marked degraded.
+    When the encoder circuit is open or encoding misses ENCODE_DEADLINE, the
+    whole request is routed to the strict profile scorer instead.
+
+    Ranking is anytime: the shortlist is encoded in RANK_CHUNK_SIZE chunks in
+    pre-score order until ``time_budget`` seconds (default RANK_TIME_BUDGET;
+    0 = no limit) are spent. Shortlisted candidates not reached keep their
+    pre-screen score with ranking_status "pending", and a rank_job task is
+    queued for the worker to finish them.
+
+    Rankings against the job are stored on the applications (the ranking
+    view_applications shows). A ranking against an ad-hoc ``job_description``
+    is only returned: it must not replace the stored one, and rank_job cannot
+    finish it, so candidates it does not reach stay "pending" on the
+    returned instances only.
+
+    iter_rank_applications() is the same ranking as a generator, for
+    streaming responses.
+    """
+    for event, payload in iter_rank_applications(job, applications, job_description, time_budget):
+        if event == "done":
+            return payload
 
 
-def rank_applications(job, applications, job_description=None):
+def iter_rank_applications(job, applications, job_description=None, time_budget=None, progress_top=0):
     """
-    Rank job applications using the resume AI model.
-    Falls back to strict profile scoring if resume text or model is unavailable.
+    rank_applications() step by step. With ``progress_top``, yields
+    ("progress", {"scored", "total", "top"}) once the lexical shortlist is
+    built and after every encoded chunk: how many shortlisted resumes have
+    embedding scores so far, the shortlist size, and the provisional best
+    ``progress_top`` applications (match_score and a light xai_data, both
+    replaced by the final values). The last event is ("done", ranked).
     """
     applications = list(applications)
     if not applications:
-        return []
+        yield "done", []
+        return
 
+    adhoc = bool(job_description)
     job_text = _build_job_text(job, job_description)
-    ranker = get_ranker()
-    if not job_text or not ranker or not hasattr(ranker, "model") or ranker.model is None:
+    if not job_text:
         for application in applications:
             application.match_score = 0.0
-            application.ranking_notes = "AI model unavailable"
-            application.save()
-        return applications
+            application.ranking_notes = "No job description to rank against"
+        _persist_rankings(applications, transient=adhoc)
+        yield "done", applications
+        return
+    budget_end = _rank_budget_end(time_budget)
+    model_ready = _model_ready(get_ranker())
+    fallback_reason = "AI model unavailable"
+    # Encoding ends by ENCODE_DEADLINE or the end of a longer budget (streaming), and
+    # each call still fails fast after ENCODE_DEADLINE so a stalled encoder trips the breaker
+    encode_end = max(_encode_deadline(), budget_end) if budget_end else None
+    if not model_ready:
+        logger.warning(f"AI model unavailable; ranking {len(applications)} applications by lexical relevance")
 
     ai_apps = []
     resume_texts = []
     ranked = []
     sources = {}
+    prefetch_related_objects(applications, "resume_blob")
+    prefetched = _prefetch_resume_texts(applications)
 
     for application in applications:
-        resume_text, source = _build_resume_text(application)
+        resume_text, source = _build_resume_text(application, prefetched)
 
         if resume_text:
             ai_apps.append(application)
@@ -755,73 +960,179 @@ def rank_applications(job, applications, job_description=None):
             sources[application.id] = source
         else:
             application.match_score = 0.0
-            application.ranking_notes = "PDF resume required"
-            application.save()
+            application.ranking_notes = "PDF or DOCX resume required"
             ranked.append(application)
 
     if not ai_apps:
-        return ranked
+        _persist_rankings(ranked, transient=adhoc)
+        yield "done", ranked
+        return
+
+    vocabulary = skill_vocabulary()
+    features_list = [extract_features(text, vocabulary) for text in resume_texts]
+    n, k = _cascade_sizes("RANK")
+    chunk_size = max(1, getattr(settings, "RANK_CHUNK_SIZE", 32))
+    timings = {}
+
+    def within_budget():
+        return budget_end is None or time.monotonic() < budget_end
+
+    def deadline():
+        return None if encode_end is None else min(_encode_deadline(), encode_end)
+
+    def blend(i, similarity):
+        job_skills, _, _, skill_pct, exp_score = components[i]
+        return _blend_score(float(similarity), skill_pct, exp_score, bool(job_skills), 0.7, 0.2)
+
+    def progress(scores, scored):
+        """Progress event for provisional ``scores`` = {ai_apps index: score}."""
+        top = []
+        for i in heapq.nlargest(progress_top, scores, key=scores.get):
+            job_skills, matched, missing, _, _ = components[i]
+            application = ai_apps[i]
+            application.match_score = round(float(scores[i]), 1)
+            application.xai_data = _build_light_xai(
+                job_skills, matched, missing, features_list[i].years, features_list[i].education
+            )
+            top.append(application)
+        return "progress", {"scored": scored, "total": len(shortlist), "top": top}
 
     try:
-        job_emb = ranker.model.encode(job_text)
-        resume_embs = ranker.model.encode(resume_texts)
-        cosine_similarity = get_sklearn()
-        if not cosine_similarity:
-            raise Exception("Sklearn not available")
-        similarity_scores = cosine_similarity(resume_embs, [job_emb]).flatten() * 100
-
-        for application, similarity, resume_text in zip(ai_apps, similarity_scores, resume_texts):
-            xai = _build_xai(
-                job,
-                resume_text,
-                candidate_id=application.applicant.id,
-                job_description=job_description,
-            )
-            job_skills = _split_skills(job.skills_required)
-            skill_pct = 0.0
-            if job_skills:
-                skill_pct = (len(xai["matched_skills"]) / len(job_skills)) * 100
-
-            exp_score = 0.0
-            if job.experience_required and xai["experience_years"] is not None:
-                exp_score = min(100.0, (xai["experience_years"] / job.experience_required) * 100)
-
-            weights = {
-                "similarity": 0.7,
-                "skills": 0.2 if job_skills else 0.0,
-                "experience": 0.1 if exp_score else 0.0,
-            }
-            total_weight = sum(weights.values()) or 1.0
-            score = (
-                similarity * weights["similarity"]
-                + skill_pct * weights["skills"]
-                + exp_score * weights["experience"]
-            ) / total_weight
-
-            importance = _calculate_feature_importance(
-                [similarity, skill_pct, exp_score],
-                [weights["similarity"], weights["skills"], weights["experience"]],
-            )
-            if importance:
-                xai["explanation"] += (
-                    "\n- Feature importance: similarity "
-                    f"{importance[0]:.0f}%, skills {importance[1]:.0f}%, experience {importance[2]:.0f}%"
+        # Stage 1: lexical shortlist of the top N resumes (every resume when the model is unavailable)
+        with timed("rank.lexical", timings):
+            components = [_skill_and_experience(job, features) for features in features_list]
+            relevance = _resume_relevance(job_text, resume_texts, features_list)
+            lexical = _lexical_stage(relevance, [c[3] for c in components])
+            shortlist = top_k(lexical, n if model_ready else None)
+        if progress_top:
+            yield progress({int(i): lexical[i] for i in shortlist}, 0)
+
+        # Stage 2: embeddings for the shortlist, best pre-scores first, chunk by chunk
+        # until the time budget runs out; every call goes through the encoder breaker
+        if model_ready:
+            similarity_scores = []
+            try:
+                with timed("rank.embed", timings):
+                    if job_description:
+                        job_emb = _guarded_encode(deadline(), _encode_query, job_text)
+                    else:
+                        job_emb = _guarded_encode(deadline(), _job_vectors, [job], [job_text])[0]
+                    for start in range(0, len(shortlist), chunk_size):
+                        if start and not within_budget():
+                            break
+                        batch = shortlist[start:start + chunk_size]
+                        resume_embs = _guarded_encode(
+                            deadline(), _encode_resumes, [ai_apps[i] for i in batch], [resume_texts[i] for i in batch]
+                        )
+                        similarity_scores.extend(cosine_to_vector(resume_embs, job_emb) * 100)
+                        if progress_top:
+                            scores = {int(i): blend(i, sim)[0] for i, sim in zip(shortlist, similarity_scores)}
+                            yield progress(scores, len(similarity_scores))
+            except Exception as exc:
+                fallback_reason = _fallback_reason(exc)
+                if similarity_scores:
+                    logger.warning(f"Encoder stopped after {len(similarity_scores)} resumes ({exc}); rest pending")
+                else:
+                    logger.warning(f"Encoder unavailable for ranking ({exc}); {fallback_reason}")
+                    if job is not None:
+                        yield "done", _rank_applications_strict(
+                            job, applications, degraded=fallback_reason, transient=adhoc
+                        )
+                        return
+                    model_ready = False
+                    similarity_scores = relevance[shortlist]
+        else:
+            similarity_scores = relevance[shortlist]
+        pending = shortlist[len(similarity_scores):]
+
+        scored = []
+        for i, similarity in zip(shortlist, similarity_scores):
+            score, weights = blend(i, similarity)
+            scored.append((score, i, float(similarity), weights))
+        scored.sort(key=lambda item: item[0], reverse=True)
+
+        # Stage 3: full XAI (market insights) for the top K only, while the budget lasts
+        with timed("rank.xai", timings):
+            for position, (score, i, similarity, weights) in enumerate(scored):
+                application = ai_apps[i]
+                job_skills, matched, missing, skill_pct, exp_score = components[i]
+                if position < k and (position == 0 or within_budget()):
+                    xai = _build_xai(
+                        job,
+                        resume_texts[i],
+                        candidate_id=application.applicant_id,
+                        job_description=job_description,
+                        features=features_list[i],
+                    )
+                else:
+                    xai = _build_light_xai(
+                        job_skills, matched, missing, features_list[i].years, features_list[i].education
+                    )
+                if not model_ready:
+                    xai["degraded"] = True
+                    xai["explanation"] += f"\n- Keyword relevance only ({fallback_reason})"
+                xai["explanation"] += _importance_note(similarity, skill_pct, exp_score, weights)
+
+                application.match_score = round(float(score), 1)
+                application.ranking_notes = xai["explanation"]
+                application.xai_data = xai
+                ranked.append(application)
+
+        # Not reached (pending) or below the shortlist: lexical pre-screen only
+        floor = min((item[0] for item in scored), default=100.0)
+        pending = set(int(i) for i in pending)
+        shortlisted = set(int(i) for i in shortlist)
+        for i, application in enumerate(ai_apps):
+            if i in shortlisted and i not in pending:
+                continue
+            job_skills, matched, missing, _, _ = components[i]
+            application.match_score = _prescreen_score(lexical[i], floor)
+            if i in pending and adhoc:
+                application.ranking_notes = f"Lexical pre-screen {lexical[i]:.0f}% (not reached within the time budget)"
+            elif i in pending:
+                application.ranking_notes = f"Lexical pre-screen {lexical[i]:.0f}% (AI scoring pending)"
+            else:
+                application.ranking_notes = (
+                    f"Lexical pre-screen {lexical[i]:.0f}% (outside the top {n} sent to AI scoring)"
                 )
-
-            application.match_score = round(float(score), 1)
-            application.ranking_notes = xai["explanation"]
-            application.xai_data = xai
-            application.save()
+            application.xai_data = _build_light_xai(
+                job_skills, matched, missing, features_list[i].years, features_list[i].education
+            )
             ranked.append(application)
 
-        logger.info(f"AI resume ranking complete for {len(ai_apps)} candidates")
+        _persist_rankings(ranked, {ai_apps[i].id for i in pending}, transient=adhoc)
+        # rank_job re-scores against the job's own text, so it cannot finish an ad-hoc description
+        if pending and job is not None and job.pk and not adhoc:
+            from .tasks import queue_job_ranking
+            queue_job_ranking(job.pk)
+        logger.info(
+            f"{'AI' if model_ready else 'Lexical'} resume ranking complete for {len(ai_apps)} candidates: "
+            f"{len(ai_apps)} -> {len(shortlist)} -> {min(k, len(scored))}, {len(pending)} pending {timings}"
+        )
     except Exception as exc:
         logger.error(f"AI resume ranking failed: {exc}")
         for application in ai_apps:
             application.match_score = 0.0
             application.ranking_notes = "AI ranking failed"
-            application.save()
-        return applications
+        _persist_rankings(applications, transient=adhoc)
+        yield "done", applications
+        return
 
     ranked.sort(key=lambda x: x.match_score, reverse=True)
-    return ranked
+    yield "done", ranked
+
+
+def score_application(application):
+    """
+    Incremental path for one new application: score it alone against the
+    job's stored vector and persist it, leaving the rest of the pool as is.
+    AI scores (cosine, skills, experience) do not depend on the other
+    applicants, so the new row slots straight into the stored order. BM25
+    relevance is relative to the pool, so without the model the whole job
+    is re-ranked in the background instead.
+    """
+    if not _model_ready(get_ranker()):
+        from .tasks import queue_job_ranking
+        queue_job_ranking(application.job_id)
+        return application
+    return rank_applications(application.job, [application], time_budget=0)[0]
@@ -0,0 +1,69 @@
+"""
+Candidate generation for seeker recommendations.
+
+Hard constraints (open for applications, not already applied to, not
+rejected/ignored, job type, location, experience range) are pushed into a
+single indexed SQL query, so the embedding and scoring stages only see a
+short list of plausible jobs.
+"""
+from django.conf import settings
+from django.db.models import Exists, OuterRef, Q
+from django.db.models.functions import Lower
+
+
+def seeker_experience(user_profile):
+    """Best known experience: the profile value or what the skill index read from resumes."""
+    from jobs.models import CandidateSkillEntry
+
+    years = user_profile.experience_years or 0
+    indexed = CandidateSkillEntry.objects.filter(user_id=user_profile.user_id).values_list(
+        "experience_years", flat=True
+    ).first()
+    return max(years, indexed or 0)
+
+
+def candidate_jobs(user, jobs, job_type=None, location=None, max_experience=None, limit=None):
+    """
+    Narrow ``jobs`` (a Job queryset) for ``user`` in one query.
+
+    - always: active, deadline not passed, no application or rejected/ignored preference
+    - ``job_type``: exact job type
+    - ``location``: jobs in that location (case-insensitive), plus remote and unspecified ones
+    - ``max_experience``: jobs requiring at most that many years
+    - ``limit``: newest N survivors
+    """
+    from jobs.models import JobApplication, JobPreference
+
+    jobs = jobs.open().filter(
+        ~Exists(JobApplication.objects.filter(job=OuterRef("pk"), applicant=user)),
+        ~Exists(JobPreference.objects.filter(
+            job=OuterRef("pk"), user=user, preference_type__in=("rejected", "ignored")
+        )),
+    )
+
+    if job_type:
+        jobs = jobs.filter(job_type=job_type)
+    if location:
+        jobs = jobs.annotate(location_lower=Lower("location")).filter(
+            Q(location_lower=location.strip().lower()) | Q(location="") | Q(job_type="remote")
+        )
+    if max_experience is not None:
+        jobs = jobs.filter(experience_required__lte=max_experience)
+
+    jobs = jobs.order_by("-created_at")
+    if limit:
+        jobs = jobs[:limit]
+    return jobs
+
+
+def recommendation_candidates(user_profile, jobs, job_type=None, location=None):
+    """The dashboard/feed candidate stage: experience window and size cap from settings."""
+    slack = getattr(settings, "RECOMMEND_EXPERIENCE_SLACK", 2)
+    return candidate_jobs(
+        user_profile.user,
+        jobs,
+        job_type=job_type,
+        location=location,
+        max_experience=seeker_experience(user_profile) + slack,
+        limit=getattr(settings, "RECOMMEND_CANDIDATE_LIMIT", 200),
+    )
@@ -0,0 +1,188 @@
+"""
+Circuit breaker and deadline for encoder calls.
+
+The breaker keeps a rolling window of recent calls (outcome and latency).
+It opens when too many of them failed or were slow, fails fast while open,
+and after a cooldown lets a single trial call through (half-open) to
+decide whether to close again. Calls also run against a per-request
+deadline: a call that overruns it is abandoned (its thread finishes in the
+background), counted as a failure, and the caller falls back immediately
+instead of holding the request until the gunicorn timeout.
+"""
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+logger = logging.getLogger('jobs')
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class BreakerError(RuntimeError):
+    """The protected call was not (or not fully) carried out."""
+
+
+class CircuitOpenError(BreakerError):
+    pass
+
+
+class DeadlineExceeded(BreakerError):
+    pass
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name,
+        window=20,
+        min_calls=5,
+        failure_ratio=0.5,
+        slow_ms=2000,
+        slow_ratio=0.5,
+        cooldown=30,
+        max_workers=2,
+    ):
+        self.name = name
+        self.min_calls = min_calls
+        self.failure_ratio = failure_ratio
+        self.slow_ms = slow_ms
+        self.slow_ratio = slow_ratio
+        self.cooldown = cooldown
+        self._calls = deque(maxlen=window)  # (ok, elapsed_ms)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._trial_running = False
+        self._lock = threading.Lock()
+        self._max_workers = max_workers
+        self._executor = None
+
+    @property
+    def state(self):
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.cooldown:
+                return HALF_OPEN
+            return self._state
+
+    def stats(self):
+        with self._lock:
+            calls = list(self._calls)
+        failures = sum(1 for ok, _ in calls if not ok)
+        slow = sum(1 for ok, elapsed in calls if ok and elapsed >= self.slow_ms)
+        return {"state": self.state, "calls": len(calls), "failures": failures, "slow": slow}
+
+    def _allow(self):
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN and time.monotonic() - self._opened_at < self.cooldown:
+                return False
+            # Cooldown over: exactly one trial call decides whether to close
+            if self._trial_running:
+                return False
+            self._state = HALF_OPEN
+            self._trial_running = True
+            return True
+
+    def _record(self, ok, elapsed_ms):
+        with self._lock:
+            self._calls.append((ok, elapsed_ms))
+            if self._state == HALF_OPEN:
+                self._trial_running = False
+                if ok and elapsed_ms < self.slow_ms:
+                    self._state = CLOSED
+                    self._calls.clear()
+                    logger.info(f"Circuit '{self.name}' closed after a successful trial call")
+                else:
+                    self._trip()
+                return
+
+            if len(self._calls) < self.min_calls:
+                return
+            failures = sum(1 for ok_, _ in self._calls if not ok_)
+            slow = sum(1 for ok_, elapsed in self._calls if ok_ and elapsed >= self.slow_ms)
+            if failures / len(self._calls) >= self.failure_ratio or slow / len(self._calls) >= self.slow_ratio:
+                self._trip()
+
+    def _trip(self):
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        logger.warning(f"Circuit '{self.name}' opened for {self.cooldown}s")
+
+    def _pool(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix=f"breaker-{self.name}"
+                )
+            return self._executor
+
+    def call(self, fn, *args, timeout=None, **kwargs):
+        """
+        Run ``fn`` under the breaker. Raises CircuitOpenError without calling
+        it while open and DeadlineExceeded when it runs past ``timeout``
+        seconds; exceptions from ``fn`` are re-raised. Overruns and
+        exceptions both count as failures.
+        """
+        if not self._allow():
+            raise CircuitOpenError(f"circuit '{self.name}' is open")
+
+        start = time.perf_counter()
+        try:
+            if timeout is None:
+                result = fn(*args, **kwargs)
+            else:
+                if timeout <= 0:
+                    raise DeadlineExceeded(f"no time left for '{self.name}'")
+                future = self._pool().submit(_run_in_worker, fn, args, kwargs)
+                try:
+                    result = future.result(timeout=timeout)
+                except FutureTimeout:
+                    future.cancel()
+                    raise DeadlineExceeded(f"'{self.name}' exceeded its {timeout:.1f}s deadline")
+        except Exception:
+            self._record(False, (time.perf_counter() - start) * 1000)
+            raise
+        self._record(True, (time.perf_counter() - start) * 1000)
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._calls.clear()
+            self._state = CLOSED
+            self._trial_running = False
+
+
+def _run_in_worker(fn, args, kwargs):
+    from django.db import connections
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        # Worker threads must not keep their own database connections open
+        connections.close_all()
+
+
+_encoder_breaker = None
+_encoder_breaker_lock = threading.Lock()
+
+
+def encoder_breaker():
+    """Process-wide breaker around sentence-transformer encoding (configured from settings)."""
+    global _encoder_breaker
+    if _encoder_breaker is None:
+        with _encoder_breaker_lock:
+            if _encoder_breaker is None:
+                from django.conf import settings
+                _encoder_breaker = CircuitBreaker(
+                    "encoder",
+                    window=getattr(settings, "ENCODER_BREAKER_WINDOW", 20),
+                    min_calls=getattr(settings, "ENCODER_BREAKER_MIN_CALLS", 5),
+                    failure_ratio=getattr(settings, "ENCODER_BREAKER_FAILURE_RATIO", 0.5),
+                    slow_ms=getattr(settings, "ENCODER_BREAKER_SLOW_MS", 2000),
+                    slow_ratio=getattr(settings, "ENCODER_BREAKER_SLOW_RATIO", 0.5),
+                    cooldown=getattr(settings, "ENCODER_BREAKER_COOLDOWN", 30),
+                )
+    return _encoder_breaker
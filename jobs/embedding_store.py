@@ -0,0 +1,281 @@
+"""
+Versioned embedding store.
+
+Every persisted vector is tagged with the EmbeddingModel version that
+produced it, and lookups only ever read vectors of the serving version, so
+swapping the encoder can never mix incompatible embeddings. New versions are
+filled in the background by ``manage.py reembed`` and become serving
+atomically once coverage is complete (see activate_version).
+"""
+import hashlib
+import logging
+import os
+import time
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .ai_lazy_loader import get_ranker
+
+logger = logging.getLogger('jobs')
+
+DEFAULT_MODEL_ID = "resume_ranking_model"
+
+_serving = None
+_serving_checked_at = 0.0
+_encoders = {}
+
+
+def default_model_path():
+    return os.path.join(settings.MEDIA_ROOT, "models", DEFAULT_MODEL_ID)
+
+
+def fingerprint_model_dir(path):
+    """Cheap version id for a model directory: hash of file names and sizes."""
+    digest = hashlib.sha1()
+    for root, _, files in sorted(os.walk(path)):
+        for name in sorted(files):
+            full = os.path.join(root, name)
+            digest.update(os.path.relpath(full, path).encode("utf-8"))
+            digest.update(str(os.path.getsize(full)).encode("utf-8"))
+    return digest.hexdigest()[:12]
+
+
+def text_hash(text):
+    return hashlib.sha1((text or "").encode("utf-8")).hexdigest()
+
+
+def serving_version():
+    """
+    The EmbeddingModel currently serving, re-read from the database every
+    EMBEDDING_VERSION_TTL seconds so a flip reaches every worker. The
+    bundled model is registered as serving on first use. Each refresh also
+    re-fingerprints the serving model's files (see _check_model_files).
+    """
+    global _serving, _serving_checked_at
+    from jobs.models import EmbeddingModel
+
+    ttl = getattr(settings, "EMBEDDING_VERSION_TTL", 30)
+    now = time.monotonic()
+    if _serving is not None and now - _serving_checked_at < ttl:
+        return _serving
+
+    version = EmbeddingModel.objects.filter(status='serving').first()
+    if version is None:
+        path = default_model_path()
+        fingerprint = fingerprint_model_dir(path) if os.path.isdir(path) else ""
+        version, _ = EmbeddingModel.objects.get_or_create(
+            model_id=DEFAULT_MODEL_ID,
+            version=fingerprint or "unversioned",
+            defaults={"path": path, "fingerprint": fingerprint, "status": "serving", "activated_at": timezone.now()},
+        )
+    else:
+        version = _check_model_files(version)
+
+    if _serving is not None and _serving.pk != version.pk:
+        logger.info(f"Embedding model flipped: {_serving} -> {version}")
+    _serving = version
+    _serving_checked_at = now
+    return version
+
+
+def _check_model_files(version):
+    """
+    The serving version, unless its model files were replaced in place: then
+    its stored vectors no longer match what the encoder produces, so the new
+    files are registered (and served) as a version of their own, whose
+    vectors are filled in as they are needed.
+    """
+    from jobs.models import EmbeddingModel
+
+    if not os.path.isdir(version.path):
+        return version
+    current = fingerprint_model_dir(version.path)
+    if not version.fingerprint:
+        # Registered before fingerprints were recorded: adopt the files as they are now
+        version.fingerprint = current
+        version.save(update_fields=["fingerprint"])
+        return version
+    if current == version.fingerprint:
+        return version
+
+    logger.error(
+        f"Model files under {version.path} changed while {version} was serving; "
+        f"serving them as version {current} instead"
+    )
+    replacement, _ = EmbeddingModel.objects.get_or_create(
+        model_id=version.model_id, version=current, defaults={"path": version.path, "fingerprint": current},
+    )
+    return activate_version(replacement, force=True)
+
+
+def get_encoder(version):
+    """
+    SentenceTransformer for a version; reuses the ranker's model when it was
+    loaded from the same files (same path and, where recorded, fingerprint).
+    """
+    if version.pk in _encoders:
+        return _encoders[version.pk]
+
+    ranker = get_ranker()
+    model = None
+    if ranker is not None and getattr(ranker, "model", None) is not None:
+        same_path = os.path.realpath(ranker.model_path) == os.path.realpath(version.path)
+        loaded_from = getattr(ranker, "model_fingerprint", None)
+        if same_path and (not version.fingerprint or loaded_from == version.fingerprint):
+            model = ranker.model
+    if model is None:
+        try:
+            from sentence_transformers import SentenceTransformer
+            model = SentenceTransformer(version.path)
+        except Exception as exc:
+            logger.error(f"Failed to load encoder {version}: {exc}")
+            return None
+
+    # Keep only the serving encoder resident
+    _encoders.clear()
+    _encoders[version.pk] = model
+    return model
+
+
+def _to_bytes(vector):
+    return np.asarray(vector, dtype=np.float32).tobytes()
+
+
+def _from_bytes(raw):
+    return np.frombuffer(bytes(raw), dtype=np.float32)
+
+
+def get_vectors(kind, items, version=None, transient=()):
+    """
+    Return an (n, d) float32 array for ``items`` = [(object_key, text), ...].
+    Stored vectors whose text hash still matches are reused; the rest are
+    encoded with the serving model in one batch and persisted, except keys
+    in ``transient``. Returns None when no encoder is available.
+    """
+    from jobs.models import StoredEmbedding
+
+    if not items:
+        return np.zeros((0, 0), dtype=np.float32)
+
+    version = version or serving_version()
+    keys = [str(key) for key, _ in items]
+    hashes = [text_hash(text) for _, text in items]
+
+    stored = {
+        row.object_key: row
+        for row in StoredEmbedding.objects.filter(model_version=version, kind=kind, object_key__in=set(keys))
+    }
+
+    vectors = [None] * len(items)
+    missing = {}
+    for index, (key, digest) in enumerate(zip(keys, hashes)):
+        row = stored.get(key)
+        if row is not None and row.text_hash == digest:
+            vectors[index] = _from_bytes(row.vector)
+        else:
+            missing.setdefault((key, digest), []).append(index)
+
+    transient = {str(key) for key in transient}
+    if missing:
+        encoder = get_encoder(version)
+        if encoder is None:
+            return None
+        pending = list(missing)
+        texts = [items[missing[entry][0]][1] for entry in pending]
+        encoded = np.asarray(encoder.encode(texts, batch_size=32, show_progress_bar=False), dtype=np.float32)
+
+        new_rows, stale_rows = [], []
+        for (key, digest), vector in zip(pending, encoded):
+            for index in missing[(key, digest)]:
+                vectors[index] = vector
+            if key in transient:
+                continue
+            row = stored.get(key)
+            if row is not None:
+                row.text_hash = digest
+                row.vector = _to_bytes(vector)
+                stale_rows.append(row)
+            else:
+                new_rows.append(StoredEmbedding(
+                    model_version=version, kind=kind, object_key=key,
+                    text_hash=digest, vector=_to_bytes(vector),
+                ))
+        if stale_rows:
+            StoredEmbedding.objects.bulk_update(stale_rows, ["text_hash", "vector"])
+        if new_rows:
+            StoredEmbedding.objects.bulk_create(new_rows, ignore_conflicts=True)
+
+    return np.vstack(vectors)
+
+
+def get_vector(kind, key, text):
+    vectors = get_vectors(kind, [(key, text)])
+    return None if vectors is None else vectors[0]
+
+
+def store_vectors(version, kind, keyed_vectors):
+    """Persist [(object_key, text_hash, vector)] for a (possibly non-serving) version."""
+    from jobs.models import StoredEmbedding
+
+    rows = [
+        StoredEmbedding(model_version=version, kind=kind, object_key=str(key), text_hash=digest, vector=_to_bytes(vector))
+        for key, digest, vector in keyed_vectors
+    ]
+    StoredEmbedding.objects.bulk_create(
+        rows, update_conflicts=True,
+        unique_fields=["model_version", "kind", "object_key"],
+        update_fields=["text_hash", "vector"],
+    )
+
+
+def coverage(version):
+    """
+    {kind: (embedded, expected)} for every kind a serving version must cover.
+    Only vectors for keys that are currently expected count, so rows for
+    closed jobs or removed resumes never make up for missing ones.
+    """
+    from jobs.models import Job, ResumeBlob, StoredEmbedding
+
+    expected = {
+        "job": {str(pk) for pk in Job.objects.open().values_list("id", flat=True)},
+        "resume": set(ResumeBlob.objects.exclude(text="").values_list("sha256", flat=True)),
+        "talent": {str(index) for index in range(len(_talent_corpus() or []))},
+    }
+    result = {}
+    for kind, keys in expected.items():
+        stored = set(StoredEmbedding.objects.filter(model_version=version, kind=kind).values_list("object_key", flat=True))
+        result[kind] = (len(keys & stored), len(keys))
+    return result
+
+
+def is_complete(version):
+    return all(done >= total for done, total in coverage(version).values())
+
+
+def activate_version(version, force=False):
+    """Atomically make ``version`` the serving model once it covers everything."""
+    from jobs.models import EmbeddingModel
+
+    global _serving
+    if not force and not is_complete(version):
+        raise ValueError(f"{version} is missing embeddings: {coverage(version)}")
+
+    with transaction.atomic():
+        EmbeddingModel.objects.select_for_update().filter(status='serving').exclude(pk=version.pk).update(status='retired')
+        version.status = 'serving'
+        version.activated_at = timezone.now()
+        version.save(update_fields=["status", "activated_at"])
+    _serving = None
+    return version
+
+
+def _talent_corpus():
+    """Resume texts of the ranker's bundled talent corpus, in row order."""
+    ranker = get_ranker()
+    df = getattr(ranker, "df", None) if ranker is not None else None
+    if df is None or "full_resume_text" not in df.columns:
+        return None
+    return [str(text or "") for text in df["full_resume_text"].tolist()]
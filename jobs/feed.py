@@ -0,0 +1,142 @@
+"""
+Materialized recommendation feeds.
+
+Each job seeker's top FEED_SIZE recommendations (job, score, explanation)
+are stored as FeedItem rows, so the dashboard and job browser read them
+with one indexed query instead of running get_job_recommendations() per
+hit. The background worker recomputes a feed when one of its inputs
+changes: the seeker's profile or resume, their behaviour (applications,
+engaged views, saved/rejected jobs), or a posting relevant to them (a new
+or edited job that shares a skill with them or is already in their feed).
+Reads skip jobs that closed, or that the seeker applied to or dismissed,
+since the feed was computed.
+"""
+import logging
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+logger = logging.getLogger('jobs')
+
+
+def _as_recommendation(item):
+    return {
+        "job": item.job,
+        "score": item.score,
+        "reason": item.reason,
+        "improvements": item.improvements,
+        "personalized": item.personalized,
+        "degraded": item.degraded,
+    }
+
+
+def refresh_feed(user_profile):
+    """Recompute and store ``user_profile``'s feed; returns the RecommendationFeed."""
+    from .ai_service import get_job_recommendations
+    from .candidate_generation import recommendation_candidates
+    from .models import FeedItem, Job, RecommendationFeed
+
+    started_at = timezone.now()
+    size = getattr(settings, "FEED_SIZE", 50)
+    recommendations = get_job_recommendations(
+        user_profile, recommendation_candidates(user_profile, Job.objects.all())
+    )[:size]
+
+    with transaction.atomic():
+        feed, _ = RecommendationFeed.objects.select_for_update().get_or_create(user_id=user_profile.user_id)
+        feed.items.all().delete()
+        FeedItem.objects.bulk_create([
+            FeedItem(
+                feed=feed,
+                job=rec["job"],
+                position=position,
+                score=rec["score"],
+                reason=rec["reason"],
+                improvements=rec.get("improvements", []),
+                personalized=rec.get("personalized", True),
+                degraded=rec.get("degraded", False),
+            )
+            for position, rec in enumerate(recommendations)
+        ])
+        feed.computed_at = started_at
+        # An input that changed while this ran keeps the feed stale for the refresh it queued
+        if feed.stale_since is not None and feed.stale_since <= started_at:
+            feed.stale_since = None
+        feed.save(update_fields=["computed_at", "stale_since"])
+
+    logger.info(f"Feed refreshed for {user_profile.user.username}: {len(recommendations)} jobs")
+    return feed
+
+
+def feed_items(user, jobs=None):
+    """
+    ``user``'s stored feed items, best first, limited to jobs that are still
+    candidates for them; ``jobs`` (a candidate_jobs() queryset) narrows it
+    further. One query, with job and feed joined in.
+    """
+    from .candidate_generation import candidate_jobs
+    from .models import FeedItem, Job
+
+    if jobs is None:
+        jobs = candidate_jobs(user, Job.objects.all())
+    return (
+        FeedItem.objects.filter(feed__user=user, job__in=jobs.values("pk"))
+        .select_related("job", "feed")
+        .order_by("position")
+    )
+
+
+def get_feed(user_profile, limit=None, jobs=None):
+    """
+    (recommendations, feed) from the materialized feed. A seeker without a
+    feed yet gets it computed now; afterwards it is only refreshed in the
+    background. ``feed.computed_at`` tells how fresh the scores are.
+    """
+    from .models import RecommendationFeed
+
+    items = feed_items(user_profile.user, jobs)
+    rows = list(items[:limit] if limit else items)
+    if rows:
+        return [_as_recommendation(item) for item in rows], rows[0].feed
+
+    feed = RecommendationFeed.objects.filter(user_id=user_profile.user_id).first()
+    if feed is None or feed.computed_at is None:
+        feed = refresh_feed(user_profile)
+        items = items.all()  # re-query; the first evaluation is cached
+        rows = list(items[:limit] if limit else items)
+    return [_as_recommendation(item) for item in rows], feed
+
+
+def mark_stale(user_ids):
+    """Flag existing feeds as out of date (the refresh itself is queued separately)."""
+    from .models import RecommendationFeed
+
+    return RecommendationFeed.objects.filter(user_id__in=user_ids, stale_since__isnull=True).update(
+        stale_since=timezone.now()
+    )
+
+
+def seekers_for_job(job):
+    """
+    Seekers whose feed a new or edited posting may enter or leave: those it
+    is already in, plus those sharing one of its skills (via the skill
+    index). Only existing feeds are maintained; others are built on first visit.
+    """
+    from .models import FeedItem, RecommendationFeed
+    from .skill_index import SkillQueryError, has_bit, match_bits
+
+    user_ids = set(FeedItem.objects.filter(job=job).values_list("feed__user_id", flat=True))
+    skills = [skill.strip().replace('"', "") for skill in (job.skills_required or "").split(",")]
+    skills = [skill for skill in skills if skill]
+    bits = 0
+    if skills:
+        try:
+            bits = match_bits(" | ".join(f'"{skill}"' for skill in skills)) or 0
+        except SkillQueryError as exc:
+            logger.warning(f"Could not match seekers for job {job.pk}: {exc}")
+    # Tested against the existing feeds rather than sending every match as an IN list
+    return {
+        user_id for user_id in RecommendationFeed.objects.values_list("user_id", flat=True)
+        if user_id in user_ids or has_bit(bits, user_id)
+    }
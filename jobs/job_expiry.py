@@ -0,0 +1,42 @@
+"""
+Expiry of job postings past their deadline.
+
+Seeker queries already exclude expired postings through Job.objects.open();
+the sweep keeps the active set small by flipping ``is_active`` in one UPDATE
+and evicting the jobs' stored embeddings, so nothing downstream keeps
+encoding, scoring or caching them. Closed jobs still appear in seekers'
+behavioural history; their vectors are encoded on demand there but never
+stored again (see ai_service._job_vectors).
+"""
+import logging
+
+from django.core.cache import cache
+from django.db import transaction
+
+from .lexical import job_index
+from .resume_features import SKILL_VOCAB_CACHE_KEY
+
+logger = logging.getLogger('jobs')
+
+
+def expire_jobs(dry_run=False):
+    """Deactivate every active job whose deadline has passed; returns their ids."""
+    from jobs.models import Job, StoredEmbedding
+
+    with transaction.atomic():
+        expired_ids = list(Job.objects.expired().select_for_update().values_list("id", flat=True))
+        if dry_run or not expired_ids:
+            return expired_ids
+
+        Job.objects.filter(id__in=expired_ids).update(is_active=False)
+        evicted, _ = StoredEmbedding.objects.filter(
+            kind="job", object_key__in=[str(job_id) for job_id in expired_ids]
+        ).delete()
+
+    # Expired jobs' skills and terms should no longer count towards the vocabulary or BM25 statistics
+    cache.delete(SKILL_VOCAB_CACHE_KEY)
+    index = job_index()
+    for job_id in expired_ids:
+        index.remove(job_id)
+    logger.info(f"Expired {len(expired_ids)} jobs past deadline; evicted {evicted} stored embeddings")
+    return expired_ids
@@ -0,0 +1,166 @@
+"""
+Cheap lexical relevance (BM25) for ranking cascades and degraded mode.
+
+Documents (job postings, resumes) live in process-wide LexicalIndex
+instances as sparse term-frequency vectors with inverted postings, updated
+incrementally as documents are added, changed or removed. Scoring a query
+touches only the postings of its terms, so it is the first stage of the
+ranking cascades and the whole scorer when the transformer is unavailable,
+at a fraction of its CPU and memory.
+"""
+import math
+import re
+import threading
+from collections import Counter, OrderedDict
+
+import numpy as np
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+
+STOPWORDS = frozenset("""
+    a an and are as at be by for from has have in is it its of on or that the to was were will with
+    you your our we they this these those their there which who whom what when where why how all any
+    can could should would may might must shall not no nor but if then than so such into over under
+    about above after before between during through per via etc also more most other some very
+""".split())
+
+K1 = 1.5
+B = 0.75
+RESUME_INDEX_SIZE = 5000
+
+
+def tokenize(text):
+    """Lowercased word tokens (keeps c++, c#, node.js), minus stopwords and one-letter noise."""
+    if not text:
+        return []
+    return [
+        token for token in _TOKEN_RE.findall(str(text).lower())
+        if token not in STOPWORDS and (len(token) > 1 or token in ("c", "r"))
+    ]
+
+
+class LexicalIndex:
+    """
+    Incrementally maintained BM25 index.
+
+    Each document is stored once as a sparse vector ({term: count}) together
+    with a version tag; add() with an unchanged version is a no-op, so callers
+    can simply re-add what they are about to score. With ``max_docs`` the
+    least recently added documents are evicted.
+    """
+
+    def __init__(self, max_docs=None, k1=K1, b=B):
+        self.max_docs = max_docs
+        self.k1 = k1
+        self.b = b
+        self._docs = OrderedDict()  # key -> (version, {term: count}, length)
+        self._postings = {}  # term -> {key: count}
+        self._total_length = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._docs)
+
+    def __contains__(self, key):
+        return key in self._docs
+
+    def keys(self):
+        with self._lock:
+            return list(self._docs)
+
+    def add(self, key, text, version=None):
+        """Index (or re-index) ``text`` under ``key``; skipped when ``version`` is unchanged."""
+        current = self._docs.get(key)
+        if current is not None and version is not None and current[0] == version:
+            return
+        vector = Counter(tokenize(text))
+        with self._lock:
+            self._remove(key)
+            length = sum(vector.values())
+            self._docs[key] = (version, vector, length)
+            self._total_length += length
+            for term, count in vector.items():
+                self._postings.setdefault(term, {})[key] = count
+            while self.max_docs and len(self._docs) > self.max_docs:
+                self._remove(next(iter(self._docs)))
+
+    def remove(self, key):
+        with self._lock:
+            self._remove(key)
+
+    def _remove(self, key):
+        entry = self._docs.pop(key, None)
+        if entry is None:
+            return
+        _, vector, length = entry
+        self._total_length -= length
+        for term in vector:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(key, None)
+                if not postings:
+                    del self._postings[term]
+
+    def vector(self, key):
+        """The stored sparse term-frequency vector for ``key`` (empty if not indexed)."""
+        entry = self._docs.get(key)
+        return dict(entry[1]) if entry else {}
+
+    def scores(self, query_tokens, keys):
+        """
+        BM25 of ``query_tokens`` against each document in ``keys`` (0 for keys
+        not indexed), with IDF and average length taken from the whole index.
+        Returns a float32 array aligned with ``keys``.
+        """
+        scores = np.zeros(len(keys), dtype=np.float32)
+        with self._lock:
+            n_docs = len(self._docs)
+            if not n_docs or not query_tokens:
+                return scores
+            avg_length = self._total_length / n_docs or 1.0
+            positions = {}
+            for position, key in enumerate(keys):
+                positions.setdefault(key, []).append(position)
+            lengths = np.array(
+                [self._docs[key][2] if key in self._docs else 0 for key in keys], dtype=np.float32
+            )
+            norm = self.k1 * (1 - self.b + self.b * lengths / avg_length)
+
+            for term in set(query_tokens):
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                for key, count in postings.items():
+                    for position in positions.get(key, ()):
+                        scores[position] += idf * count * (self.k1 + 1) / (count + norm[position])
+        return scores
+
+    def normalized_scores(self, query_tokens, keys):
+        """BM25 rescaled to 0-100 relative to the best of ``keys``."""
+        scores = self.scores(query_tokens, keys)
+        best = float(scores.max()) if len(scores) else 0.0
+        return scores * (100.0 / best) if best > 0 else scores
+
+
+_job_index = LexicalIndex()
+_resume_index = None
+_resume_index_lock = threading.Lock()
+
+
+def job_index():
+    """Open job postings, keyed by job id and versioned by ``updated_at``."""
+    return _job_index
+
+
+def resume_index():
+    """Resume texts keyed by content hash (LEXICAL_RESUME_INDEX_SIZE most recent)."""
+    global _resume_index
+    if _resume_index is None:
+        with _resume_index_lock:
+            if _resume_index is None:
+                from django.conf import settings
+                _resume_index = LexicalIndex(
+                    max_docs=getattr(settings, "LEXICAL_RESUME_INDEX_SIZE", RESUME_INDEX_SIZE)
+                )
+    return _resume_index
@@ -0,0 +1,121 @@
+"""
+Periodic maintenance jobs (run by `manage.py run_scheduler`, see jobs/scheduler.py).
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from .scheduler import periodic
+
+logger = logging.getLogger('jobs')
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+PRUNE_BATCH = 5000
+
+
+@periodic("expire_jobs", every=HOUR)
+def expire_postings():
+    """Deactivate postings past their deadline."""
+    from .job_expiry import expire_jobs
+
+    expire_jobs()
+
+
+@periodic("prune_job_views", every=DAY)
+def prune_job_views():
+    """Delete JobView rows older than JOB_VIEW_RETENTION_DAYS, in batches."""
+    from .models import JobView
+
+    cutoff = timezone.now() - timedelta(days=getattr(settings, "JOB_VIEW_RETENTION_DAYS", 180))
+    deleted = 0
+    while True:
+        ids = list(JobView.objects.filter(viewed_at__lt=cutoff).values_list("id", flat=True)[:PRUNE_BATCH])
+        if not ids:
+            break
+        deleted += JobView.objects.filter(id__in=ids).delete()[0]
+    logger.info(f"Pruned {deleted} job views older than {cutoff:%Y-%m-%d}")
+
+
+@periodic("rebuild_skill_index", every=DAY)
+def rebuild_skill_index():
+    """Recompute the candidate x skill bitmaps, picking up vocabulary growth and missed signals."""
+    from .skill_index import rebuild
+
+    rebuild()
+
+
+@periodic("queue_pending_rankings", every=10 * MINUTE)
+def queue_pending_rankings():
+    """Safety net for rank_job tasks: queue every job that still has pending applications."""
+    from .models import JobApplication
+    from .tasks import queue_job_ranking
+
+    job_ids = JobApplication.objects.filter(ranking_status="pending").values_list("job_id", flat=True).distinct()
+    for job_id in job_ids:
+        queue_job_ranking(job_id)
+
+
+@periodic("queue_job_embeddings", every=HOUR)
+def queue_job_embeddings():
+    """Queue embed_job for open postings without a stored vector for the serving model."""
+    from .embedding_store import serving_version
+    from .models import Job, StoredEmbedding
+    from .tasks import queue_job_embedding
+
+    embedded = set(
+        StoredEmbedding.objects.filter(model_version=serving_version(), kind="job").values_list("object_key", flat=True)
+    )
+    for job_id in Job.objects.open().values_list("id", flat=True):
+        if str(job_id) not in embedded:
+            queue_job_embedding(job_id)
+
+
+@periodic("refresh_old_feeds", every=HOUR)
+def refresh_old_feeds():
+    """Safety net for event-driven feed refreshes: recompute feeds older than a day."""
+    from .models import RecommendationFeed
+    from .tasks import queue_feed_refresh
+
+    cutoff = timezone.now() - timedelta(days=1)
+    for user_id in RecommendationFeed.objects.filter(computed_at__lt=cutoff).values_list("user_id", flat=True):
+        queue_feed_refresh(user_id)
+
+
+@periodic("purge_tasks", every=DAY)
+def purge_tasks():
+    """Delete finished background tasks past TASK_RETENTION_DAYS."""
+    from .task_queue import purge_finished
+
+    purge_finished()
+
+
+@periodic("warm_caches", every=10 * MINUTE, exclusive=False)
+def warm_caches():
+    """
+    Refresh this process's skill vocabulary and lexical job index so requests
+    never pay for a cold miss. Both live in process memory (the default
+    LocMemCache and the lexical index), so this runs on the scheduler thread
+    of each web process (SCHEDULER_LOCAL_JOBS), never from `run_scheduler`.
+    """
+    from django.core.cache import cache
+
+    from .ai_service import _build_job_text
+    from .lexical import job_index
+    from .models import Job
+    from .resume_features import SKILL_VOCAB_CACHE_KEY, skill_vocabulary
+
+    cache.delete(SKILL_VOCAB_CACHE_KEY)
+    skill_vocabulary()
+
+    index = job_index()
+    open_ids = set()
+    for job in Job.objects.open():
+        open_ids.add(job.pk)
+        index.add(job.pk, _build_job_text(job), version=job.updated_at)
+    for job_id in index.keys():
+        if job_id not in open_ids:
+            index.remove(job_id)
@@ -0,0 +1,32 @@
+"""
+Link resumes uploaded before content-addressed storage to ResumeBlobs.
+Original files are left in place; rows are pointed at the shared copy.
+"""
+from django.core.management.base import BaseCommand
+
+from accounts.models import Profile
+from jobs.models import JobApplication, ResumeBlob
+
+
+class Command(BaseCommand):
+    help = "Hash existing application/profile resumes and deduplicate them into ResumeBlobs"
+
+    def handle(self, *args, **options):
+        linked = 0
+        missing = 0
+
+        for model in (JobApplication, Profile):
+            rows = model.objects.filter(resume_blob__isnull=True).exclude(resume="").exclude(resume__isnull=True)
+            for row in rows.iterator():
+                try:
+                    with row.resume.open("rb") as handle:
+                        blob = ResumeBlob.objects.store(handle)
+                except (FileNotFoundError, ValueError):
+                    missing += 1
+                    continue
+                model.objects.filter(pk=row.pk).update(resume_blob=blob, resume=blob.file.name)
+                linked += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Linked {linked} resumes to {ResumeBlob.objects.count()} unique files ({missing} missing on disk)"
+        ))
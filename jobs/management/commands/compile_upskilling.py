@@ -0,0 +1,31 @@
+"""
+Compile the Employee Upskilling CSV into the typed artifact read by workers.
+Run at deploy time (build.sh); workers fall back to compiling in memory when
+the artifact is missing or older than the CSV.
+"""
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.upskilling import default_paths, write_artifact
+
+
+class Command(BaseCommand):
+    help = "Compile Employee_Upskilling_Dataset.csv into a NumPy artifact for market insights"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--csv", help="Source CSV (defaults to media/models)")
+        parser.add_argument("--output", help="Artifact path (defaults to UPSKILLING_ARTIFACT or media/models)")
+
+    def handle(self, *args, **options):
+        csv_path, artifact_path = default_paths()
+        csv_path = Path(options["csv"] or csv_path)
+        artifact_path = Path(options["output"] or artifact_path)
+        if not csv_path.exists():
+            raise CommandError(f"Upskilling dataset not found at {csv_path}")
+
+        arrays = write_artifact(csv_path, artifact_path)
+        self.stdout.write(self.style.SUCCESS(
+            f"Compiled {int(arrays['rows'])} rows into {len(arrays['group_count'])} groups -> "
+            f"{artifact_path} ({artifact_path.stat().st_size / 1024:.1f} KB)"
+        ))
@@ -0,0 +1,23 @@
+"""
+Deactivate jobs whose deadline has passed and evict their embeddings.
+Schedule it daily (cron / platform scheduler):
+
+    python manage.py expire_jobs
+"""
+from django.core.management.base import BaseCommand
+
+from jobs.job_expiry import expire_jobs
+
+
+class Command(BaseCommand):
+    help = "Deactivate active jobs past their deadline and drop their stored embeddings"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Only list the jobs that would expire")
+
+    def handle(self, *args, **options):
+        expired_ids = expire_jobs(dry_run=options["dry_run"])
+        verb = "Would expire" if options["dry_run"] else "Expired"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {len(expired_ids)} jobs"))
+        if expired_ids and options["verbosity"] > 1:
+            self.stdout.write(", ".join(str(job_id) for job_id in expired_ids))
@@ -0,0 +1,35 @@
+"""
+Finish AI scoring for applications still "pending" (new, or left by a
+time-boxed ranking). The background worker normally does this; without one,
+schedule it every few minutes (cron / platform scheduler):
+
+    python manage.py rank_pending
+"""
+from django.core.management.base import BaseCommand
+
+from jobs.ai_service import rank_applications
+from jobs.models import Job, JobApplication
+
+
+class Command(BaseCommand):
+    help = "Rank, without a time budget, every job that has applications pending AI scoring"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--job", type=int, help="Only this job id")
+        parser.add_argument("--limit", type=int, default=0, help="At most this many jobs per run (0 = all)")
+
+    def handle(self, *args, **options):
+        jobs = Job.objects.filter(applications__ranking_status="pending").distinct().order_by("id")
+        if options["job"]:
+            jobs = jobs.filter(pk=options["job"])
+        if options["limit"]:
+            jobs = jobs[:options["limit"]]
+
+        finished = 0
+        for job in jobs:
+            applications = JobApplication.objects.filter(job=job).select_related("applicant")
+            ranked = rank_applications(job, applications, time_budget=0)
+            still_pending = sum(1 for application in ranked if application.ranking_status == "pending")
+            finished += 1
+            self.stdout.write(f"{job.id} {job.title}: {len(ranked)} ranked, {still_pending} pending")
+        self.stdout.write(self.style.SUCCESS(f"Ranked {finished} jobs"))
@@ -0,0 +1,16 @@
+"""
+Repopulate the job full-text search index. Only needed on SQLite (FTS5 table
+kept in sync by signals) after bulk writes that bypass them; PostgreSQL's
+generated tsvector column is always current.
+"""
+from django.core.management.base import BaseCommand
+
+from jobs.search import rebuild
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index for job postings"
+
+    def handle(self, *args, **options):
+        indexed = rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {indexed} jobs"))
@@ -0,0 +1,16 @@
+"""
+Rebuild the candidate skill bitmaps from profiles and extracted resume text.
+Normally the index is maintained incrementally; run this after a backfill or
+when the global skill vocabulary has grown.
+"""
+from django.core.management.base import BaseCommand
+
+from jobs.skill_index import rebuild
+
+
+class Command(BaseCommand):
+    help = "Recompute the bitmap skill index for all job seekers"
+
+    def handle(self, *args, **options):
+        indexed = rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {indexed} candidates"))
@@ -0,0 +1,149 @@
+"""
+Re-embed jobs, resumes and the talent corpus with a new encoder version.
+
+Work is done in fixed-size chunks on a process pool; after every chunk the
+last id embedded is checkpointed on the EmbeddingModel row, so an
+interrupted run picks up after it (items added or removed in between do
+not shift the checkpoint). Serving only flips to the new version once every kind is
+fully covered (or never, without --activate).
+
+    python manage.py reembed --model-path media/models/resume_ranking_model_v2 --activate
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.embedding_store import (
+    DEFAULT_MODEL_ID, _talent_corpus, activate_version, coverage,
+    fingerprint_model_dir, store_vectors, text_hash,
+)
+from jobs.models import EmbeddingModel, Job, ResumeBlob
+
+KINDS = ("job", "resume", "talent")
+
+_worker_model = None
+
+
+def _init_worker(model_path):
+    global _worker_model
+    from sentence_transformers import SentenceTransformer
+    _worker_model = SentenceTransformer(model_path)
+
+
+def _encode_chunk(texts):
+    return _worker_model.encode(texts, batch_size=32, show_progress_bar=False)
+
+
+def _items(kind, after=None):
+    """[(checkpoint_id, object_key, text)] in checkpoint order, starting after ``after``."""
+    if kind == "job":
+        from jobs.ai_service import _build_job_text
+        jobs = Job.objects.open().order_by("id")
+        if after is not None:
+            jobs = jobs.filter(pk__gt=after)
+        return [(job.id, job.id, _build_job_text(job)) for job in jobs]
+    if kind == "resume":
+        blobs = ResumeBlob.objects.exclude(text="").order_by("id")
+        if after is not None:
+            blobs = blobs.filter(pk__gt=after)
+        return list(blobs.values_list("id", "sha256", "text"))
+    # The talent corpus is a fixed, bundled dataset: its row index is the id
+    corpus = _talent_corpus() or []
+    first = 0 if after is None else after + 1
+    return [(index, index, corpus[index]) for index in range(first, len(corpus))]
+
+
+def _checkpoint(version, kind):
+    """Last id embedded for ``kind`` (older offset-style checkpoints are not resumable)."""
+    progress = version.progress.get(kind)
+    return progress.get("last") if isinstance(progress, dict) else None
+
+
+class Command(BaseCommand):
+    help = "Re-embed all stored vectors with a new model version (resumable, checkpointed)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--model-path", required=True, help="Directory of the SentenceTransformer model")
+        parser.add_argument("--model-id", default=DEFAULT_MODEL_ID)
+        parser.add_argument("--model-version", help="Version label (defaults to a fingerprint of the model files)")
+        parser.add_argument("--kinds", default=",".join(KINDS), help="Comma-separated subset of job,resume,talent")
+        parser.add_argument("--chunk-size", type=int, default=256)
+        parser.add_argument("--workers", type=int, default=2)
+        parser.add_argument("--restart", action="store_true", help="Ignore existing checkpoints")
+        parser.add_argument("--activate", action="store_true", help="Make this version serving once complete")
+        parser.add_argument("--force", action="store_true", help="With --activate, flip even if coverage is incomplete")
+
+    def handle(self, *args, **options):
+        model_path = os.path.abspath(options["model_path"])
+        if not os.path.isdir(model_path):
+            raise CommandError(f"Model directory not found: {model_path}")
+        kinds = [kind.strip() for kind in options["kinds"].split(",") if kind.strip()]
+        unknown = set(kinds) - set(KINDS)
+        if unknown:
+            raise CommandError(f"Unknown kinds: {', '.join(sorted(unknown))}")
+
+        fingerprint = fingerprint_model_dir(model_path)
+        version, created = EmbeddingModel.objects.get_or_create(
+            model_id=options["model_id"],
+            version=options["model_version"] or fingerprint,
+            defaults={"path": model_path, "fingerprint": fingerprint},
+        )
+        if version.status == "retired":
+            raise CommandError(f"{version} is retired; register it under a new version label")
+        if version.fingerprint and version.fingerprint != fingerprint:
+            raise CommandError(
+                f"The files in {model_path} changed since {version} was started; use a new --model-version"
+            )
+        if options["restart"]:
+            version.progress = {}
+            version.save(update_fields=["progress"])
+        self.stdout.write(f"{'Created' if created else 'Resuming'} {version}")
+
+        chunk_size = options["chunk_size"]
+        pool = ProcessPoolExecutor(
+            max_workers=max(1, options["workers"]),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(model_path,),
+        )
+        try:
+            for kind in kinds:
+                self._embed_kind(pool, version, kind, chunk_size)
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+        for kind, (done, total) in coverage(version).items():
+            self.stdout.write(f"   {kind:7} {done}/{total}")
+
+        if options["activate"]:
+            try:
+                activate_version(version, force=options["force"])
+            except ValueError as exc:
+                raise CommandError(str(exc))
+            self.stdout.write(self.style.SUCCESS(f"{version} is now serving"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Embedded {version}; run again with --activate to serve it"))
+
+    def _embed_kind(self, pool, version, kind, chunk_size):
+        last = _checkpoint(version, kind)
+        items = _items(kind, after=last)
+        if not items:
+            self.stdout.write(f"{kind}: already complete")
+            return
+
+        chunks = [items[offset:offset + chunk_size] for offset in range(0, len(items), chunk_size)]
+        futures = [pool.submit(_encode_chunk, [text for _, _, text in chunk]) for chunk in chunks]
+
+        # Results are consumed in order so everything up to the checkpoint id is embedded
+        done = 0
+        for chunk, future in zip(chunks, futures):
+            vectors = future.result()
+            store_vectors(version, kind, [
+                (key, text_hash(text), vector) for (_, key, text), vector in zip(chunk, vectors)
+            ])
+            done += len(chunk)
+            version.progress[kind] = {"last": chunk[-1][0]}
+            version.save(update_fields=["progress"])
+            self.stdout.write(f"{kind}: {done}/{len(items)} (through id {chunk[-1][0]})")
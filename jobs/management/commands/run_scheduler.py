@@ -0,0 +1,69 @@
+"""
+Run periodic maintenance jobs (jobs/maintenance.py) on their schedules.
+Safe to run on several nodes; each due job is run by one of them:
+
+    python manage.py run_scheduler
+"""
+import os
+import signal
+import socket
+import threading
+
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs import maintenance  # noqa: F401  (registers the periodic jobs)
+from jobs.models import ScheduledJob
+from jobs.scheduler import PERIODIC, Scheduler
+
+
+class Command(BaseCommand):
+    help = "Run due maintenance jobs until stopped (SIGTERM/SIGINT finish the current job)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Run whatever is due, then exit")
+        parser.add_argument("--run", action="append", default=[], metavar="NAME", help="Run this job now, then exit")
+        parser.add_argument("--list", action="store_true", help="Show schedules and run statistics")
+        parser.add_argument("--tick", type=float, default=None, help="Seconds between checks (SCHEDULER_TICK_SECONDS)")
+        parser.add_argument("--owner", default=f"{socket.gethostname()}:{os.getpid()}")
+
+    def handle(self, *args, **options):
+        scheduler = Scheduler(options["owner"])
+        scheduler.sync()
+
+        if options["list"]:
+            for row in ScheduledJob.objects.all():
+                avg = f"{row.avg_duration_ms:.0f}ms" if row.avg_duration_ms is not None else "-"
+                self.stdout.write(
+                    f"{row.name:<24} every {row.interval_seconds}s  next {row.next_run_at:%Y-%m-%d %H:%M}  "
+                    f"{row.last_status or 'never run':<9} avg {avg}  runs {row.run_count}  failures {row.failure_count}"
+                    f"{'' if row.enabled else '  (disabled)'}"
+                )
+            return
+
+        if options["run"]:
+            unknown = set(options["run"]) - set(PERIODIC)
+            if unknown:
+                raise CommandError(f"Unknown job(s): {', '.join(sorted(unknown))}; choose from {', '.join(PERIODIC)}")
+            local = sorted(name for name in options["run"] if not PERIODIC[name].exclusive)
+            if local:
+                raise CommandError(
+                    f"{', '.join(local)} warm per-process state and only run inside web processes (SCHEDULER_LOCAL_JOBS)"
+                )
+            self._report(scheduler.run_pending(force=set(options["run"])))
+            return
+
+        if options["once"]:
+            self._report(scheduler.run_pending())
+            return
+
+        stop = threading.Event()
+        signal.signal(signal.SIGTERM, lambda *_: stop.set())
+        signal.signal(signal.SIGINT, lambda *_: stop.set())
+        self.stdout.write(f"Scheduler {options['owner']} started ({len(PERIODIC)} jobs)")
+        scheduler.run_forever(stop, tick=options["tick"])
+        self.stdout.write(self.style.SUCCESS(f"Scheduler {options['owner']} stopped"))
+
+    def _report(self, results):
+        for name, ok in results.items():
+            self.stdout.write(f"{name}: {'ok' if ok else 'failed'}")
+        self.stdout.write(self.style.SUCCESS(f"Ran {len(results)} jobs"))
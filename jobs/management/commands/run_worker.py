@@ -0,0 +1,70 @@
+"""
+Run background tasks from the database queue (jobs/task_queue.py).
+Keep one or more running next to the web process:
+
+    python manage.py run_worker
+"""
+import os
+import signal
+import socket
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from jobs import tasks  # noqa: F401  (registers the task handlers)
+from jobs.task_queue import claim, requeue_stale, run_batch
+
+MAINTENANCE_INTERVAL = 60  # seconds between stale-lease checks
+
+
+class Command(BaseCommand):
+    help = "Claim and run queued background tasks until stopped (SIGTERM/SIGINT finish the current task)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Exit when the queue is empty")
+        parser.add_argument("--batch", type=int, default=1, help="Tasks claimed per poll")
+        parser.add_argument("--max-tasks", type=int, default=0, help="Exit after this many tasks (0 = no limit)")
+        parser.add_argument(
+            "--sleep", type=float, default=None, help="Seconds to wait when the queue is empty (TASK_POLL_SECONDS)"
+        )
+        parser.add_argument("--worker-id", default=f"{socket.gethostname()}:{os.getpid()}")
+
+    def handle(self, *args, **options):
+        worker_id = options["worker_id"]
+        poll = options["sleep"] if options["sleep"] is not None else getattr(settings, "TASK_POLL_SECONDS", 2.0)
+        self._stopping = False
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        done = failed = 0
+        next_maintenance = 0.0
+        self.stdout.write(f"Worker {worker_id} started")
+        while not self._stopping:
+            now = time.monotonic()
+            if now >= next_maintenance:
+                requeue_stale()
+                next_maintenance = now + MAINTENANCE_INTERVAL
+
+            claimed = claim(worker_id, limit=max(1, options["batch"]))
+            if not claimed:
+                if options["once"]:
+                    break
+                close_old_connections()
+                time.sleep(poll)
+                continue
+
+            for succeeded in run_batch(claimed):
+                if succeeded:
+                    done += 1
+                else:
+                    failed += 1
+            close_old_connections()
+            if options["max_tasks"] and done + failed >= options["max_tasks"]:
+                break
+
+        self.stdout.write(self.style.SUCCESS(f"Worker {worker_id} stopped: {done} done, {failed} failed"))
+
+    def _stop(self, signum, frame):
+        self._stopping = True
@@ -0,0 +1,101 @@
+"""
+Single-job match scores for the job detail page.
+
+job_detail renders straight away and the page fetches the seeker's match
+score from job_match_api afterwards. The score is computed against a cached
+seeker vector (the personalized embedding is built once per seeker version,
+not per page view) and the job's stored vector, and the result is cached by
+(user, job, seeker version, job version, model version):
+
+- the seeker version is ``SeekerVersion.changed_at``, stamped in the
+  database whenever one of the seeker's recommendation inputs changes (the
+  same events that mark their feed stale), so every worker sees it;
+- the job version is its ``updated_at``;
+- the model version is the serving EmbeddingModel.
+"""
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+
+def seeker_version(user_id):
+    """
+    Current version of the seeker's inputs: the time they last changed, read
+    from the database (one indexed lookup) rather than from the cache, which
+    is per-process unless a shared backend is configured.
+    """
+    from .models import SeekerVersion
+
+    changed_at = SeekerVersion.objects.filter(user_id=user_id).values_list("changed_at", flat=True).first()
+    return int(changed_at.timestamp() * 1_000_000) if changed_at else 0
+
+
+def bump_seeker_version(user_id):
+    """Invalidate the seeker's cached vector and match scores (commits with the change that caused it)."""
+    from .models import SeekerVersion
+
+    SeekerVersion.objects.update_or_create(user_id=user_id, defaults={"changed_at": timezone.now()})
+
+
+def _ttl():
+    return getattr(settings, "MATCH_SCORE_TTL", 3600)
+
+
+def _cached_seeker_vector(model_version, version):
+    """A drop-in for ai_service._seeker_vector that reuses the vector built for this seeker version."""
+    from .ai_service import _seeker_vector
+
+    def seeker_vector(user_profile, resume_text, use_personalization):
+        key = f"seeker_vector:{user_profile.user_id}:{version}:{model_version}:{int(use_personalization)}"
+        raw = cache.get(key)
+        if raw is not None:
+            return np.frombuffer(raw, dtype=np.float32)
+        vector = _seeker_vector(user_profile, resume_text, use_personalization)
+        if vector is not None:
+            cache.set(key, np.asarray(vector, dtype=np.float32).tobytes(), _ttl())
+        return vector
+
+    return seeker_vector
+
+
+def job_match(user_profile, job):
+    """
+    ``{"score", "reason", "improvements", "personalized", "degraded"}`` for
+    ``job``, or None when it gets no score (already applied, dismissed or
+    expired). Degraded (keyword-only) results are not cached, so the real
+    score is served as soon as the encoder is back.
+    """
+    from .ai_service import get_job_recommendations
+    from .candidate_generation import candidate_jobs
+    from .embedding_store import serving_version
+    from .models import Job
+
+    candidates = candidate_jobs(user_profile.user, Job.objects.filter(pk=job.pk))
+    if not candidates.exists():
+        return None
+
+    model_version = serving_version().pk
+    version = seeker_version(user_profile.user_id)
+    key = f"job_match:{user_profile.user_id}:{job.pk}:{version}:{job.updated_at.timestamp()}:{model_version}"
+    match = cache.get(key)
+    if match is not None:
+        return match
+
+    recommendations = get_job_recommendations(
+        user_profile, candidates, use_personalization=True,
+        seeker_vector=_cached_seeker_vector(model_version, version),
+    )
+    if not recommendations:
+        return None
+    rec = recommendations[0]
+    match = {
+        "score": rec["score"],
+        "reason": rec["reason"],
+        "improvements": rec.get("improvements", []),
+        "personalized": rec.get("personalized", False),
+        "degraded": rec.get("degraded", False),
+    }
+    if not match["degraded"]:
+        cache.set(key, match, _ttl())
+    return match
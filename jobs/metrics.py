@@ -0,0 +1,60 @@
+"""
+In-process latency metrics for ranking stages.
+
+Each stage keeps a rolling window of recent timings; summary() reports
+count and p50/p95/max per stage and is exposed on /health/.
+"""
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+WINDOW = 500
+
+_lock = threading.Lock()
+_timings = defaultdict(lambda: deque(maxlen=WINDOW))
+_counts = defaultdict(int)
+
+
+def record(stage, elapsed_ms):
+    with _lock:
+        _timings[stage].append(elapsed_ms)
+        _counts[stage] += 1
+
+
+@contextmanager
+def timed(stage, sink=None):
+    """Time the block under ``stage``; also stores the milliseconds in ``sink[stage]`` if given."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        record(stage, elapsed_ms)
+        if sink is not None:
+            sink[stage] = round(elapsed_ms, 1)
+
+
+def _percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def summary():
+    with _lock:
+        snapshot = {stage: sorted(values) for stage, values in _timings.items() if values}
+        counts = dict(_counts)
+    return {
+        stage: {
+            "count": counts[stage],
+            "p50_ms": round(_percentile(values, 0.5), 1),
+            "p95_ms": round(_percentile(values, 0.95), 1),
+            "max_ms": round(values[-1], 1),
+        }
+        for stage, values in sorted(snapshot.items())
+    }
+
+
+def reset():
+    with _lock:
+        _timings.clear()
+        _counts.clear()
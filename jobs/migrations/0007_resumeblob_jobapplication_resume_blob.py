@@ -0,0 +1,33 @@
+# Generated by Django 6.0.2 on 2026-10-18 22:34
+
+import django.db.models.deletion
+import jobs.resume_storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0006_rename_jobs_jobvie_user_id_viewed_idx_jobs_jobvie_user_id_1f2d90_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, unique=True)),
+                ('file', models.FileField(upload_to=jobs.resume_storage.blob_upload_to)),
+                ('size', models.PositiveBigIntegerField(default=0)),
+                ('text', models.TextField(blank=True, help_text='Extracted resume text')),
+                ('text_extracted_at', models.DateTimeField(blank=True, null=True)),
+                ('embedding', models.BinaryField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='jobapplication',
+            name='resume_blob',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='applications', to='jobs.resumeblob'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 6.0.2 on 2026-10-18 22:39
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0007_resumeblob_jobapplication_resume_blob'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='resumeblob',
+            name='embedding',
+        ),
+        migrations.CreateModel(
+            name='EmbeddingModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model_id', models.CharField(max_length=100)),
+                ('version', models.CharField(max_length=64)),
+                ('path', models.CharField(help_text='Directory the SentenceTransformer is loaded from', max_length=500)),
+                ('dimensions', models.PositiveIntegerField(default=0)),
+                ('status', models.CharField(choices=[('building', 'Building'), ('serving', 'Serving'), ('retired', 'Retired')], default='building', max_length=20)),
+                ('progress', models.JSONField(blank=True, default=dict, help_text='Re-embedding checkpoints per kind')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('activated_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+                'unique_together': {('model_id', 'version')},
+            },
+        ),
+        migrations.CreateModel(
+            name='StoredEmbedding',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('job', 'Job'), ('resume', 'Resume'), ('talent', 'Talent corpus')], max_length=10)),
+                ('object_key', models.CharField(help_text='Job id, resume SHA-256 or corpus row', max_length=64)),
+                ('text_hash', models.CharField(help_text='SHA-1 of the encoded text', max_length=40)),
+                ('vector', models.BinaryField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('model_version', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='embeddings', to='jobs.embeddingmodel')),
+            ],
+            options={
+                'unique_together': {('model_version', 'kind', 'object_key')},
+            },
+        ),
+    ]
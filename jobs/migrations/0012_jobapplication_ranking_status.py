@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-18 23:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0011_job_open_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobapplication',
+            name='ranking_status',
+            field=models.CharField(choices=[('scored', 'Scored'), ('pending', 'Pending')], db_index=True, default='scored', help_text='Pending: ranked by pre-screen only, AI scoring still to run (manage.py rank_pending)', max_length=10),
+        ),
+    ]
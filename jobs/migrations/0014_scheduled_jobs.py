@@ -0,0 +1,38 @@
+# Generated by Django 6.0.2 on 2026-10-18 23:08
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0013_task_queue'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScheduledJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('enabled', models.BooleanField(default=True)),
+                ('interval_seconds', models.PositiveIntegerField()),
+                ('next_run_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('lease_owner', models.CharField(blank=True, max_length=100)),
+                ('lease_expires_at', models.DateTimeField(blank=True, null=True)),
+                ('last_started_at', models.DateTimeField(blank=True, null=True)),
+                ('last_status', models.CharField(blank=True, choices=[('ok', 'OK'), ('failed', 'Failed')], max_length=10)),
+                ('last_error', models.TextField(blank=True)),
+                ('last_duration_ms', models.FloatField(blank=True, null=True)),
+                ('max_duration_ms', models.FloatField(default=0)),
+                ('total_duration_ms', models.FloatField(default=0)),
+                ('run_count', models.PositiveIntegerField(default=0)),
+                ('failure_count', models.PositiveIntegerField(default=0)),
+                ('consecutive_failures', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 6.0.2 on 2026-10-18 23:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def mark_unranked_pending(apps, schema_editor):
+    # Pages no longer rank on load; hand never-ranked applications to the worker
+    JobApplication = apps.get_model('jobs', 'JobApplication')
+    JobApplication.objects.filter(ranking_notes='').update(ranking_status='pending')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0014_scheduled_jobs'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='jobapplication',
+            name='ranking_status',
+            field=models.CharField(choices=[('scored', 'Scored'), ('pending', 'Pending')], db_index=True, default='pending', help_text='Pending: not yet scored, or ranked by pre-screen only; the background worker finishes it', max_length=10),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['job', '-match_score', '-applied_at'], name='application_rank_idx'),
+        ),
+        migrations.RunPython(mark_unranked_pending, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 6.0.2 on 2026-10-18 23:12
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0015_application_rank_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RecommendationFeed',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('computed_at', models.DateTimeField(blank=True, null=True)),
+                ('stale_since', models.DateTimeField(blank=True, help_text='An input changed after computed_at; a refresh is queued', null=True)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='recommendation_feed', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='FeedItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveSmallIntegerField()),
+                ('score', models.PositiveSmallIntegerField()),
+                ('reason', models.TextField(blank=True)),
+                ('improvements', models.JSONField(blank=True, default=list)),
+                ('personalized', models.BooleanField(default=True)),
+                ('degraded', models.BooleanField(default=False)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='feed_items', to='jobs.job')),
+                ('feed', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='items', to='jobs.recommendationfeed')),
+            ],
+            options={
+                'ordering': ['feed', 'position'],
+                'unique_together': {('feed', 'position')},
+            },
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 6.0.2 on 2026-10-18 23:30
+
+from django.db import migrations
+
+POSTGRES_FORWARD = [
+    """
+    ALTER TABLE jobs_job ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(skills_required, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(description, '') || ' ' || coalesce(requirements, '')), 'C')
+    ) STORED
+    """,
+    "CREATE INDEX job_search_vector_idx ON jobs_job USING GIN (search_vector)",
+]
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS job_search_vector_idx",
+    "ALTER TABLE jobs_job DROP COLUMN IF EXISTS search_vector",
+]
+
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE jobs_job_fts USING fts5(title, skills_required, body, tokenize='porter unicode61')",
+    "INSERT INTO jobs_job_fts (rowid, title, skills_required, body) "
+    "SELECT id, title, skills_required, description || char(10) || requirements FROM jobs_job",
+]
+SQLITE_BACKWARD = ["DROP TABLE IF EXISTS jobs_job_fts"]
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        # The index lives outside the model (generated column / virtual table), so it is per backend
+        for statement in statements_by_vendor.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0016_recommendation_feed'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run({'postgresql': POSTGRES_FORWARD, 'sqlite': SQLITE_FORWARD}),
+            _run({'postgresql': POSTGRES_BACKWARD, 'sqlite': SQLITE_BACKWARD}),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 6.0.2 on 2026-10-18 23:31
+
+import re
+
+from django.db import migrations, models
+
+
+def copy_fingerprint_labels(apps, schema_editor):
+    # Versions registered from the model files were labelled with their fingerprint
+    EmbeddingModel = apps.get_model('jobs', 'EmbeddingModel')
+    for version in EmbeddingModel.objects.all():
+        if re.fullmatch(r"[0-9a-f]{12}", version.version):
+            version.fingerprint = version.version
+            version.save(update_fields=['fingerprint'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0017_job_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='embeddingmodel',
+            name='fingerprint',
+            field=models.CharField(blank=True, help_text='Fingerprint of the model files this version was built from', max_length=64),
+        ),
+        migrations.RunPython(copy_fingerprint_labels, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-18 23:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0018_embedding_model_fingerprint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recommendationfeed',
+            name='inputs_changed_at',
+            field=models.DateTimeField(blank=True, help_text="Last change to the seeker's recommendation inputs (versions cached match scores)", null=True),
+        ),
+    ]
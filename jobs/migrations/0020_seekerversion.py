@@ -0,0 +1,38 @@
+# Generated by Django 6.0.2 on 2026-10-18 23:45
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def copy_versions(apps, schema_editor):
+    RecommendationFeed = apps.get_model('jobs', 'RecommendationFeed')
+    SeekerVersion = apps.get_model('jobs', 'SeekerVersion')
+    SeekerVersion.objects.bulk_create([
+        SeekerVersion(user_id=user_id, changed_at=changed_at)
+        for user_id, changed_at in RecommendationFeed.objects.filter(
+            inputs_changed_at__isnull=False
+        ).values_list('user_id', 'inputs_changed_at')
+    ])
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('jobs', '0019_recommendationfeed_inputs_changed_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SeekerVersion',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='seeker_version', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('changed_at', models.DateTimeField()),
+            ],
+        ),
+        migrations.RunPython(copy_versions, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='recommendationfeed',
+            name='inputs_changed_at',
+        ),
+    ]
@@ -1,5 +1,20 @@
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.contrib.auth.models import User
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.utils import timezone
+
+from .resume_storage import blob_upload_to, file_sha256
+
+
+class JobQuerySet(models.QuerySet):
+    def open(self):
+        """Active postings whose deadline, if any, has not passed"""
+        return self.filter(is_active=True).filter(Q(deadline__isnull=True) | Q(deadline__gte=timezone.localdate()))
+
+    def expired(self):
+        """Still marked active but past their deadline (what the expiry sweep deactivates)"""
+        return self.filter(is_active=True, deadline__lt=timezone.localdate())
 
 
 class Job(models.Model):
@@ -27,6 +42,8 @@ class Job(models.Model):
     is_active = models.BooleanField(default=True)
     deadline = models.DateField(blank=True, null=True)
 
+    objects = JobQuerySet.as_manager()
+
     def __str__(self):
         return self.title
     
@@ -37,6 +54,67 @@ class Job(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Candidate generation for recommendations (see candidate_generation.py)
+            models.Index(fields=['is_active', 'job_type', 'experience_required'], name='job_candidate_idx'),
+            models.Index(Lower('location'), name='job_location_lower_idx'),
+            models.Index(fields=['is_active', 'deadline'], name='job_open_idx'),
+        ]
+
+
+class ResumeBlobManager(models.Manager):
+    def store(self, file_obj):
+        """
+        Return the ResumeBlob for this file's content, writing the file to
+        storage only the first time that content is seen.
+        """
+        sha256 = file_sha256(file_obj)
+        blob = self.filter(sha256=sha256).first()
+        if blob:
+            return blob
+
+        blob = self.model(sha256=sha256, size=file_obj.size or 0)
+        blob.file.save(file_obj.name, file_obj, save=False)
+        try:
+            with transaction.atomic():
+                blob.save()
+        except IntegrityError:
+            # Same content stored concurrently; keep theirs, drop our copy
+            blob.file.delete(save=False)
+            return self.get(sha256=sha256)
+        return blob
+
+
+class ResumeBlob(models.Model):
+    """A unique resume file, addressed by the SHA-256 of its content"""
+    sha256 = models.CharField(max_length=64, unique=True)
+    file = models.FileField(upload_to=blob_upload_to)
+    size = models.PositiveBigIntegerField(default=0)
+    text = models.TextField(blank=True, help_text="Extracted resume text")
+    text_extracted_at = models.DateTimeField(blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = ResumeBlobManager()
+
+    def __str__(self):
+        return f"{self.sha256[:12]} ({self.size} bytes)"
+
+
+def attach_resume_blob(instance):
+    """
+    Swap a freshly uploaded ``instance.resume`` for its content-addressed
+    copy and link ``instance.resume_blob``; a cleared resume unlinks it.
+    Used by JobApplication and Profile.
+    """
+    resume = instance.resume
+    if not resume:
+        instance.resume_blob = None
+        return
+    if getattr(resume, "_committed", True):
+        return
+    blob = ResumeBlob.objects.store(resume.file)
+    instance.resume_blob = blob
+    instance.resume = blob.file.name
 
 
 class JobApplication(models.Model):
@@ -51,6 +129,9 @@ class JobApplication(models.Model):
     job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='applications')
     applicant = models.ForeignKey(User, on_delete=models.CASCADE, related_name='applications')
     resume = models.FileField(upload_to='applications/', blank=True, null=True)
+    resume_blob = models.ForeignKey(
+        ResumeBlob, on_delete=models.SET_NULL, blank=True, null=True, related_name='applications'
+    )
     cover_letter = models.TextField(blank=True)
     applied_at = models.DateTimeField(auto_now_add=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
@@ -58,6 +139,13 @@ class JobApplication(models.Model):
     # AI Ranking Fields
     match_score = models.FloatField(default=0.0, help_text="AI-calculated match score 0-100")
     ranking_notes = models.TextField(blank=True, help_text="AI analysis notes")
+    ranking_status = models.CharField(
+        max_length=10,
+        choices=[('scored', 'Scored'), ('pending', 'Pending')],
+        default='pending',
+        db_index=True,
+        help_text="Pending: not yet scored, or ranked by pre-screen only; the background worker finishes it",
+    )
     
     # Rejection Feedback
     rejection_reason = models.TextField(blank=True, help_text="Reason for rejection (visible to applicant)")
@@ -65,10 +153,18 @@ class JobApplication(models.Model):
     class Meta:
         unique_together = ['job', 'applicant']
         ordering = ['-match_score', '-applied_at']
+        indexes = [
+            # The per-job ranking: recruiter pages read it in this order
+            models.Index(fields=['job', '-match_score', '-applied_at'], name='application_rank_idx'),
+        ]
 
     def __str__(self):
         return f"{self.applicant.username} - {self.job.title}"
 
+    def save(self, *args, **kwargs):
+        attach_resume_blob(self)
+        super().save(*args, **kwargs)
+
 
 class JobView(models.Model):
     """Track user behavior - which jobs they view and for how long"""
@@ -116,3 +212,191 @@ class JobPreference(models.Model):
     
     def __str__(self):
         return f"{self.user.username} - {self.preference_type} - {self.job.title}"
+
+
+class EmbeddingModel(models.Model):
+    """A registered encoder version; exactly one is serving at a time"""
+    STATUS_CHOICES = [
+        ('building', 'Building'),
+        ('serving', 'Serving'),
+        ('retired', 'Retired'),
+    ]
+
+    model_id = models.CharField(max_length=100)
+    version = models.CharField(max_length=64)
+    path = models.CharField(max_length=500, help_text="Directory the SentenceTransformer is loaded from")
+    fingerprint = models.CharField(max_length=64, blank=True, help_text="Fingerprint of the model files this version was built from")
+    dimensions = models.PositiveIntegerField(default=0)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='building')
+    progress = models.JSONField(default=dict, blank=True, help_text="Re-embedding checkpoints per kind")
+    created_at = models.DateTimeField(auto_now_add=True)
+    activated_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        unique_together = ['model_id', 'version']
+
+    def __str__(self):
+        return f"{self.model_id}@{self.version} ({self.status})"
+
+
+class StoredEmbedding(models.Model):
+    """A persisted vector, tied to the model version that produced it"""
+    KIND_CHOICES = [
+        ('job', 'Job'),
+        ('resume', 'Resume'),
+        ('talent', 'Talent corpus'),
+    ]
+
+    model_version = models.ForeignKey(EmbeddingModel, on_delete=models.CASCADE, related_name='embeddings')
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    object_key = models.CharField(max_length=64, help_text="Job id, resume SHA-256 or corpus row")
+    text_hash = models.CharField(max_length=40, help_text="SHA-1 of the encoded text")
+    vector = models.BinaryField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ['model_version', 'kind', 'object_key']
+
+    def __str__(self):
+        return f"{self.kind}:{self.object_key} @ {self.model_version_id}"
+
+
+class CandidateSkillEntry(models.Model):
+    """What the skill index currently holds for one candidate (used to diff updates)"""
+    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='skill_entry')
+    skills = models.JSONField(default=list, help_text="Normalised skills from profile and resumes")
+    experience_years = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.user.username}: {len(self.skills)} skills, {self.experience_years}y"
+
+
+class SkillBitmap(models.Model):
+    """
+    One posting list of the candidate skill index: bit ``user_id`` is set
+    for every candidate having the skill (``skill:<name>``) or at least the
+    experience of a bucket (``exp:<years>``).
+    """
+    key = models.CharField(max_length=200, unique=True)
+    bits = models.BinaryField(default=b'')
+    cardinality = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.key} ({self.cardinality})"
+
+
+class Task(models.Model):
+    """A unit of background work for `manage.py run_worker` (see jobs/task_queue.py)"""
+    STATUS_CHOICES = [
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ]
+
+    name = models.CharField(max_length=100)
+    kwargs = models.JSONField(default=dict, blank=True)
+    priority = models.SmallIntegerField(default=0, help_text="Higher runs first")
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='queued')
+    dedupe_key = models.CharField(
+        max_length=200, blank=True, db_index=True,
+        help_text="While a task with this key is queued, enqueueing another is a no-op",
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=3)
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', '-priority', 'run_after'], name='task_claim_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.name} #{self.pk} ({self.status})"
+
+
+class ScheduledJob(models.Model):
+    """Schedule, lease and run statistics of a periodic maintenance job (see jobs/scheduler.py)"""
+    STATUS_CHOICES = [
+        ('ok', 'OK'),
+        ('failed', 'Failed'),
+    ]
+
+    name = models.CharField(max_length=100, unique=True)
+    enabled = models.BooleanField(default=True)
+    interval_seconds = models.PositiveIntegerField()
+    next_run_at = models.DateTimeField(default=timezone.now)
+    lease_owner = models.CharField(max_length=100, blank=True)
+    lease_expires_at = models.DateTimeField(blank=True, null=True)
+    last_started_at = models.DateTimeField(blank=True, null=True)
+    last_status = models.CharField(max_length=10, choices=STATUS_CHOICES, blank=True)
+    last_error = models.TextField(blank=True)
+    last_duration_ms = models.FloatField(blank=True, null=True)
+    max_duration_ms = models.FloatField(default=0)
+    total_duration_ms = models.FloatField(default=0)
+    run_count = models.PositiveIntegerField(default=0)
+    failure_count = models.PositiveIntegerField(default=0)
+    consecutive_failures = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ['name']
+
+    def __str__(self):
+        return self.name
+
+    @property
+    def avg_duration_ms(self):
+        return self.total_duration_ms / self.run_count if self.run_count else None
+
+
+class RecommendationFeed(models.Model):
+    """A job seeker's materialized recommendation feed (see jobs/feed.py)"""
+    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='recommendation_feed')
+    computed_at = models.DateTimeField(blank=True, null=True)
+    stale_since = models.DateTimeField(
+        blank=True, null=True, help_text="An input changed after computed_at; a refresh is queued"
+    )
+
+    def __str__(self):
+        return f"Feed for {self.user.username}"
+
+
+class SeekerVersion(models.Model):
+    """
+    When a user's recommendation inputs last changed; versions their cached
+    match scores (see jobs/match_scores.py). Kept apart from
+    RecommendationFeed so bumping it never creates a feed to maintain.
+    """
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='seeker_version')
+    changed_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.user.username} inputs changed {self.changed_at}"
+
+
+class FeedItem(models.Model):
+    """One job in a materialized feed, with the score and explanation it was computed with"""
+    feed = models.ForeignKey(RecommendationFeed, on_delete=models.CASCADE, related_name='items')
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='feed_items')
+    position = models.PositiveSmallIntegerField()
+    score = models.PositiveSmallIntegerField()
+    reason = models.TextField(blank=True)
+    improvements = models.JSONField(default=list, blank=True)
+    personalized = models.BooleanField(default=True)
+    degraded = models.BooleanField(default=False)
+
+    class Meta:
+        ordering = ['feed', 'position']
+        unique_together = ['feed', 'position']
+
+    def __str__(self):
+        return f"{self.feed.user.username} #{self.position}: {self.job.title} ({self.score}%)"
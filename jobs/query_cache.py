@@ -0,0 +1,103 @@
+"""
+Byte-budgeted LRU cache of query-text embeddings.
+
+Ad-hoc job descriptions have no stable identity, so they cannot live in the
+versioned embedding store; recruiters do however resubmit the same (or a
+lightly re-spaced) text while iterating on a ranking. Vectors are kept per
+process, keyed by the serving model version and a hash of the normalised
+text, and evicted least-recently-used once their total size exceeds
+QUERY_EMBEDDING_CACHE_MB. Hit/miss/eviction counts are exposed on /health/.
+"""
+import hashlib
+import threading
+import unicodedata
+from collections import OrderedDict
+
+_ENTRY_OVERHEAD = 200  # approximate bytes per entry beyond the vector (key, ndarray header, dict slot)
+
+
+def normalize_query(text):
+    """Unicode-normalise and collapse whitespace; case is kept since the encoder is case-sensitive."""
+    return " ".join(unicodedata.normalize("NFC", text or "").split())
+
+
+def query_key(model_version, text):
+    return (model_version, hashlib.sha1(normalize_query(text).encode("utf-8")).hexdigest())
+
+
+class QueryEmbeddingCache:
+    """Thread-safe LRU of read-only float32 vectors bounded by their total size in bytes."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> vector
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _size(vector):
+        return vector.nbytes + _ENTRY_OVERHEAD
+
+    def get(self, key):
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return vector
+
+    def put(self, key, vector):
+        size = self._size(vector)
+        if size > self.max_bytes:
+            return
+        # Shared between requests, so nobody may modify it in place
+        vector.setflags(write=False)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= self._size(previous)
+            self._entries[key] = vector
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= self._size(evicted)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else None,
+            }
+
+
+_query_cache = None
+_query_cache_lock = threading.Lock()
+
+
+def query_cache():
+    """Process-wide query embedding cache (sized by QUERY_EMBEDDING_CACHE_MB)."""
+    global _query_cache
+    if _query_cache is None:
+        with _query_cache_lock:
+            if _query_cache is None:
+                from django.conf import settings
+                megabytes = getattr(settings, "QUERY_EMBEDDING_CACHE_MB", 16)
+                _query_cache = QueryEmbeddingCache(int(megabytes * 1024 * 1024))
+    return _query_cache
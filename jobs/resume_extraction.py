@@ -0,0 +1,208 @@
+"""
+Out-of-process resume text extraction.
+
+Parsing (PDF or DOCX, see resume_extractors) runs on a small bounded
+process pool instead of the request thread. Each file gets a wall-clock
+timeout, a page cap, a text budget and an address-space limit, so a
+pathological upload can only burn one worker's budget.
+Results (including failures) are cached so a bad file is not re-parsed on
+every page load.
+"""
+import hashlib
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .resume_extractors import extract_text
+
+logger = logging.getLogger('jobs')
+
+# Cached in place of the text when extraction failed or timed out
+EXTRACTION_FAILED = "__resume_extraction_failed__"
+
+# Extra time the parent waits on top of the in-worker alarm before it
+# considers the worker wedged and recycles the pool (covers worker spawn)
+_TIMEOUT_GRACE_SECONDS = 5
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+class ExtractionTimeout(Exception):
+    """Raised inside a worker when a single file exceeds its time budget."""
+
+
+def _get_limits():
+    return {
+        "workers": max(1, getattr(settings, "RESUME_EXTRACT_WORKERS", 2)),
+        "timeout": getattr(settings, "RESUME_EXTRACT_TIMEOUT", 10),
+        "max_pages": getattr(settings, "RESUME_EXTRACT_MAX_PAGES", 20),
+        "max_chars": getattr(settings, "RESUME_EXTRACT_MAX_CHARS", 20000),
+        "max_tokens": getattr(settings, "RESUME_EXTRACT_MAX_TOKENS", 0) or None,
+        "memory_mb": getattr(settings, "RESUME_EXTRACT_MEMORY_MB", 512),
+        "cache_timeout": getattr(settings, "RESUME_TEXT_CACHE_TIMEOUT", 60 * 60 * 24),
+    }
+
+
+def _init_worker(memory_mb):
+    """Pool initializer: cap the worker's address space."""
+    try:
+        import pypdf  # noqa: F401  (import once, outside the per-file alarm)
+    except ImportError:
+        pass
+    try:
+        import resource
+
+        limit = memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except Exception:
+        # Not available on every platform; the timeout still applies
+        pass
+
+
+def _extract_in_worker(path, max_pages, max_chars, max_tokens, timeout):
+    """Runs inside a pool process. Raises on timeout or parse failure."""
+    import signal
+
+    def _on_timeout(signum, frame):
+        raise ExtractionTimeout(f"extraction exceeded {timeout}s")
+
+    signal.signal(signal.SIGALRM, _on_timeout)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return extract_text(path, max_chars=max_chars, max_tokens=max_tokens, max_pages=max_pages)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def _get_pool():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                limits = _get_limits()
+                # spawn, not fork: the parent may hold torch threads and DB connections
+                _pool = ProcessPoolExecutor(
+                    max_workers=limits["workers"],
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(limits["memory_mb"],),
+                )
+    return _pool
+
+
+def _reset_pool(pool=None):
+    """
+    Tear down the pool, killing any worker stuck past its deadline. When
+    ``pool`` is given it is only torn down if it is still the current one, so
+    a thread reporting a failure late does not kill a pool already replaced.
+    """
+    global _pool
+    with _pool_lock:
+        if pool is not None and pool is not _pool:
+            return
+        pool, _pool = _pool, None
+    if pool is None:
+        return
+    # ProcessPoolExecutor has no public API to kill a busy worker
+    for process in list(getattr(pool, "_processes", {}).values()):
+        try:
+            process.terminate()
+        except Exception:
+            pass
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _cache_key(path, limits):
+    """Cache key for the file's current contents, extracted under the current page/character/token limits."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    raw = (
+        f"{path}:{stat.st_mtime_ns}:{stat.st_size}:"
+        f"{limits['max_pages']}:{limits['max_chars']}:{limits['max_tokens']}"
+    )
+    return "resume_text:" + hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def extract_resume_texts(paths):
+    """
+    Extract text for many resume paths in parallel.
+    Returns {path: text}; failed or timed-out files map to "".
+    """
+    limits = _get_limits()
+    results = {}
+    pending = {}
+
+    for path in dict.fromkeys(paths):
+        key = _cache_key(path, limits)
+        if key is None:
+            results[path] = ""
+            continue
+        cached = cache.get(key)
+        if cached is not None:
+            results[path] = "" if cached == EXTRACTION_FAILED else cached
+        else:
+            pending[path] = key
+
+    if not pending:
+        return results
+
+    try:
+        pool = _get_pool()
+        futures = {
+            path: pool.submit(
+                _extract_in_worker,
+                path, limits["max_pages"], limits["max_chars"], limits["max_tokens"], limits["timeout"],
+            )
+            for path in pending
+        }
+    except Exception as exc:
+        logger.warning(f"Extraction pool unavailable, parsing inline: {exc}")
+        futures = None
+
+    recycled = False
+    for path, key in pending.items():
+        text = None
+        try:
+            if futures is None:
+                text = extract_text(
+                    path, max_chars=limits["max_chars"], max_tokens=limits["max_tokens"], max_pages=limits["max_pages"]
+                )
+            else:
+                text = futures[path].result(timeout=limits["timeout"] + _TIMEOUT_GRACE_SECONDS)
+        except FutureTimeoutError:
+            # Note: on 3.11+ this is the builtin TimeoutError, hence ExtractionTimeout in workers
+            logger.warning(f"Resume extraction worker wedged on {path}; recycling pool")
+            _reset_pool(pool)
+            recycled = True
+        except BrokenProcessPool as exc:
+            if recycled:
+                results[path] = ""
+                continue
+            logger.warning(f"Resume extraction worker died on {path}: {exc}")
+            _reset_pool(pool)
+            recycled = True
+        except Exception as exc:
+            if recycled:
+                # Collateral of a pool recycle, not this file's fault; retry next time
+                results[path] = ""
+                continue
+            logger.warning(f"Resume text read failed for {path}: {exc}")
+
+        cache.set(key, text if text is not None else EXTRACTION_FAILED, limits["cache_timeout"])
+        results[path] = text or ""
+
+    return results
+
+
+def extract_resume_text(path):
+    """Extract a single resume; see extract_resume_texts."""
+    return extract_resume_texts([path]).get(path, "")
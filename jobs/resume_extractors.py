@@ -0,0 +1,99 @@
+"""
+Pluggable, streaming resume text extractors.
+
+Each extractor is a generator that yields text one page (PDF) or one
+paragraph (DOCX) at a time, so callers can stop as soon as they have
+enough text instead of materialising the whole document.
+"""
+import os
+import zipfile
+from xml.etree import ElementTree
+
+_EXTRACTORS = {}
+
+_WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+def register_extractor(*extensions):
+    """Register a generator ``fn(path, max_pages=None)`` for file extensions."""
+    def decorator(func):
+        for ext in extensions:
+            _EXTRACTORS[ext.lower()] = func
+        return func
+    return decorator
+
+
+def get_extractor(path):
+    _, ext = os.path.splitext(path or "")
+    return _EXTRACTORS.get(ext.lower())
+
+
+def is_supported(path):
+    return get_extractor(path) is not None
+
+
+@register_extractor(".pdf")
+def iter_pdf_text(path, max_pages=None):
+    """Yield extracted text page by page."""
+    from pypdf import PdfReader
+
+    reader = PdfReader(path)
+    for index, page in enumerate(reader.pages):
+        if max_pages is not None and index >= max_pages:
+            return
+        yield page.extract_text() or ""
+
+
+@register_extractor(".docx")
+def iter_docx_text(path, max_pages=None):
+    """Yield paragraph text from word/document.xml without loading the tree."""
+    with zipfile.ZipFile(path) as archive:
+        with archive.open("word/document.xml") as document:
+            for _, elem in ElementTree.iterparse(document, events=("end",)):
+                if elem.tag != f"{_WORD_NS}p":
+                    continue
+                parts = []
+                for node in elem.iter():
+                    if node.tag == f"{_WORD_NS}t" and node.text:
+                        parts.append(node.text)
+                    elif node.tag == f"{_WORD_NS}tab":
+                        parts.append("\t")
+                    elif node.tag in (f"{_WORD_NS}br", f"{_WORD_NS}cr"):
+                        parts.append("\n")
+                elem.clear()
+                text = "".join(parts).strip()
+                if text:
+                    yield text
+
+
+def extract_text(path, max_chars=None, max_tokens=None, max_pages=None):
+    """
+    Pull chunks from the file's extractor until a character or whitespace-token
+    budget is reached. Returns "" for unsupported file types.
+    """
+    extractor = get_extractor(path)
+    if extractor is None:
+        return ""
+
+    chunks = []
+    chars = 0
+    tokens = 0
+    for chunk in extractor(path, max_pages=max_pages):
+        if not chunk:
+            continue
+        last = False
+        if max_tokens is not None:
+            words = chunk.split()
+            if tokens + len(words) >= max_tokens:
+                chunk = " ".join(words[:max_tokens - tokens])
+                last = True
+            tokens += len(words)
+        if max_chars is not None and chars + len(chunk) >= max_chars:
+            chunks.append(chunk[:max_chars - chars])
+            break
+        chunks.append(chunk)
+        chars += len(chunk) + 1
+        if last:
+            break
+
+    return "\n".join(chunks).strip()
@@ -0,0 +1,257 @@
+"""
+Single-pass resume feature extraction.
+
+A resume is lowercased and tokenised once into a ResumeFeatures record
+(keyword token set, hits against the global skill vocabulary, years of
+experience and education markers). Scoring a resume against any number of jobs then reads the
+record instead of rescanning the text per job.
+Records are cached per process, keyed by a hash of the text.
+"""
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+from django.core.cache import cache
+from django.utils import timezone
+
+SKILL_VOCAB_CACHE_KEY = "resume_features:skill_vocabulary"
+SKILL_VOCAB_TTL = 300  # seconds
+FEATURE_CACHE_SIZE = 512
+
+_YEARS_RE = re.compile(r"(\d{1,2})\+?\s*(?:years|yrs)", re.IGNORECASE)
+
+_MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+_MONTH = r"(?:(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+|(\d{1,2})[/.-])?"
+_DATE_RANGE_RE = re.compile(
+    rf"\b{_MONTH}((?:19|20)\d{{2}})\s*(?:-|–|—|to|until)\s*"
+    rf"(?:{_MONTH}((?:19|20)\d{{2}})|(present|current|now|today|date))\b",
+    re.IGNORECASE,
+)
+
+# Skill tokens keep "+", "#" and inner dots ("c++", "c#", "node.js"); anything else separates
+_SKILL_TOKEN_RE = re.compile(r"[a-z0-9+#]+(?:\.[a-z0-9+#]+)*")
+
+# Highest level first
+_EDUCATION_PATTERNS = {
+    "phd": re.compile(r"\b(?:ph\.?\s?d|doctorate|doctoral)\b"),
+    "masters": re.compile(r"\b(?:master'?s|master of|m\.?sc|mba|m\.?tech|m\.s\.|m\.a\.)"),
+    "bachelors": re.compile(r"\b(?:bachelor'?s|bachelor of|b\.?sc|b\.?tech|b\.e\.|b\.s\.|b\.a\.|bba|bca)"),
+    "diploma": re.compile(r"\bdiploma\b"),
+    "high_school": re.compile(r"\b(?:high school|higher secondary|secondary school|slc)\b"),
+}
+EDUCATION_LABELS = {
+    "phd": "PhD",
+    "masters": "Master's degree",
+    "bachelors": "Bachelor's degree",
+    "diploma": "Diploma",
+    "high_school": "High school",
+}
+
+
+_SCHOOL_RE = re.compile(r"\b(?:university|college|school|institute|academy|graduat\w*|degree|gpa|cgpa)\b")
+_ENTRY_SPLIT_RE = re.compile(r"\.\s|[;|•]")  # separates entries sharing one line
+_EDUCATION_HEADING_RE = re.compile(r"^\W*(?:education|academic\w*|qualifications?)\b")
+_EXPERIENCE_HEADING_RE = re.compile(
+    r"^\W*(?:(?:work|professional|employment|career)\s+)?(?:experience|employment|work history|career history)\b"
+)
+
+
+def _education_levels(line):
+    return [level for level, pattern in _EDUCATION_PATTERNS.items() if pattern.search(line)]
+
+
+def _is_education_line(line):
+    return bool(_SCHOOL_RE.search(line)) or bool(_education_levels(line))
+
+
+def keyword_tokens(text):
+    """Keyword token set: whitespace-split, lowercased words longer than two characters."""
+    return frozenset(w.lower().strip() for w in str(text).split() if len(w) > 2)
+
+
+def _month_index(month_name, month_number, year):
+    month = 1
+    if month_name:
+        month = _MONTHS[month_name[:3].lower()]
+    elif month_number and 1 <= int(month_number) <= 12:
+        month = int(month_number)
+    return int(year) * 12 + month - 1
+
+
+def _scan_history(text, today):
+    """
+    (range years, education levels) from one pass over the resume's lines.
+
+    Range years are the total years covered by employment date ranges
+    ("Jan 2018 - Present"), overlaps merged, or None. Study is left out:
+    ranges under an Education heading and, outside an Experience section,
+    ranges whose own entry names a degree or school ("BSc Physics 2004 -
+    2008") or that sit alone below such a line ("BSc Computer Science" /
+    "2019 - 2023"). Education levels are the degrees those lines name,
+    highest first.
+    """
+    current = today.year * 12 + today.month - 1
+    spans = []
+    levels = set()
+    section = None
+    previous_is_education = False
+    for line in text.lower().splitlines():
+        stripped = line.strip()
+        if len(stripped) <= 40 and _EDUCATION_HEADING_RE.match(stripped):
+            section = "education"
+        elif len(stripped) <= 40 and _EXPERIENCE_HEADING_RE.match(stripped):
+            section = "experience"
+        entry_start = 0
+        for match in _DATE_RANGE_RE.finditer(line):
+            entry = _ENTRY_SPLIT_RE.split(line[entry_start:match.start()])[-1]
+            entry_start = match.end()
+            if section == "education":
+                continue
+            if section != "experience" and (
+                _is_education_line(entry) or (not entry.strip() and previous_is_education)
+            ):
+                continue
+            start_name, start_num, start_year, end_name, end_num, end_year, open_end = match.groups()
+            start = _month_index(start_name, start_num, start_year)
+            end = current if open_end else _month_index(end_name, end_num, end_year)
+            if start <= end <= current:
+                spans.append((start, end))
+        if stripped:
+            line_levels = _education_levels(line)
+            levels.update(line_levels)
+            previous_is_education = section != "experience" and (bool(line_levels) or bool(_SCHOOL_RE.search(line)))
+    education = tuple(level for level in _EDUCATION_PATTERNS if level in levels)
+    if not spans:
+        return None, education
+
+    total = 0
+    spans.sort()
+    run_start, run_end = spans[0]
+    for start, end in spans[1:]:
+        if start > run_end:
+            total += run_end - run_start
+            run_start, run_end = start, end
+        else:
+            run_end = max(run_end, end)
+    total += run_end - run_start
+    return total // 12, education
+
+
+def _skill_tokens(text):
+    return tuple(_SKILL_TOKEN_RE.findall(text.lower()))
+
+
+@lru_cache(maxsize=4)
+def _vocabulary_grams(vocabulary):
+    """({token tuple: skills spelled that way}, longest tuple) for a skill vocabulary."""
+    grams = {}
+    for skill in vocabulary:
+        tokens = _skill_tokens(skill)
+        if tokens:
+            grams.setdefault(tokens, []).append(skill)
+    return grams, max((len(tokens) for tokens in grams), default=0)
+
+
+def _skill_hits(tokens, vocabulary):
+    """Vocabulary skills appearing as whole token sequences in ``tokens`` (one pass over the resume)."""
+    grams, longest = _vocabulary_grams(vocabulary)
+    hits = set()
+    for n in range(1, longest + 1):
+        for i in range(len(tokens) - n + 1):
+            skills = grams.get(tokens[i:i + n])
+            if skills:
+                hits.update(skills)
+    return frozenset(hits)
+
+
+class ResumeFeatures:
+    """Everything job scoring needs from a resume, computed in one pass."""
+
+    __slots__ = (
+        "text_lower", "tokens", "skill_hits", "stated_years", "range_years", "years", "education", "_skill_memo"
+    )
+
+    def __init__(self, text, vocabulary=frozenset(), today=None):
+        self.text_lower = text.lower()
+        self.tokens = keyword_tokens(text)
+        self.skill_hits = _skill_hits(_skill_tokens(self.text_lower), vocabulary) if vocabulary else frozenset()
+
+        stated = [int(match) for match in _YEARS_RE.findall(text)]
+        self.stated_years = max(stated) if stated else None
+        # Degree levels named in the resume (EDUCATION_LABELS keys), highest first
+        self.range_years, self.education = _scan_history(text, today or timezone.now().date())
+        candidates = [value for value in (self.stated_years, self.range_years) if value is not None]
+        self.years = max(candidates) if candidates else None
+        self._skill_memo = {}
+
+    def has_skill(self, skill):
+        """
+        Case-insensitive substring match (as job scoring always did). Whole-token
+        vocabulary hits are a set lookup; anything else is searched once and memoised.
+        """
+        skill_lower = skill.strip().lower()
+        if skill_lower in self.skill_hits:
+            return True
+        hit = self._skill_memo.get(skill_lower)
+        if hit is None:
+            hit = self._skill_memo[skill_lower] = skill_lower in self.text_lower
+        return hit
+
+    def match_skills(self, job_skills):
+        """Split ``job_skills`` into (matched, missing), preserving their order."""
+        matched, missing = [], []
+        for skill in job_skills:
+            if not skill:
+                continue
+            (matched if self.has_skill(skill) else missing).append(skill)
+        return matched, missing
+
+    def keyword_similarity(self, other_tokens):
+        """Shared-keyword similarity (0-100) against another token set."""
+        if not self.tokens or not other_tokens:
+            return 0.0
+        return (len(self.tokens & other_tokens) / max(len(self.tokens), len(other_tokens))) * 100
+
+
+def skill_vocabulary():
+    """Lowercased union of every job's required skills (shared cache, short TTL)."""
+    vocabulary = cache.get(SKILL_VOCAB_CACHE_KEY)
+    if vocabulary is None:
+        from jobs.models import Job
+
+        vocabulary = set()
+        for skills in Job.objects.open().exclude(skills_required="").values_list("skills_required", flat=True):
+            vocabulary.update(s.strip().lower() for s in skills.split(",") if s.strip())
+        vocabulary = frozenset(vocabulary)
+        cache.set(SKILL_VOCAB_CACHE_KEY, vocabulary, SKILL_VOCAB_TTL)
+    return vocabulary
+
+
+_feature_cache = OrderedDict()
+_feature_lock = threading.Lock()
+
+
+def extract_features(text, vocabulary=None):
+    """Return the ResumeFeatures record for ``text``, reusing a cached one when possible."""
+    text = text or ""
+    if vocabulary is None:
+        vocabulary = skill_vocabulary()
+    key = (hashlib.sha1(text.encode("utf-8")).hexdigest(), hash(vocabulary))
+
+    with _feature_lock:
+        features = _feature_cache.get(key)
+        if features is not None:
+            _feature_cache.move_to_end(key)
+            return features
+
+    features = ResumeFeatures(text, vocabulary)
+    with _feature_lock:
+        _feature_cache[key] = features
+        while len(_feature_cache) > FEATURE_CACHE_SIZE:
+            _feature_cache.popitem(last=False)
+    return features
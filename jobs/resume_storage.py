@@ -0,0 +1,66 @@
+"""
+Content-addressed resume storage.
+
+Uploads are hashed incrementally while Django streams them in (see the
+upload handlers below, wired up in settings.FILE_UPLOAD_HANDLERS), then
+stored once under their SHA-256. Identical CVs uploaded to many jobs share
+one file, one extracted text and one embedding via ResumeBlob.
+"""
+import hashlib
+import os
+
+from django.core.files.uploadhandler import MemoryFileUploadHandler, TemporaryFileUploadHandler
+
+HASH_CHUNK_SIZE = 64 * 1024
+
+
+class _HashingUploadMixin:
+    """Compute SHA-256 of each uploaded file chunk by chunk as it arrives."""
+
+    def new_file(self, *args, **kwargs):
+        # Set up before super(): the memory handler raises StopFutureHandlers
+        self._hasher = hashlib.sha256()
+        super().new_file(*args, **kwargs)
+
+    def receive_data_chunk(self, raw_data, start):
+        self._hasher.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        uploaded = super().file_complete(file_size)
+        if uploaded is not None:
+            uploaded.content_sha256 = self._hasher.hexdigest()
+        return uploaded
+
+
+class HashingMemoryFileUploadHandler(_HashingUploadMixin, MemoryFileUploadHandler):
+    pass
+
+
+class HashingTemporaryFileUploadHandler(_HashingUploadMixin, TemporaryFileUploadHandler):
+    pass
+
+
+def file_sha256(file_obj):
+    """
+    Return the SHA-256 of an uploaded/stored file, reusing the digest computed
+    at upload time when available.
+    """
+    digest = getattr(file_obj, "content_sha256", None)
+    if digest:
+        return digest
+
+    hasher = hashlib.sha256()
+    if hasattr(file_obj, "seek"):
+        file_obj.seek(0)
+    for chunk in file_obj.chunks(HASH_CHUNK_SIZE):
+        hasher.update(chunk)
+    if hasattr(file_obj, "seek"):
+        file_obj.seek(0)
+    return hasher.hexdigest()
+
+
+def blob_upload_to(instance, filename):
+    """resumes/sha256/ab/abcdef....pdf"""
+    _, ext = os.path.splitext(filename)
+    return f"resumes/sha256/{instance.sha256[:2]}/{instance.sha256}{ext.lower()}"
@@ -0,0 +1,180 @@
+"""
+Periodic maintenance scheduler.
+
+Jobs are registered with @periodic in jobs/maintenance.py and run by
+`manage.py run_scheduler` (or, with SCHEDULER_IN_PROCESS, by a daemon thread
+in each web process). Every job has a ScheduledJob row with its schedule,
+a lease and its run statistics:
+
+- a scheduler runs a due job only after taking its lease with a conditional
+  UPDATE, so however many nodes run a scheduler, each run happens once; the
+  lease of a node that died mid-run expires after SCHEDULER_LEASE_SECONDS;
+- missed runs (scheduler down, job overran its interval) are caught up with
+  a single run, then the job continues on its original grid;
+- ``exclusive=False`` jobs warm per-process state, so they only run in web
+  processes, on a daemon thread that every web process starts (unless
+  SCHEDULER_LOCAL_JOBS is off), each on its own clock and without the
+  lease; a standalone `run_scheduler` would only warm its own memory.
+
+The interval in code is only the default; it can be changed (or the job
+disabled) in the Django admin.
+"""
+import logging
+import threading
+import time
+import traceback
+from collections import namedtuple
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import F, Q
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+logger = logging.getLogger('jobs')
+
+Periodic = namedtuple("Periodic", "name func every exclusive")
+
+PERIODIC = {}
+
+
+def periodic(name, every, exclusive=True):
+    """Register ``func`` to run every ``every`` seconds."""
+    def register(func):
+        PERIODIC[name] = Periodic(name, func, every, exclusive)
+        return func
+    return register
+
+
+def next_run_after(scheduled_at, interval, now):
+    """The first slot on ``scheduled_at``'s grid after ``now``, and how many slots were missed."""
+    step = timedelta(seconds=interval)
+    if scheduled_at > now:
+        return scheduled_at, 0
+    missed = int((now - scheduled_at) / step)
+    return scheduled_at + (missed + 1) * step, missed
+
+
+class Scheduler:
+    def __init__(self, owner, local_jobs=False, exclusive_jobs=True):
+        self.owner = owner
+        self.local_jobs = local_jobs  # run exclusive=False jobs (only useful inside a web process)
+        self.exclusive_jobs = exclusive_jobs
+        self._local_next = {}  # non-exclusive jobs: name -> monotonic time of the next run
+        self._synced = False
+
+    def sync(self):
+        """Create rows for newly registered jobs (existing rows keep their admin settings)."""
+        from jobs.models import ScheduledJob
+
+        existing = set(ScheduledJob.objects.values_list("name", flat=True))
+        ScheduledJob.objects.bulk_create(
+            [
+                ScheduledJob(name=job.name, interval_seconds=job.every)
+                for job in PERIODIC.values() if job.name not in existing
+            ],
+            ignore_conflicts=True,
+        )
+        self._synced = True
+
+    def run_pending(self, force=()):
+        """Run every job that is due, or only the jobs named in ``force``; returns {name: succeeded}."""
+        from jobs.models import ScheduledJob
+
+        if not self._synced:
+            self.sync()
+        results = {}
+        now = timezone.now()
+        for row in ScheduledJob.objects.filter(name__in=list(force or PERIODIC)):
+            job = PERIODIC[row.name]
+            if job.exclusive:
+                if not self.exclusive_jobs:
+                    continue
+                due = row.enabled and row.next_run_at <= now
+                if (due or row.name in force) and self._acquire(row, now, force=row.name in force):
+                    results[row.name] = self._run(job, row)
+            elif self.local_jobs:
+                due = row.enabled and time.monotonic() >= self._local_next.get(row.name, 0)
+                if due or row.name in force:
+                    self._local_next[row.name] = time.monotonic() + row.interval_seconds
+                    results[row.name] = self._run(job, row)
+        return results
+
+    def _acquire(self, row, now, force=False):
+        from jobs.models import ScheduledJob
+
+        lease = getattr(settings, "SCHEDULER_LEASE_SECONDS", 1800)
+        claim = ScheduledJob.objects.filter(pk=row.pk).filter(
+            Q(lease_expires_at__isnull=True) | Q(lease_expires_at__lte=now)
+        )
+        if not force:
+            # Another node may have run it since we read the row
+            claim = claim.filter(next_run_at__lte=now)
+        return bool(claim.update(lease_owner=self.owner, lease_expires_at=now + timedelta(seconds=lease)))
+
+    def _run(self, job, row):
+        from jobs.models import ScheduledJob
+
+        started_at = timezone.now()
+        start = time.perf_counter()
+        error = ""
+        try:
+            job.func()
+        except Exception as exc:
+            error = traceback.format_exc()[-4000:]
+            logger.error(f"Scheduled job {job.name} failed: {exc}")
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        fields = {
+            "last_started_at": started_at,
+            "last_status": "failed" if error else "ok",
+            "last_error": error,
+            "last_duration_ms": elapsed_ms,
+            "max_duration_ms": Greatest(F("max_duration_ms"), elapsed_ms),
+            "total_duration_ms": F("total_duration_ms") + elapsed_ms,
+            "run_count": F("run_count") + 1,
+            "failure_count": F("failure_count") + (1 if error else 0),
+            "consecutive_failures": F("consecutive_failures") + 1 if error else 0,
+        }
+        if job.exclusive:
+            next_run_at, missed = next_run_after(row.next_run_at, row.interval_seconds, timezone.now())
+            if missed:
+                logger.info(f"Scheduled job {job.name}: caught up {missed} missed runs with one")
+            fields.update(next_run_at=next_run_at, lease_owner="", lease_expires_at=None)
+        ScheduledJob.objects.filter(pk=row.pk).update(**fields)
+        logger.info(f"Scheduled job {job.name} {'failed' if error else 'ran'} in {elapsed_ms:.0f}ms")
+        return not error
+
+    def run_forever(self, stop, tick=None):
+        """Run due jobs every ``tick`` seconds (SCHEDULER_TICK_SECONDS) until ``stop`` is set."""
+        tick = tick or getattr(settings, "SCHEDULER_TICK_SECONDS", 30)
+        while not stop.is_set():
+            try:
+                self.run_pending()
+            except Exception as exc:
+                logger.error(f"Scheduler tick failed: {exc}")
+            finally:
+                close_old_connections()
+            stop.wait(tick)
+
+
+_thread = None
+
+
+def start_in_process(owner, exclusive_jobs=True):
+    """
+    Start the scheduler on a daemon thread of this process (once): the
+    per-process jobs, plus the exclusive ones unless ``exclusive_jobs`` is off.
+    """
+    global _thread
+    if _thread is not None:
+        return _thread
+    from jobs import maintenance  # noqa: F401  (registers the periodic jobs)
+
+    _thread = threading.Thread(
+        target=Scheduler(owner, local_jobs=True, exclusive_jobs=exclusive_jobs).run_forever,
+        args=(threading.Event(),), name="scheduler", daemon=True,
+    )
+    _thread.start()
+    return _thread
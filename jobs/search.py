@@ -0,0 +1,102 @@
+"""
+Full-text search over job postings.
+
+Title, skills and description/requirements are indexed with stemming and
+field weights (title > skills > body), and search_jobs() gives the same
+queryset API on every backend:
+
+- PostgreSQL: a generated ``search_vector`` tsvector column on jobs_job
+  with a GIN index (migration 0017); the database keeps it current.
+- SQLite: an FTS5 shadow table (porter stemmer) keyed by job id, kept in
+  sync by the Job save/delete signals; rebuild() repopulates it.
+- Anything else: case-insensitive substring match, unranked.
+"""
+import re
+
+from django.db import connection
+from django.db.models import FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+FTS_TABLE = "jobs_job_fts"
+_WORD_RE = re.compile(r"\w[\w+#.]*", re.UNICODE)
+
+# Weights for bm25() per FTS5 column (title, skills_required, body)
+_FTS_WEIGHTS = "10.0, 5.0, 1.0"
+
+
+def _fts_query(text):
+    """User text -> an FTS5 expression of quoted terms (all required), or '' if nothing searchable."""
+    terms = [term.strip(".") for term in _WORD_RE.findall(text or "")]
+    return " ".join(f'"{term}"' for term in terms if term)
+
+
+def search_jobs(jobs, text):
+    """
+    Narrow the Job queryset ``jobs`` to postings matching ``text``,
+    annotated with ``search_rank`` (higher is better). Ordering is left to
+    the caller.
+    """
+    vendor = connection.vendor
+    if vendor == "postgresql":
+        rank = RawSQL(
+            "ts_rank(jobs_job.search_vector, websearch_to_tsquery('english', %s))", [text], output_field=FloatField()
+        )
+        matches = RawSQL(
+            "SELECT id FROM jobs_job WHERE search_vector @@ websearch_to_tsquery('english', %s)", [text]
+        )
+        return jobs.filter(pk__in=matches).annotate(search_rank=rank)
+
+    if vendor == "sqlite":
+        expression = _fts_query(text)
+        if not expression:
+            return jobs.none().annotate(search_rank=Value(0.0, output_field=FloatField()))
+        # bm25() is lower-is-better; negate so every backend sorts descending
+        rank = RawSQL(
+            f"(SELECT -bm25({FTS_TABLE}, {_FTS_WEIGHTS}) FROM {FTS_TABLE} "
+            f"WHERE {FTS_TABLE} MATCH %s AND rowid = jobs_job.id)",
+            [expression],
+            output_field=FloatField(),
+        )
+        matches = RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [expression])
+        return jobs.filter(pk__in=matches).annotate(search_rank=rank)
+
+    return jobs.filter(Q(title__icontains=text) | Q(description__icontains=text)).annotate(
+        search_rank=Value(0.0, output_field=FloatField())
+    )
+
+
+def _row(job):
+    return (job.pk, job.title, job.skills_required, f"{job.description}\n{job.requirements}")
+
+
+def index_job(job):
+    """Add or refresh ``job`` in the SQLite FTS table (PostgreSQL maintains its own column)."""
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [job.pk])
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, title, skills_required, body) VALUES (%s, %s, %s, %s)", _row(job)
+        )
+
+
+def remove_job(job_id):
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [job_id])
+
+
+def rebuild():
+    """Repopulate the SQLite FTS table from jobs_job; returns the number of jobs indexed."""
+    from jobs.models import Job
+
+    if connection.vendor != "sqlite":
+        return Job.objects.count()
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, title, skills_required, body) "
+            "SELECT id, title, skills_required, description || char(10) || requirements FROM jobs_job"
+        )
+        return cursor.rowcount
@@ -0,0 +1,122 @@
+"""
+Model signal handlers for the jobs app.
+"""
+import logging
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+
+from accounts.models import Profile
+
+from .models import Job, JobApplication, JobPreference, JobView
+
+logger = logging.getLogger('jobs')
+
+# Sent with ``blob_ids`` after text is first extracted from ResumeBlobs
+resume_text_extracted = Signal()
+
+
+def _queue_extraction(blob_id):
+    """Have a worker extract a resume's text before any ranking request needs it."""
+    from .models import ResumeBlob
+    from .tasks import queue_resume_extraction
+
+    if ResumeBlob.objects.filter(pk=blob_id, text_extracted_at__isnull=True).exists():
+        queue_resume_extraction(blob_id)
+
+
+def _reindex_candidate(user_id):
+    """Refresh the candidate's skill bitmaps once the surrounding transaction commits."""
+    def run():
+        from .skill_index import index_candidate
+        try:
+            index_candidate(user_id)
+        except Exception as exc:
+            logger.error(f"Skill index update failed for user {user_id}: {exc}")
+
+    transaction.on_commit(run)
+
+
+@receiver(post_save, sender=Profile)
+def profile_saved(sender, instance, **kwargs):
+    _reindex_candidate(instance.user_id)
+    if instance.resume_blob_id:
+        _queue_extraction(instance.resume_blob_id)
+    if instance.user_type == 'jobseeker':
+        from .tasks import queue_feed_refresh
+        queue_feed_refresh(instance.user_id)
+
+
+@receiver(post_delete, sender=Profile)
+def profile_deleted(sender, instance, **kwargs):
+    _reindex_candidate(instance.user_id)
+
+
+@receiver(post_save, sender=JobApplication)
+def application_saved(sender, instance, created, update_fields=None, **kwargs):
+    # Only a new resume can change what we know about the applicant
+    if created or (update_fields and {"resume", "resume_blob"} & set(update_fields)):
+        _reindex_candidate(instance.applicant_id)
+    if created:
+        # Score just this application in the background; the rest of the ranking is unchanged
+        from .tasks import queue_application_scoring
+        if instance.resume_blob_id:
+            _queue_extraction(instance.resume_blob_id)
+        queue_application_scoring(instance.pk)
+        # Applying is a behavioural signal and removes the job from the seeker's candidates
+        from .tasks import queue_feed_refresh
+        queue_feed_refresh(instance.applicant_id)
+
+
+@receiver(post_save, sender=JobPreference)
+def preference_saved(sender, instance, **kwargs):
+    from .tasks import queue_feed_refresh
+    queue_feed_refresh(instance.user_id)
+
+
+@receiver(post_save, sender=JobView)
+def job_view_saved(sender, instance, **kwargs):
+    # Only engaged views feed the behavioural embedding (see _build_user_embedding)
+    if instance.time_spent_seconds >= 10:
+        from .tasks import queue_feed_refresh
+        queue_feed_refresh(instance.user_id)
+
+
+@receiver(post_save, sender=Job)
+def job_saved(sender, instance, created, **kwargs):
+    from .search import index_job
+    index_job(instance)
+
+    # Edits are re-indexed lazily (by updated_at); closed postings leave the lexical index
+    if not instance.is_active:
+        from .lexical import job_index
+        job_index().remove(instance.pk)
+        return
+
+    from .tasks import queue_job_embedding, queue_job_feeds, queue_job_ranking
+    queue_job_embedding(instance.pk)
+    queue_job_feeds(instance.pk)
+    if not created:
+        # The description may have changed; existing applicants need re-scoring
+        queue_job_ranking(instance.pk)
+
+
+@receiver(post_delete, sender=Job)
+def job_deleted(sender, instance, **kwargs):
+    from .lexical import job_index
+    from .search import remove_job
+    job_index().remove(instance.pk)
+    remove_job(instance.pk)
+
+
+@receiver(resume_text_extracted)
+def resume_text_ready(sender, blob_ids, **kwargs):
+    def run():
+        from .skill_index import reindex_blob_owners
+        try:
+            reindex_blob_owners(blob_ids)
+        except Exception as exc:
+            logger.error(f"Skill index update failed for resumes {blob_ids}: {exc}")
+
+    transaction.on_commit(run)
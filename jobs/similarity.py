@@ -0,0 +1,65 @@
+"""
+Cosine similarity and top-K helpers on plain NumPy.
+
+Replaces sklearn.metrics.pairwise.cosine_similarity on the request path:
+vectors are L2-normalised once, after which cosine is a single matrix
+product. Everything works in float32, which is what the encoder emits.
+"""
+import numpy as np
+
+_EPS = 1e-12
+
+
+def normalize(vectors):
+    """
+    L2-normalise a vector or each row of a matrix (float32 copy).
+    Zero vectors stay zero instead of turning into NaN.
+    """
+    array = np.asarray(vectors, dtype=np.float32)
+    if array.ndim == 1:
+        norm = np.linalg.norm(array)
+        return array / norm if norm > _EPS else np.zeros_like(array)
+
+    norms = np.linalg.norm(array, axis=1, keepdims=True)
+    norms[norms < _EPS] = 1.0
+    return array / norms
+
+
+def cosine_to_vector(matrix, vector, normalized=False):
+    """Cosine similarity of every row of ``matrix`` with ``vector``; returns shape (n,)."""
+    if not normalized:
+        matrix = normalize(matrix)
+        vector = normalize(vector)
+    return np.asarray(matrix, dtype=np.float32) @ np.asarray(vector, dtype=np.float32)
+
+
+def cosine_matrix(a, b, normalized=False):
+    """Pairwise cosine similarity between the rows of ``a`` and ``b``; returns (len(a), len(b))."""
+    if not normalized:
+        a = normalize(a)
+        b = normalize(b)
+    return np.asarray(a, dtype=np.float32) @ np.asarray(b, dtype=np.float32).T
+
+
+def cosine(u, v):
+    """Cosine similarity of two single vectors as a Python float."""
+    return float(normalize(u) @ normalize(v))
+
+
+def top_k(scores, k):
+    """Indices of the ``k`` highest scores, best first (O(n) selection, then a small sort)."""
+    scores = np.asarray(scores)
+    n = scores.shape[0]
+    if k is None or k >= n:
+        return np.argsort(-scores, kind="stable")
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    candidates = np.argpartition(-scores, k - 1)[:k]
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+def top_k_cosine(matrix, vector, k, normalized=False):
+    """Return (indices, scores) of the ``k`` rows most similar to ``vector``."""
+    scores = cosine_to_vector(matrix, vector, normalized=normalized)
+    indices = top_k(scores, k)
+    return indices, scores[indices]
@@ -0,0 +1,371 @@
+"""
+Bitmap skill index for hard-filtering candidates.
+
+Each skill (and each experience bucket) maps to a bitset with bit
+``user_id`` set for every candidate that has it; bitsets are plain Python
+ints persisted in SkillBitmap rows. A recruiter expression such as
+
+    python AND (django OR flask) AND NOT php AND years>=3
+
+is answered with a handful of integer ANDs/ORs, so only the surviving
+applicants reach the encoder. Entries are refreshed when a profile is saved
+and when resume text is extracted (see jobs/signals.py).
+"""
+import logging
+import re
+
+from django.db import transaction
+
+from .resume_features import extract_features
+
+logger = logging.getLogger('jobs')
+
+EXPERIENCE_BUCKETS = (1, 2, 3, 5, 7, 10, 15)
+ALL_KEY = "all"
+
+
+class SkillQueryError(ValueError):
+    """The boolean skill expression could not be parsed."""
+
+
+# ---------------------------------------------------------------------------
+# Bitsets
+
+def _to_int(raw):
+    return int.from_bytes(bytes(raw or b""), "little")
+
+
+def _to_bytes(bits):
+    return bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+
+
+def bit_ids(bits):
+    """Ids of the set bits, ascending."""
+    return [index for index, bit in enumerate(bin(bits)[:1:-1]) if bit == "1"]
+
+
+def _skill_key(skill):
+    return f"skill:{skill.strip().lower()}"
+
+
+def _exp_key(years):
+    return f"exp:{years}"
+
+
+def _keys_for(skills, years):
+    keys = {ALL_KEY}
+    keys.update(_skill_key(skill) for skill in skills)
+    keys.update(_exp_key(bucket) for bucket in EXPERIENCE_BUCKETS if years >= bucket)
+    return keys
+
+
+# ---------------------------------------------------------------------------
+# Maintenance
+
+def candidate_facts(user):
+    """(skills, experience_years) for a job seeker from profile fields and resume text."""
+    from django.db.models import Q
+    from jobs.models import ResumeBlob
+
+    profile = user.profile
+    skills = {s.strip().lower() for s in profile.get_skills_list() if s.strip()}
+    years = profile.experience_years or 0
+
+    blobs = ResumeBlob.objects.filter(
+        Q(profiles__user=user) | Q(applications__applicant=user)
+    ).exclude(text="").values_list("text", flat=True).distinct()
+    for text in blobs:
+        features = extract_features(text)
+        skills |= features.skill_hits
+        if features.years:
+            years = max(years, features.years)
+    return skills, years
+
+
+def _apply(user_id, add_keys, remove_keys):
+    """Set/clear ``user_id`` in the given bitmaps (rows locked for the update)."""
+    from jobs.models import SkillBitmap
+
+    keys = set(add_keys) | set(remove_keys)
+    if not keys:
+        return
+    bit = 1 << user_id
+    existing = {row.key: row for row in SkillBitmap.objects.select_for_update().filter(key__in=keys)}
+    for key in set(add_keys) - set(existing):
+        row, _ = SkillBitmap.objects.get_or_create(key=key)
+        existing[key] = row
+
+    changed = []
+    for key, row in existing.items():
+        bits = _to_int(row.bits)
+        bits = bits | bit if key in add_keys else bits & ~bit
+        row.bits = _to_bytes(bits)
+        row.cardinality = bits.bit_count()
+        changed.append(row)
+    SkillBitmap.objects.bulk_update(changed, ["bits", "cardinality"])
+
+
+def index_candidate(user_id):
+    """Bring one candidate's bits in line with their current profile and resumes."""
+    from django.contrib.auth.models import User
+    from jobs.models import CandidateSkillEntry
+
+    user = User.objects.select_related("profile").filter(pk=user_id).first()
+    profile = getattr(user, "profile", None) if user else None
+    if profile is None or profile.user_type != "jobseeker":
+        remove_candidate(user_id)
+        return
+
+    skills, years = candidate_facts(user)
+    with transaction.atomic():
+        entry = CandidateSkillEntry.objects.select_for_update().filter(user_id=user_id).first()
+        old_keys = _keys_for(entry.skills, entry.experience_years) if entry else set()
+        new_keys = _keys_for(skills, years)
+        _apply(user_id, new_keys - old_keys, old_keys - new_keys)
+        CandidateSkillEntry.objects.update_or_create(
+            user_id=user_id, defaults={"skills": sorted(skills), "experience_years": years}
+        )
+
+
+def remove_candidate(user_id):
+    from jobs.models import CandidateSkillEntry
+
+    with transaction.atomic():
+        entry = CandidateSkillEntry.objects.select_for_update().filter(user_id=user_id).first()
+        if entry is None:
+            return
+        _apply(user_id, set(), _keys_for(entry.skills, entry.experience_years))
+        entry.delete()
+
+
+def reindex_blob_owners(blob_ids):
+    """Re-index everyone whose profile or application uses one of these resumes."""
+    from accounts.models import Profile
+    from jobs.models import JobApplication
+
+    user_ids = set(Profile.objects.filter(resume_blob_id__in=blob_ids).values_list("user_id", flat=True))
+    user_ids.update(JobApplication.objects.filter(resume_blob_id__in=blob_ids).values_list("applicant_id", flat=True))
+    for user_id in user_ids:
+        index_candidate(user_id)
+
+
+def rebuild():
+    """Recompute the whole index from scratch; returns the number of candidates indexed."""
+    from accounts.models import Profile
+    from jobs.models import CandidateSkillEntry, SkillBitmap
+
+    bitmaps = {}
+    entries = []
+    for profile in Profile.objects.filter(user_type="jobseeker").select_related("user").iterator():
+        skills, years = candidate_facts(profile.user)
+        entries.append(CandidateSkillEntry(user_id=profile.user_id, skills=sorted(skills), experience_years=years))
+        bit = 1 << profile.user_id
+        for key in _keys_for(skills, years):
+            bitmaps[key] = bitmaps.get(key, 0) | bit
+
+    with transaction.atomic():
+        SkillBitmap.objects.all().delete()
+        CandidateSkillEntry.objects.all().delete()
+        SkillBitmap.objects.bulk_create([
+            SkillBitmap(key=key, bits=_to_bytes(bits), cardinality=bits.bit_count())
+            for key, bits in bitmaps.items()
+        ])
+        CandidateSkillEntry.objects.bulk_create(entries)
+    return len(entries)
+
+
+# ---------------------------------------------------------------------------
+# Query language
+
+_TOKEN_RE = re.compile(
+    r"\s*(?:"
+    r"(?P<lparen>\()|(?P<rparen>\))|(?P<comma>,)"
+    r"|(?P<exp>(?:exp|experience|years)\s*>=\s*(?P<years>\d{1,2}))"
+    r"|(?P<and>&&|&)|(?P<or>\|\||\|)|(?P<not>!)"
+    r'|"(?P<quoted>[^"]+)"'
+    r"|(?P<word>[^\s(),&|!\"]+)"
+    r")",
+    re.IGNORECASE,
+)
+_KEYWORDS = {"and": "and", "or": "or", "not": "not"}
+
+
+def _tokenize(expression):
+    tokens = []
+    position = 0
+    expression = expression.strip()
+    while position < len(expression):
+        match = _TOKEN_RE.match(expression, position)
+        if not match or match.end() == position:
+            raise SkillQueryError(f"Unexpected input at position {position}: {expression[position:position + 10]!r}")
+        position = match.end()
+        kind = match.lastgroup if match.lastgroup != "years" else "exp"
+        if kind == "exp":
+            tokens.append(("exp", int(match.group("years"))))
+        elif kind == "comma":
+            tokens.append(("and", None))
+        elif kind == "quoted":
+            tokens.append(("skill", match.group("quoted").strip().lower()))
+        elif kind == "word":
+            word = match.group("word")
+            keyword = _KEYWORDS.get(word.lower())
+            if keyword:
+                tokens.append((keyword, None))
+            elif tokens and tokens[-1][0] == "word":
+                # Adjacent bare words form one multi-word skill ("machine learning")
+                tokens[-1] = ("word", f"{tokens[-1][1]} {word.lower()}")
+            else:
+                tokens.append(("word", word.lower()))
+        else:
+            tokens.append((kind, None))
+    return [("skill", value) if kind == "word" else (kind, value) for kind, value in tokens]
+
+
+class _Parser:
+    """expr := term (OR term)* ; term := factor (AND factor)* ; factor := NOT factor | ( expr ) | skill | years>=N"""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.position = 0
+
+    def peek(self):
+        return self.tokens[self.position][0] if self.position < len(self.tokens) else None
+
+    def take(self):
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def parse(self):
+        if not self.tokens:
+            raise SkillQueryError("Empty skill expression")
+        node = self.expr()
+        if self.peek() is not None:
+            raise SkillQueryError(f"Unexpected {self.peek()!r}")
+        return node
+
+    def expr(self):
+        node = self.term()
+        while self.peek() == "or":
+            self.take()
+            node = ("or", node, self.term())
+        return node
+
+    def term(self):
+        node = self.factor()
+        while self.peek() == "and":
+            self.take()
+            node = ("and", node, self.factor())
+        return node
+
+    def factor(self):
+        kind = self.peek()
+        if kind == "not":
+            self.take()
+            return ("not", self.factor())
+        if kind == "lparen":
+            self.take()
+            node = self.expr()
+            if self.peek() != "rparen":
+                raise SkillQueryError("Missing closing parenthesis")
+            self.take()
+            return node
+        if kind in ("skill", "exp"):
+            return self.take()
+        raise SkillQueryError("Expected a skill" if kind is None else f"Unexpected {kind!r}")
+
+
+def parse_expression(expression):
+    """Parse a boolean skill expression into a small tuple AST."""
+    return _Parser(_tokenize(expression or "")).parse()
+
+
+def _leaves(node, kind):
+    if node[0] == kind:
+        yield node[1]
+    elif node[0] in ("and", "or", "not"):
+        for child in node[1:]:
+            yield from _leaves(child, kind)
+
+
+def _experience_bits(years, bitmaps):
+    """Exact ``experience >= years``: nearest bucket as a superset, refined only if needed."""
+    from jobs.models import CandidateSkillEntry
+
+    if years <= 0:
+        return bitmaps.get(ALL_KEY, 0)
+    bucket = max((b for b in EXPERIENCE_BUCKETS if b <= years), default=None)
+    superset = bitmaps.get(_exp_key(bucket), 0) if bucket else bitmaps.get(ALL_KEY, 0)
+    if bucket == years or not superset:
+        return superset
+    bits = 0
+    for user_id in CandidateSkillEntry.objects.filter(
+        user_id__in=bit_ids(superset), experience_years__gte=years
+    ).values_list("user_id", flat=True):
+        bits |= 1 << user_id
+    return bits
+
+
+def evaluate(node, bitmaps):
+    kind = node[0]
+    if kind == "skill":
+        return bitmaps.get(_skill_key(node[1]), 0)
+    if kind == "exp":
+        return _experience_bits(node[1], bitmaps)
+    if kind == "not":
+        return bitmaps.get(ALL_KEY, 0) & ~evaluate(node[1], bitmaps)
+    left, right = evaluate(node[1], bitmaps), evaluate(node[2], bitmaps)
+    return left & right if kind == "and" else left | right
+
+
+def match_bits(expression=None, min_years=None):
+    """Bitset of indexed candidates satisfying ``expression`` and ``min_years``, or None with no filter."""
+    from jobs.models import SkillBitmap
+
+    if expression is not None and not isinstance(expression, str):
+        raise SkillQueryError("skill filter must be a string")
+    node = parse_expression(expression) if expression and expression.strip() else None
+    if min_years:
+        experience = ("exp", int(min_years))
+        node = ("and", node, experience) if node else experience
+    if node is None:
+        return None
+
+    keys = {ALL_KEY}
+    keys.update(_skill_key(skill) for skill in _leaves(node, "skill"))
+    keys.update(_exp_key(bucket) for bucket in EXPERIENCE_BUCKETS)
+    bitmaps = {key: _to_int(bits) for key, bits in SkillBitmap.objects.filter(key__in=keys).values_list("key", "bits")}
+    return evaluate(node, bitmaps)
+
+
+def has_bit(bits, user_id):
+    return bool((bits >> user_id) & 1)
+
+
+def match_candidates(expression=None, min_years=None):
+    """User ids of indexed candidates satisfying ``expression`` and ``min_years``, or None with no filter."""
+    bits = match_bits(expression, min_years)
+    return None if bits is None else set(bit_ids(bits))
+
+
+def restrict_applications(applications, bits):
+    """
+    Narrow an application queryset to applicants whose bit is set. The
+    bitset is tested against the queryset's own applicants first, so the
+    query only lists (the smaller side of) those applications, never every
+    matching candidate in the index.
+    """
+    keep, drop = [], []
+    for pk, applicant_id in applications.values_list("pk", "applicant_id"):
+        (keep if has_bit(bits, applicant_id) else drop).append(pk)
+    if len(keep) <= len(drop):
+        return applications.filter(pk__in=keep)
+    return applications.exclude(pk__in=drop)
+
+
+def filter_applications(applications, expression=None, min_years=None):
+    """Narrow an application queryset to applicants matching the skill filter."""
+    bits = match_bits(expression, min_years)
+    if bits is None:
+        return applications
+    return restrict_applications(applications, bits)
@@ -0,0 +1,83 @@
+"""
+Session-scoped ranking snapshots for keyset pagination.
+
+The first page of a ranked listing orders the results once (from the
+materialized feed, not by re-scoring) and stores the ordered ids in the
+session under a snapshot id. Later pages are addressed by a cursor
+(snapshot id + last id shown + how many were shown) and slice that stored order, so paging never
+re-ranks and stays consistent while the user scrolls even if scores change
+underneath. Snapshots live BROWSE_SNAPSHOT_TTL seconds; a cursor into an
+expired snapshot is served from a fresh one, resuming after the same item
+when it is still listed and at the same position otherwise (never back at
+the first page).
+"""
+import secrets
+import time
+
+from django.conf import settings
+
+SESSION_KEY = "ranking_snapshots"
+MAX_SNAPSHOTS = 5  # per session; older ones are dropped
+
+
+def encode_cursor(snapshot_id, last_id, position):
+    return f"{snapshot_id}.{last_id}.{position}"
+
+
+def decode_cursor(cursor):
+    """
+    (snapshot_id, last_id, position) from a cursor, or (None, None, 0) if it
+    is missing or malformed. ``position`` is the number of results already shown.
+    """
+    snapshot_id, _, rest = (cursor or "").partition(".")
+    last_id, _, position = rest.partition(".")
+    if not snapshot_id or not last_id.isdigit() or not position.isdigit():
+        return None, None, 0
+    return snapshot_id, int(last_id), int(position)
+
+
+def _live_snapshots(session):
+    ttl = getattr(settings, "BROWSE_SNAPSHOT_TTL", 900)
+    now = time.time()
+    return {
+        snapshot_id: snapshot
+        for snapshot_id, snapshot in session.get(SESSION_KEY, {}).items()
+        if now - snapshot["created"] < ttl
+    }
+
+
+def paginate(request, key, build, cursor=None, page_size=None):
+    """
+    One page of the snapshot for ``key`` (the listing's filters).
+
+    ``build()`` returns ``{"ids": [...ordered ids...], **extra}`` and is only
+    called for a first page or an expired cursor. Returns (page_ids, offset,
+    snapshot, next_cursor); next_cursor is None on the last page.
+    """
+    page_size = page_size or getattr(settings, "BROWSE_PAGE_SIZE", 20)
+    snapshots = _live_snapshots(request.session)
+    snapshot_id, last_id, position = decode_cursor(cursor)
+    snapshot = snapshots.get(snapshot_id)
+
+    if snapshot is None or snapshot["key"] != key:
+        snapshot = build()
+        snapshot["ids"] = snapshot["ids"][:getattr(settings, "BROWSE_SNAPSHOT_LIMIT", 1000)]
+        snapshot.update(key=key, created=time.time())
+        snapshot_id = secrets.token_urlsafe(6)
+        # A new snapshot replaces older ones for the same listing
+        snapshots = {sid: snap for sid, snap in snapshots.items() if snap["key"] != key}
+        snapshots[snapshot_id] = snapshot
+        newest = sorted(snapshots, key=lambda sid: snapshots[sid]["created"])[-MAX_SNAPSHOTS:]
+        request.session[SESSION_KEY] = {sid: snapshots[sid] for sid in newest}
+
+    ids = snapshot["ids"]
+    offset = 0
+    if last_id is not None:
+        # The last item shown may have dropped out of a rebuilt snapshot (closed, applied to);
+        # carry on from the same position rather than replaying the first page
+        offset = ids.index(last_id) + 1 if last_id in ids else min(position, len(ids))
+    page_ids = ids[offset:offset + page_size]
+    next_cursor = (
+        encode_cursor(snapshot_id, page_ids[-1], offset + len(page_ids)) if offset + page_size < len(ids) else None
+    )
+    return page_ids, offset, snapshot, next_cursor
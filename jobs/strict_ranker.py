@@ -0,0 +1,150 @@
+"""
+Set-based strict (profile-only) ranker.
+
+Scores every application for a job in one pass: applicant profiles come
+from a single query, skills are interned to integer ids and matched as a
+boolean applicant x skill matrix, the experience/education/resume terms are
+NumPy expressions over whole columns, and changed rows are written back with
+one bulk_update. Scores and notes are the same as the old per-row loop.
+"""
+import logging
+
+import numpy as np
+
+logger = logging.getLogger('jobs')
+
+SKILL_WEIGHT = 0.5
+EXPERIENCE_WEIGHT = 0.35
+EDUCATION_POINTS = 10
+RESUME_POINTS = 5
+
+
+def split_skills(skills):
+    """Comma-separated skills -> normalised list (same as get_skills_list() + normalize_skill)."""
+    if not skills:
+        return []
+    return [skill.strip().lower() for skill in skills.split(",")]
+
+
+def score_profiles(job_skills, skills_lists, experience, required_experience, education, resume):
+    """
+    Strict scores for many applicants at once.
+
+    ``job_skills`` is the job's normalised skill list; the other arguments
+    are per-applicant sequences. Returns (skill_pct, exp_score, total) arrays.
+    """
+    n = len(skills_lists)
+    skill_ids = {}
+    for skill in job_skills:
+        skill_ids.setdefault(skill, len(skill_ids))
+
+    if job_skills and n:
+        rows, cols = [], []
+        for row, skills in enumerate(skills_lists):
+            for skill in skills:
+                col = skill_ids.get(skill)
+                if col is not None:
+                    rows.append(row)
+                    cols.append(col)
+        has_skill = np.zeros((n, len(skill_ids)), dtype=bool)
+        has_skill[rows, cols] = True
+        # Repeated job skills count once per occurrence, like the per-pair match did
+        required = np.array([skill_ids[skill] for skill in job_skills], dtype=np.intp)
+        skill_pct = (has_skill[:, required].sum(axis=1) / len(required)) * 100
+    else:
+        skill_pct = np.zeros(n)
+
+    gap = np.asarray(experience, dtype=np.float64) - required_experience
+    exp_score = np.where(gap >= 0, 100.0, np.where(gap >= -2, np.maximum(0.0, 50 + gap * 25), 0.0))
+
+    total = (
+        skill_pct * SKILL_WEIGHT
+        + exp_score * EXPERIENCE_WEIGHT
+        + np.asarray(education, dtype=bool) * EDUCATION_POINTS
+        + np.asarray(resume, dtype=bool) * RESUME_POINTS
+    )
+    return skill_pct, exp_score, np.clip(total, 0, 100)
+
+
+def _notes(skill_pct, years, required, has_education, has_resume):
+    notes = [f"Skills: {skill_pct:.0f}%"]
+    gap = years - required
+    if gap >= 0:
+        notes.append(f"Exp: ✓ ({years}y)")
+    elif gap >= -2:
+        notes.append(f"Exp: {years}y (need {required}y)")
+    else:
+        notes.append(f"Exp: {abs(gap)}y below")
+    if has_education:
+        notes.append("Edu: ✓")
+    if has_resume:
+        notes.append("Resume: ✓")
+    return notes
+
+
+def rank_strict(job, applications, degraded=None, transient=False):
+    """
+    Score ``applications`` for ``job`` from applicant profiles only and
+    persist the changed rows (unless ``transient``); returns them best first.
+    ``degraded`` (why the AI path was skipped) is added to the notes and
+    flagged in ``xai_data``.
+    """
+    from accounts.models import Profile
+    from jobs.models import JobApplication
+
+    applications = list(applications)
+    if not applications:
+        return []
+
+    profiles = {
+        user_id: (skills, years or 0, education, resume)
+        for user_id, skills, years, education, resume in Profile.objects.filter(
+            user_id__in={application.applicant_id for application in applications}
+        ).values_list("user_id", "skills", "experience_years", "education", "resume")
+    }
+    with_profile = [application for application in applications if application.applicant_id in profiles]
+    rows = [profiles[application.applicant_id] for application in with_profile]
+    required = job.experience_required or 0
+
+    skill_pct, _, total = score_profiles(
+        split_skills(job.skills_required),
+        [split_skills(skills) for skills, _, _, _ in rows],
+        [years for _, years, _, _ in rows],
+        required,
+        [bool(education) for _, _, education, _ in rows],
+        [bool(application.resume) or bool(resume) for application, (_, _, _, resume) in zip(with_profile, rows)],
+    )
+
+    results = {}
+    for position, (application, (_, years, education, resume)) in enumerate(zip(with_profile, rows)):
+        notes = _notes(skill_pct[position], years, required, bool(education), bool(application.resume) or bool(resume))
+        results[application.id] = (round(float(total[position]), 1), notes)
+
+    changed = []
+    for application in applications:
+        score, notes = results.get(application.id, (0.0, ["No profile"]))
+        if degraded:
+            notes = notes + [f"Profile scoring only ({degraded})"]
+        notes = " | ".join(notes)
+        if (application.match_score, application.ranking_notes, application.ranking_status) != (score, notes, "scored"):
+            application.match_score = score
+            application.ranking_notes = notes
+            application.ranking_status = "scored"
+            changed.append(application)
+        if degraded:
+            profile = profiles.get(application.applicant_id)
+            application.xai_data = {
+                "degraded": True,
+                "explanation": notes,
+                "experience_years": profile[1] if profile else None,
+            }
+
+    if not transient:
+        JobApplication.objects.bulk_update(changed, ["match_score", "ranking_notes", "ranking_status"], batch_size=500)
+    logger.info(
+        f"STRICT RANK: {len(applications)} applications for {job.title} "
+        f"({len(applications) - len(with_profile)} without profile, {len(changed)} updated)"
+    )
+
+    applications.sort(key=lambda x: x.match_score, reverse=True)
+    return applications
@@ -0,0 +1,224 @@
+"""
+Database-backed background task queue.
+
+Tasks are rows in the Task table; the database is the only dependency.
+Request code calls enqueue() (usually from transaction.on_commit), and one
+or more `manage.py run_worker` processes claim and run them:
+
+- claiming uses SELECT ... FOR UPDATE SKIP LOCKED where the backend has it
+  (PostgreSQL), so concurrent workers never wait on each other's rows; on
+  SQLite the claim is a conditional UPDATE (status still "queued"), which is
+  safe under SQLite's single-writer lock;
+- higher ``priority`` runs first, then oldest ``run_after``;
+- a failing task is retried with exponential backoff up to ``max_attempts``;
+- a claimed task's lease (TASK_LEASE_SECONDS) is renewed by its worker until
+  the task finishes, including while it waits behind others claimed in the
+  same batch; tasks left "running" by a crashed worker are re-queued
+  once the lease expires, or failed if they have used up their attempts
+  (a task that keeps killing its worker must not loop forever).
+
+Handlers are registered with @task in jobs/tasks.py.
+"""
+import logging
+import threading
+import traceback
+from contextlib import contextmanager, nullcontext
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+logger = logging.getLogger('jobs')
+
+TASKS = {}
+
+
+def task(name):
+    """Register a task handler under ``name``; it is called with the task's kwargs."""
+    def register(fn):
+        TASKS[name] = fn
+        return fn
+    return register
+
+
+def enqueue(name, priority=0, delay=0, dedupe_key="", max_attempts=3, **kwargs):
+    """
+    Queue ``name(**kwargs)``. With ``dedupe_key``, nothing is added while a
+    task with that key is still queued (the queued one will see the latest
+    data when it runs). Returns the Task row.
+    """
+    from jobs.models import Task
+
+    if dedupe_key:
+        existing = Task.objects.filter(status="queued", dedupe_key=dedupe_key).first()
+        if existing is not None:
+            return existing
+    return Task.objects.create(
+        name=name,
+        kwargs=kwargs,
+        priority=priority,
+        dedupe_key=dedupe_key,
+        max_attempts=max_attempts,
+        run_after=timezone.now() + timedelta(seconds=delay),
+    )
+
+
+def enqueue_on_commit(name, **options):
+    """enqueue() once the surrounding transaction commits (immediately outside one)."""
+    def run():
+        try:
+            enqueue(name, **options)
+        except Exception as exc:
+            logger.error(f"Could not enqueue task {name}: {exc}")
+
+    transaction.on_commit(run)
+
+
+def claim(worker_id, limit=1):
+    """Atomically take up to ``limit`` runnable tasks for ``worker_id``."""
+    from jobs.models import Task
+
+    now = timezone.now()
+    runnable = Task.objects.filter(status="queued", run_after__lte=now).order_by("-priority", "run_after", "id")
+    claimed_ids = []
+
+    with transaction.atomic():
+        if connection.features.has_select_for_update_skip_locked:
+            candidate_ids = list(runnable.select_for_update(skip_locked=True).values_list("id", flat=True)[:limit])
+            if candidate_ids:
+                Task.objects.filter(id__in=candidate_ids).update(
+                    status="running", locked_by=worker_id, locked_at=now, attempts=F("attempts") + 1
+                )
+            claimed_ids = candidate_ids
+        else:
+            for task_id in runnable.values_list("id", flat=True)[:limit]:
+                updated = Task.objects.filter(id=task_id, status="queued").update(
+                    status="running", locked_by=worker_id, locked_at=now, attempts=F("attempts") + 1
+                )
+                if updated:
+                    claimed_ids.append(task_id)
+
+    return list(Task.objects.filter(id__in=claimed_ids).order_by("-priority", "run_after", "id"))
+
+
+def _backoff(attempts):
+    base = getattr(settings, "TASK_RETRY_BACKOFF", 30)
+    return timedelta(seconds=base * 2 ** (attempts - 1))
+
+
+def _lease_seconds():
+    return getattr(settings, "TASK_LEASE_SECONDS", 900)
+
+
+@contextmanager
+def _lease_renewal(*task_rows):
+    """
+    Renew the leases of ``task_rows`` every third of TASK_LEASE_SECONDS until
+    the block exits; rows that finish or are re-queued meanwhile drop out.
+    """
+    from django.db import connections
+    from jobs.models import Task
+
+    stop = threading.Event()
+    interval = max(1.0, _lease_seconds() / 3)
+    worker_id = task_rows[0].locked_by
+    task_ids = [task_row.pk for task_row in task_rows]
+    label = ",".join(str(task_id) for task_id in task_ids)
+
+    def renew():
+        try:
+            while not stop.wait(interval):
+                try:
+                    Task.objects.filter(pk__in=task_ids, status="running", locked_by=worker_id).update(
+                        locked_at=timezone.now()
+                    )
+                except Exception as exc:
+                    logger.warning(f"Could not renew lease on tasks {label}: {exc}")
+        finally:
+            # Only closes this thread's connection
+            connections.close_all()
+
+    thread = threading.Thread(target=renew, name=f"lease-{label}", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+def run_task(task_row, renew=True):
+    """
+    Run one claimed task and record the outcome; returns True on success.
+    ``renew=False`` when the caller already renews the lease (run_batch).
+    """
+    from jobs.models import Task
+
+    handler = TASKS.get(task_row.name)
+    try:
+        if handler is None:
+            raise LookupError(f"No task registered as {task_row.name!r}")
+        with _lease_renewal(task_row) if renew else nullcontext():
+            handler(**task_row.kwargs)
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}"
+        fields = {"last_error": traceback.format_exc()[-4000:], "locked_by": "", "locked_at": None}
+        if task_row.attempts < task_row.max_attempts and handler is not None:
+            fields.update(status="queued", run_after=timezone.now() + _backoff(task_row.attempts))
+            logger.warning(f"Task {task_row} failed (attempt {task_row.attempts}/{task_row.max_attempts}): {error}")
+        else:
+            fields.update(status="failed", finished_at=timezone.now())
+            logger.error(f"Task {task_row} failed permanently: {error}")
+        Task.objects.filter(pk=task_row.pk).update(**fields)
+        return False
+
+    Task.objects.filter(pk=task_row.pk).update(
+        status="done", finished_at=timezone.now(), locked_by="", locked_at=None
+    )
+    return True
+
+
+def run_batch(task_rows):
+    """
+    Run tasks claimed together, in order, keeping every lease alive until its
+    task has run so the ones still waiting are not re-queued as stale.
+    Yields each task's outcome (True on success) as it finishes.
+    """
+    if not task_rows:
+        return
+    with _lease_renewal(*task_rows):
+        for task_row in task_rows:
+            yield run_task(task_row, renew=False)
+
+
+def requeue_stale(lease_seconds=None):
+    """
+    Put tasks whose worker vanished mid-run back in the queue, or fail them
+    when that was their last attempt; returns how many were re-queued.
+    """
+    from jobs.models import Task
+
+    lease = lease_seconds or _lease_seconds()
+    now = timezone.now()
+    stale = Task.objects.filter(status="running", locked_at__lt=now - timedelta(seconds=lease))
+    failed = stale.filter(attempts__gte=F("max_attempts")).update(
+        status="failed", finished_at=now, locked_by="", locked_at=None,
+        last_error="Worker lease expired on the last attempt (the task may be crashing its worker)",
+    )
+    if failed:
+        logger.error(f"Failed {failed} tasks whose worker lease expired on their last attempt")
+    count = stale.update(status="queued", locked_by="", locked_at=None, run_after=now)
+    if count:
+        logger.warning(f"Re-queued {count} tasks whose worker lease expired")
+    return count
+
+
+def purge_finished(days=None):
+    """Delete done tasks older than TASK_RETENTION_DAYS; failed ones are kept for inspection."""
+    from jobs.models import Task
+
+    days = days or getattr(settings, "TASK_RETENTION_DAYS", 7)
+    deleted, _ = Task.objects.filter(status="done", finished_at__lt=timezone.now() - timedelta(days=days)).delete()
+    return deleted
@@ -0,0 +1,131 @@
+"""
+Background task handlers (run by `manage.py run_worker`, see jobs/task_queue.py).
+"""
+import logging
+
+from django.conf import settings
+
+from .task_queue import enqueue_on_commit, task
+
+logger = logging.getLogger('jobs')
+
+EXTRACT_PRIORITY = 10
+SCORE_PRIORITY = 8
+EMBED_PRIORITY = 5
+RANK_PRIORITY = 0
+FEED_PRIORITY = -5
+
+
+@task("extract_resume")
+def extract_resume(blob_id):
+    """Extract and store a resume's text so no request has to parse the PDF."""
+    from .ai_service import _blob_texts
+    from .models import ResumeBlob
+
+    blob = ResumeBlob.objects.filter(pk=blob_id).first()
+    if blob is not None and not blob.text_extracted_at:
+        _blob_texts([blob])
+
+
+@task("embed_job")
+def embed_job(job_id):
+    """Store the serving model's vector for an open job."""
+    from .ai_lazy_loader import get_ranker
+    from .ai_service import _job_vectors, _model_ready
+    from .models import Job
+
+    job = Job.objects.open().filter(pk=job_id).first()
+    if job is not None and _model_ready(get_ranker()):
+        _job_vectors([job])
+
+
+@task("score_application")
+def score_application(application_id):
+    """Score one new application without re-ranking the rest of the job's pool."""
+    from .ai_service import score_application as score
+    from .models import JobApplication
+
+    application = JobApplication.objects.filter(pk=application_id).select_related("job", "applicant").first()
+    if application is not None:
+        score(application)
+
+
+@task("rank_job")
+def rank_job(job_id):
+    """Re-rank every application for a job, without a time budget."""
+    from .ai_service import rank_applications
+    from .models import Job, JobApplication
+
+    job = Job.objects.filter(pk=job_id).first()
+    if job is not None:
+        rank_applications(job, JobApplication.objects.filter(job=job).select_related("applicant"), time_budget=0)
+
+
+@task("refresh_feed")
+def refresh_feed(user_id):
+    """Recompute a job seeker's materialized feed (only feeds that exist are maintained)."""
+    from accounts.models import Profile
+
+    from .feed import refresh_feed as refresh
+    from .models import RecommendationFeed
+
+    if not RecommendationFeed.objects.filter(user_id=user_id).exists():
+        return
+    profile = Profile.objects.filter(user_id=user_id, user_type="jobseeker").select_related("user").first()
+    if profile is not None:
+        refresh(profile)
+
+
+@task("refresh_job_feeds")
+def refresh_job_feeds(job_id):
+    """Queue feed refreshes for every seeker a new or edited posting is relevant to."""
+    from .feed import mark_stale, seekers_for_job
+    from .models import Job
+
+    job = Job.objects.filter(pk=job_id).first()
+    if job is None:
+        return
+    user_ids = seekers_for_job(job)
+    mark_stale(user_ids)
+    for user_id in user_ids:
+        queue_feed_refresh(user_id, mark=False)
+
+
+def queue_resume_extraction(blob_id):
+    enqueue_on_commit(
+        "extract_resume", blob_id=blob_id, priority=EXTRACT_PRIORITY, dedupe_key=f"extract_resume:{blob_id}"
+    )
+
+
+def queue_job_embedding(job_id):
+    enqueue_on_commit("embed_job", job_id=job_id, priority=EMBED_PRIORITY, dedupe_key=f"embed_job:{job_id}")
+
+
+def queue_application_scoring(application_id):
+    enqueue_on_commit(
+        "score_application", application_id=application_id, priority=SCORE_PRIORITY,
+        dedupe_key=f"score_application:{application_id}",
+    )
+
+
+def queue_job_ranking(job_id):
+    enqueue_on_commit("rank_job", job_id=job_id, priority=RANK_PRIORITY, dedupe_key=f"rank_job:{job_id}")
+
+
+def queue_feed_refresh(user_id, mark=True):
+    """Flag the seeker's feed stale and refresh it shortly (bursts of events coalesce)."""
+    if mark:
+        from .feed import mark_stale
+        from .match_scores import bump_seeker_version
+        mark_stale([user_id])
+        bump_seeker_version(user_id)
+    enqueue_on_commit(
+        "refresh_feed", user_id=user_id, priority=FEED_PRIORITY,
+        delay=getattr(settings, "FEED_REFRESH_DELAY", 30), dedupe_key=f"refresh_feed:{user_id}",
+    )
+
+
+def queue_job_feeds(job_id):
+    enqueue_on_commit(
+        "refresh_job_feeds", job_id=job_id, priority=FEED_PRIORITY, dedupe_key=f"refresh_job_feeds:{job_id}"
+    )
@@ -0,0 +1,553 @@
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import Client, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from accounts.models import Profile
+from jobs import ai_service, resume_extraction, resume_extractors, scheduler, skill_index, task_queue
+from jobs.circuit_breaker import CircuitBreaker, CircuitOpenError, DeadlineExceeded
+from jobs.match_scores import bump_seeker_version, seeker_version
+from jobs.models import Job, JobApplication, RecommendationFeed, SeekerVersion, Task
+from jobs.resume_features import ResumeFeatures
+from jobs.snapshots import paginate
+from jobs.strict_ranker import _notes, rank_strict, score_profiles
+
+
+class TaskQueueTests(TestCase):
+    def setUp(self):
+        self.calls = []
+        patcher = mock.patch.dict(task_queue.TASKS, {
+            "ok": lambda **kwargs: self.calls.append(kwargs),
+            "boom": self._boom,
+        })
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def _boom(**kwargs):
+        raise RuntimeError("boom")
+
+    def test_enqueue_dedupes_while_queued(self):
+        first = task_queue.enqueue("ok", dedupe_key="k", x=1)
+        second = task_queue.enqueue("ok", dedupe_key="k", x=2)
+        self.assertEqual(first.pk, second.pk)
+        Task.objects.filter(pk=first.pk).update(status="running")
+        third = task_queue.enqueue("ok", dedupe_key="k", x=3)
+        self.assertNotEqual(first.pk, third.pk)
+
+    def test_claim_order_and_attempts(self):
+        low = task_queue.enqueue("ok", priority=0)
+        high = task_queue.enqueue("ok", priority=10)
+        task_queue.enqueue("ok", priority=20, delay=3600)  # not runnable yet
+
+        claimed = task_queue.claim("w1", limit=5)
+        self.assertEqual([t.pk for t in claimed], [high.pk, low.pk])
+        self.assertTrue(all(t.status == "running" and t.locked_by == "w1" and t.attempts == 1 for t in claimed))
+        # Running tasks are not claimed twice
+        self.assertEqual(task_queue.claim("w2", limit=5), [])
+
+    def test_success_marks_done(self):
+        task_queue.enqueue("ok", x=1)
+        [row] = task_queue.claim("w1")
+        self.assertTrue(task_queue.run_task(row))
+        row.refresh_from_db()
+        self.assertEqual(row.status, "done")
+        self.assertEqual(self.calls, [{"x": 1}])
+
+    @override_settings(TASK_RETRY_BACKOFF=10)
+    def test_failure_retries_with_backoff_then_fails(self):
+        task_queue.enqueue("boom", max_attempts=2)
+        [row] = task_queue.claim("w1")
+        before = timezone.now()
+        self.assertFalse(task_queue.run_task(row))
+        row.refresh_from_db()
+        self.assertEqual(row.status, "queued")
+        self.assertGreaterEqual(row.run_after, before + timedelta(seconds=10))
+
+        Task.objects.filter(pk=row.pk).update(run_after=timezone.now())
+        [row] = task_queue.claim("w1")
+        self.assertFalse(task_queue.run_task(row))
+        row.refresh_from_db()
+        self.assertEqual(row.status, "failed")
+        self.assertIn("boom", row.last_error)
+
+    def test_backoff_doubles(self):
+        with override_settings(TASK_RETRY_BACKOFF=30):
+            self.assertEqual(
+                [task_queue._backoff(n).total_seconds() for n in (1, 2, 3)], [30, 60, 120]
+            )
+
+    def test_requeue_stale_respects_max_attempts(self):
+        expired = timezone.now() - timedelta(seconds=120)
+        retry = Task.objects.create(name="ok", status="running", attempts=1, max_attempts=3, locked_by="w", locked_at=expired)
+        spent = Task.objects.create(name="ok", status="running", attempts=3, max_attempts=3, locked_by="w", locked_at=expired)
+        live = Task.objects.create(name="ok", status="running", attempts=1, locked_by="w", locked_at=timezone.now())
+
+        self.assertEqual(task_queue.requeue_stale(lease_seconds=60), 1)
+        for row in (retry, spent, live):
+            row.refresh_from_db()
+        self.assertEqual(retry.status, "queued")
+        self.assertEqual(spent.status, "failed")
+        self.assertIn("lease expired", spent.last_error)
+        self.assertEqual(live.status, "running")
+
+
+class TaskLeaseRenewalTests(TransactionTestCase):
+    @override_settings(TASK_LEASE_SECONDS=3)
+    def test_lease_renewed_while_handler_runs(self):
+        seen = {}
+
+        def slow(**kwargs):
+            started = Task.objects.get(name="slow").locked_at
+            # Long enough for at least one renewal (every lease / 3, at least 1s)
+            time.sleep(2.5)
+            seen["renewed"] = Task.objects.get(name="slow").locked_at > started
+
+        with mock.patch.dict(task_queue.TASKS, {"slow": slow}):
+            task_queue.enqueue("slow")
+            [row] = task_queue.claim("w1")
+            self.assertTrue(task_queue.run_task(row))
+        self.assertTrue(seen["renewed"])
+
+    @override_settings(TASK_LEASE_SECONDS=3)
+    def test_waiting_batch_tasks_keep_their_lease(self):
+        seen = {}
+
+        def slow(**kwargs):
+            time.sleep(2.5)
+
+        def quick(**kwargs):
+            seen["renewed"] = Task.objects.get(name="quick").locked_at > seen["claimed_at"]
+
+        with mock.patch.dict(task_queue.TASKS, {"slow": slow, "quick": quick}):
+            task_queue.enqueue("slow", priority=1)
+            task_queue.enqueue("quick")
+            claimed = task_queue.claim("w1", limit=2)
+            self.assertEqual([row.name for row in claimed], ["slow", "quick"])
+            seen["claimed_at"] = claimed[1].locked_at
+            self.assertEqual(list(task_queue.run_batch(claimed)), [True, True])
+        self.assertTrue(seen["renewed"])
+
+
+class SeekerVersionTests(TestCase):
+    def test_bump_is_stored_in_the_database(self):
+        user = User.objects.create_user("seeker")
+        self.assertEqual(seeker_version(user.pk), 0)
+
+        bump_seeker_version(user.pk)
+        first = seeker_version(user.pk)
+        self.assertNotEqual(first, 0)
+        # Another worker's cache knows nothing of the bump; the version must not depend on it
+        cache.clear()
+        self.assertEqual(seeker_version(user.pk), first)
+
+        SeekerVersion.objects.filter(user=user).update(changed_at=timezone.now() + timedelta(seconds=1))
+        self.assertGreater(seeker_version(user.pk), first)
+        # Only existing feeds are maintained, so a bump must not create one
+        self.assertFalse(RecommendationFeed.objects.filter(user=user).exists())
+
+
+class SnapshotPaginationTests(TestCase):
+    def setUp(self):
+        self.request = mock.Mock(session={})
+
+    @override_settings(BROWSE_PAGE_SIZE=2)
+    def test_cursor_pages_through_snapshot(self):
+        build = mock.Mock(return_value={"ids": [1, 2, 3, 4, 5]})
+        page, offset, _, cursor = paginate(self.request, "k", build)
+        self.assertEqual((page, offset), ([1, 2], 0))
+        page, offset, _, cursor = paginate(self.request, "k", build, cursor=cursor)
+        self.assertEqual((page, offset), ([3, 4], 2))
+        self.assertEqual(build.call_count, 1)
+
+    @override_settings(BROWSE_PAGE_SIZE=2)
+    def test_rebuilt_snapshot_without_last_id_keeps_position(self):
+        _, _, _, cursor = paginate(self.request, "k", lambda: {"ids": [1, 2, 3, 4, 5]})
+        # Snapshot expired and job 2 (the last one shown) closed meanwhile
+        self.request.session = {}
+        page, offset, _, _ = paginate(self.request, "k", lambda: {"ids": [1, 3, 4, 5]}, cursor=cursor)
+        self.assertEqual((page, offset), ([4, 5], 2))
+
+
+class AdHocRankingTests(TestCase):
+    def setUp(self):
+        recruiter = User.objects.create_user("recruiter")
+        self.job = Job.objects.create(
+            title="Backend developer", description="python django", skills_required="python", posted_by=recruiter
+        )
+        self.applications = [
+            JobApplication.objects.create(job=self.job, applicant=User.objects.create_user(f"applicant{i}"))
+            for i in range(3)
+        ]
+        JobApplication.objects.filter(job=self.job).update(match_score=42.0, ranking_notes="stored", ranking_status="scored")
+        patcher = mock.patch.object(ai_service, "_prefetch_resume_texts", lambda apps: {
+            application.id: f"python django developer {application.id} 3 years" for application in apps
+        })
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_ad_hoc_description_leaves_stored_ranking_alone(self):
+        ranked = ai_service.rank_applications(
+            self.job, JobApplication.objects.filter(job=self.job), job_description="rust embedded engineer"
+        )
+        self.assertEqual(len(ranked), 3)
+        self.assertTrue(all(application.ranking_notes != "stored" for application in ranked))
+        stored = JobApplication.objects.filter(job=self.job).values_list("match_score", "ranking_notes", "ranking_status")
+        self.assertEqual(set(stored), {(42.0, "stored", "scored")})
+        self.assertFalse(Task.objects.filter(name="rank_job").exists())
+
+    def test_job_ranking_is_stored(self):
+        ai_service.rank_applications(self.job, JobApplication.objects.filter(job=self.job), time_budget=0)
+        self.assertFalse(JobApplication.objects.filter(job=self.job, ranking_notes="stored").exists())
+
+
+class ResumeFeaturesTests(TestCase):
+    RESUME = "\n".join([
+        "Experience",
+        "Backend developer, Acme, Jan 2018 - Dec 2022",
+        "Education",
+        "MSc Computer Science, Example University, 2015 - 2017",
+        "BSc Physics 2011 - 2015",
+    ])
+
+    def test_single_pass_record(self):
+        features = ResumeFeatures(self.RESUME, frozenset({"c++", "django"}), today=timezone.now().date())
+        self.assertEqual(features.range_years, 4)
+        self.assertEqual(features.education, ("masters", "bachelors"))
+
+    def test_no_education(self):
+        features = ResumeFeatures("Python developer, 5 years", today=timezone.now().date())
+        self.assertEqual(features.education, ())
+        self.assertEqual(features.years, 5)
+
+
+class SchedulerTests(TestCase):
+    def setUp(self):
+        self.ran = []
+        patcher = mock.patch.dict(scheduler.PERIODIC, {
+            "shared": scheduler.Periodic("shared", lambda: self.ran.append("shared"), 60, True),
+            "local": scheduler.Periodic("local", lambda: self.ran.append("local"), 60, False),
+        }, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_standalone_scheduler_skips_local_jobs(self):
+        scheduler.Scheduler("node").run_pending()
+        self.assertEqual(self.ran, ["shared"])
+
+    def test_web_process_runs_local_jobs_only(self):
+        scheduler.Scheduler("web", local_jobs=True, exclusive_jobs=False).run_pending()
+        self.assertEqual(self.ran, ["local"])
+
+
+class ResumeBlobTests(TestCase):
+    def setUp(self):
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        self.enterContext(override_settings(MEDIA_ROOT=media.name))
+        recruiter = User.objects.create_user("recruiter")
+        job = Job.objects.create(title="Developer", description="python", posted_by=recruiter)
+        self.application = JobApplication.objects.create(
+            job=job, applicant=User.objects.create_user("applicant"),
+            resume=SimpleUploadedFile("cv.pdf", b"%PDF-1.4 resume"),
+        )
+
+    def test_upload_links_blob(self):
+        self.assertIsNotNone(self.application.resume_blob)
+        self.assertEqual(self.application.resume.name, self.application.resume_blob.file.name)
+
+    def test_clearing_resume_unlinks_blob(self):
+        self.application.resume = None
+        self.application.save()
+        self.application.refresh_from_db()
+        self.assertIsNone(self.application.resume_blob)
+
+
+class SkillIndexTests(TestCase):
+    def setUp(self):
+        self.seekers = {}
+        for name, skills, years in (("ana", "python, django", 5), ("ben", "python, flask", 2), ("cy", "php", 8)):
+            user = User.objects.create_user(name)
+            Profile.objects.create(user=user, user_type="jobseeker", skills=skills, experience_years=years)
+            self.seekers[name] = user.pk
+        skill_index.rebuild()
+
+    def ids(self, *names):
+        return {self.seekers[name] for name in names}
+
+    def test_precedence_and_binds_tighter_than_or(self):
+        self.assertEqual(
+            skill_index.parse_expression("python OR php AND django"),
+            ("or", ("skill", "python"), ("and", ("skill", "php"), ("skill", "django"))),
+        )
+        self.assertEqual(
+            skill_index.parse_expression("(python | php) & NOT flask"),
+            ("and", ("or", ("skill", "python"), ("skill", "php")), ("not", ("skill", "flask"))),
+        )
+
+    def test_quotes_multiword_and_experience(self):
+        self.assertEqual(skill_index.parse_expression('"C++" AND machine learning'),
+                         ("and", ("skill", "c++"), ("skill", "machine learning")))
+        self.assertEqual(skill_index.parse_expression("python, years>=3"), ("and", ("skill", "python"), ("exp", 3)))
+
+    def test_parse_errors(self):
+        for expression in ("", "python AND", "(python", "python)", "AND python", "python !", '"unclosed'):
+            with self.subTest(expression=expression), self.assertRaises(skill_index.SkillQueryError):
+                skill_index.parse_expression(expression)
+
+    def test_match_candidates(self):
+        self.assertEqual(skill_index.match_candidates("python"), self.ids("ana", "ben"))
+        self.assertEqual(skill_index.match_candidates("python AND NOT flask"), self.ids("ana"))
+        self.assertEqual(skill_index.match_candidates("django OR php"), self.ids("ana", "cy"))
+        self.assertEqual(skill_index.match_candidates("unknown"), set())
+        # Between buckets (3 < 4 < 5) the bucket is refined from the entries
+        self.assertEqual(skill_index.match_candidates(min_years=4), self.ids("ana", "cy"))
+        self.assertEqual(skill_index.match_candidates("python", min_years=5), self.ids("ana"))
+        self.assertIsNone(skill_index.match_candidates("  "))
+
+    def test_index_follows_profile_changes(self):
+        Profile.objects.filter(user_id=self.seekers["cy"]).update(skills="php, python")
+        skill_index.index_candidate(self.seekers["cy"])
+        self.assertEqual(skill_index.match_candidates("python"), self.ids("ana", "ben", "cy"))
+        skill_index.remove_candidate(self.seekers["ben"])
+        self.assertEqual(skill_index.match_candidates("python"), self.ids("ana", "cy"))
+
+    def test_restrict_applications_tests_the_queryset_applicants(self):
+        recruiter = User.objects.create_user("recruiter")
+        job = Job.objects.create(title="Developer", description="python", posted_by=recruiter)
+        for user_id in self.seekers.values():
+            JobApplication.objects.create(job=job, applicant_id=user_id)
+        applications = JobApplication.objects.filter(job=job)
+
+        bits = skill_index.match_bits("python")
+        self.assertEqual(
+            set(skill_index.restrict_applications(applications, bits).values_list("applicant_id", flat=True)),
+            self.ids("ana", "ben"),
+        )
+        bits = skill_index.match_bits("php")
+        self.assertEqual(
+            set(skill_index.restrict_applications(applications, bits).values_list("applicant_id", flat=True)),
+            self.ids("cy"),
+        )
+
+    def test_non_string_filter_is_rejected(self):
+        with self.assertRaises(skill_index.SkillQueryError):
+            skill_index.match_bits(["python"])
+
+        recruiter = User.objects.create_user("recruiter")
+        Profile.objects.create(user=recruiter, user_type="recruiter")
+        client = Client()
+        client.force_login(recruiter)
+        response = client.post(
+            "/jobs/api/rank/", {"job_description": "python developer", "skills": 5}, content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+class CircuitBreakerTests(SimpleTestCase):
+    def setUp(self):
+        self.breaker = CircuitBreaker("test", window=4, min_calls=4, failure_ratio=0.5, slow_ms=1000, cooldown=0.1)
+
+    @staticmethod
+    def _boom():
+        raise RuntimeError("boom")
+
+    def _fail(self, times):
+        for _ in range(times):
+            with self.assertRaises(RuntimeError):
+                self.breaker.call(self._boom)
+
+    def test_opens_on_failure_ratio_and_fails_fast(self):
+        self.breaker.call(lambda: 1)
+        self.breaker.call(lambda: 1)
+        self._fail(1)
+        self.assertEqual(self.breaker.state, "closed")  # 1 failure in 3 calls: below min_calls
+        self._fail(1)
+        self.assertEqual(self.breaker.state, "open")
+        called = []
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.call(called.append, 1)
+        self.assertEqual(called, [])
+
+    def test_half_open_lets_one_trial_through(self):
+        self._fail(4)
+        time.sleep(0.15)
+        self.assertEqual(self.breaker.state, "half_open")
+
+        started, release = threading.Event(), threading.Event()
+
+        def trial():
+            started.set()
+            release.wait(5)
+            return "ok"
+
+        result = []
+        thread = threading.Thread(target=lambda: result.append(self.breaker.call(trial)))
+        thread.start()
+        started.wait(5)
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.call(lambda: 1)  # a second caller while the trial runs
+        release.set()
+        thread.join(5)
+        self.assertEqual(result, ["ok"])
+        self.assertEqual(self.breaker.state, "closed")
+
+    def test_failed_trial_reopens(self):
+        self._fail(4)
+        time.sleep(0.15)
+        self._fail(1)
+        self.assertEqual(self.breaker.state, "open")
+
+    def test_deadline_exceeded_counts_as_failure(self):
+        with self.assertRaises(DeadlineExceeded):
+            self.breaker.call(time.sleep, 0.5, timeout=0.05)
+        with self.assertRaises(DeadlineExceeded):
+            self.breaker.call(lambda: 1, timeout=0)
+        self.assertEqual(self.breaker.stats()["failures"], 2)
+        self.assertEqual(self.breaker.call(lambda: "fast", timeout=1), "fast")
+
+
+class StrictRankerTests(TestCase):
+    SKILLS = ["python", "django", "sql", "aws", "react", "machine learning", "c++"]
+
+    @staticmethod
+    def per_row(job_skills, applicant, required):
+        """The per-row loop rank_strict replaced."""
+        skills, years, education, resume = applicant
+        skill_score = ai_service.calculate_skill_match(skills, job_skills)
+        gap = years - required
+        exp_score = 100 if gap >= 0 else (max(0, 50 + gap * 25) if gap >= -2 else 0)
+        score = skill_score * 0.5 + exp_score * 0.35 + (10 if education else 0) + (5 if resume else 0)
+        return round(min(100, max(0, score)), 1), _notes(skill_score, years, required, education, resume)
+
+    def test_scores_match_per_row_loop(self):
+        rng = random.Random(7)
+        for _ in range(50):
+            job_skills = rng.sample(self.SKILLS, rng.randint(0, 4))
+            required = rng.randint(0, 8)
+            applicants = [
+                (rng.sample(self.SKILLS, rng.randint(0, 5)), rng.randint(0, 12), rng.random() < 0.5, rng.random() < 0.5)
+                for _ in range(20)
+            ]
+            skill_pct, _, total = score_profiles(
+                job_skills, [a[0] for a in applicants], [a[1] for a in applicants], required,
+                [a[2] for a in applicants], [a[3] for a in applicants],
+            )
+            for i, (skills, years, education, resume) in enumerate(applicants):
+                actual = (round(float(total[i]), 1), _notes(skill_pct[i], years, required, education, resume))
+                self.assertEqual(actual, self.per_row(job_skills, applicants[i], required))
+
+    def test_rank_strict_stores_scores_best_first(self):
+        recruiter = User.objects.create_user("recruiter")
+        job = Job.objects.create(
+            title="Developer", description="python", skills_required="Python, SQL", experience_required=3,
+            posted_by=recruiter,
+        )
+        strong, weak, missing = (User.objects.create_user(name) for name in ("strong", "weak", "missing"))
+        Profile.objects.create(
+            user=strong, user_type="jobseeker", skills="python, sql", experience_years=5, education="BSc"
+        )
+        Profile.objects.create(user=weak, user_type="jobseeker", skills="sql", experience_years=2)
+        for user in (strong, weak, missing):
+            JobApplication.objects.create(job=job, applicant=user)
+
+        ranked = rank_strict(job, JobApplication.objects.filter(job=job))
+        self.assertEqual([application.applicant_id for application in ranked], [strong.pk, weak.pk, missing.pk])
+        stored = dict(JobApplication.objects.filter(job=job).values_list("applicant_id", "match_score"))
+        self.assertEqual(stored, {strong.pk: 95.0, weak.pk: 33.8, missing.pk: 0.0})
+        self.assertEqual(JobApplication.objects.get(applicant=missing).ranking_notes, "No profile")
+
+
+class ResumeExtractorTests(SimpleTestCase):
+    WORD_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+    def _docx(self, paragraphs):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "resume.docx")
+        body = "".join(f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>" for text in paragraphs)
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr("word/document.xml", f'<w:document xmlns:w="{self.WORD_NS}"><w:body>{body}</w:body></w:document>')
+        return path
+
+    def test_docx_stops_at_max_chars(self):
+        path = self._docx([f"paragraph {i} python django" for i in range(1000)])
+        pulled = []
+        extractor = resume_extractors.iter_docx_text
+
+        def counting(path, max_pages=None):
+            for chunk in extractor(path, max_pages=max_pages):
+                pulled.append(chunk)
+                yield chunk
+
+        with mock.patch.dict(resume_extractors._EXTRACTORS, {".docx": counting}):
+            text = resume_extractors.extract_text(path, max_chars=60)
+        self.assertEqual(len(text), 60)
+        self.assertTrue(text.startswith("paragraph 0 python django\nparagraph 1"))
+        self.assertEqual(len(pulled), 3)  # the rest of the document is never parsed
+
+    def test_token_budget(self):
+        path = self._docx(["one two three", "four five six", "seven"])
+        self.assertEqual(resume_extractors.extract_text(path, max_tokens=4), "one two three\nfour")
+        self.assertEqual(resume_extractors.extract_text(path), "one two three\nfour five six\nseven")
+
+    def test_pdf_stops_at_max_chars(self):
+        pages = [mock.Mock(**{"extract_text.return_value": f"page {i} " + "x" * 50}) for i in range(10)]
+        pypdf = mock.Mock(**{"PdfReader.return_value.pages": pages})
+        with mock.patch.dict(sys.modules, {"pypdf": pypdf}):
+            text = resume_extractors.extract_text("resume.pdf", max_chars=100)
+            self.assertEqual(len(text), 100)
+            self.assertEqual(sum(page.extract_text.called for page in pages), 2)
+
+            resume_extractors.extract_text("resume.pdf", max_pages=3)
+            self.assertEqual(sum(page.extract_text.called for page in pages), 3)
+
+    def test_unsupported_type(self):
+        self.assertEqual(resume_extractors.extract_text("resume.txt"), "")
+
+
+class ExtractionPoolTests(SimpleTestCase):
+    def setUp(self):
+        self.enterContext(mock.patch.object(resume_extraction, "_pool", None))
+
+    def test_concurrent_callers_share_one_pool(self):
+        def slow_pool(**kwargs):
+            time.sleep(0.05)
+            return mock.Mock(_processes={})
+
+        barrier = threading.Barrier(8)
+        pools = []
+
+        def call():
+            barrier.wait()
+            pools.append(resume_extraction._get_pool())
+
+        with mock.patch.object(resume_extraction, "ProcessPoolExecutor", side_effect=slow_pool) as executor:
+            threads = [threading.Thread(target=call) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(executor.call_count, 1)
+        self.assertEqual(len({id(pool) for pool in pools}), 1)
+
+    def test_stale_reset_keeps_replacement_pool(self):
+        with mock.patch.object(resume_extraction, "ProcessPoolExecutor", side_effect=lambda **kwargs: mock.Mock(_processes={})):
+            stale = resume_extraction._get_pool()
+            resume_extraction._reset_pool(stale)
+            stale.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+            current = resume_extraction._get_pool()
+            resume_extraction._reset_pool(stale)
+            self.assertIs(resume_extraction._get_pool(), current)
+            current.shutdown.assert_not_called()
@@ -0,0 +1,215 @@
+"""
+Compiled Employee Upskilling dataset.
+
+``manage.py compile_upskilling`` (run by build.sh) turns the CSV into a
+typed ``.npz`` artifact once per deploy: categorical columns become integer
+codes plus a vocabulary, numeric columns become float arrays, role titles
+are tokenised ahead of time and hiring success is pre-aggregated per
+(job role, current title, industry, upskilling type) group. Workers load
+the artifact with NumPy alone; market-insight queries then touch a few
+dozen groups instead of thousands of rows.
+"""
+import csv
+import logging
+import os
+import re
+from pathlib import Path
+
+import numpy as np
+from django.conf import settings
+
+logger = logging.getLogger('jobs')
+
+CSV_NAME = "Employee_Upskilling_Dataset.csv"
+ARTIFACT_NAME = "Employee_Upskilling_Dataset.npz"
+ARTIFACT_FORMAT = 1
+
+SUCCESS_COL = "success_in_hiring_process"
+ROLE_COLS = ("job_role", "current_job_title")
+GROUP_COLS = ("job_role", "current_job_title", "industry", "ai_upskilling_type")
+
+
+def default_paths():
+    models_dir = Path(getattr(settings, "MEDIA_ROOT", "media")) / "models"
+    artifact = getattr(settings, "UPSKILLING_ARTIFACT", "") or models_dir / ARTIFACT_NAME
+    return models_dir / CSV_NAME, Path(artifact)
+
+
+def normalize_column(name):
+    return name.strip().lower().replace(" ", "_")
+
+
+def title_tokens(text):
+    if not text:
+        return frozenset()
+    return frozenset(token for token in re.split(r"\W+", text.lower()) if len(token) > 2)
+
+
+def source_fingerprint(csv_path):
+    stat = os.stat(csv_path)
+    return f"{stat.st_size}:{int(stat.st_mtime)}"
+
+
+def _parse_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def compile_csv(csv_path):
+    """Parse the CSV (stdlib only) into a dict of NumPy arrays ready for np.savez."""
+    with open(csv_path, newline="", encoding="utf-8") as handle:
+        reader = csv.reader(handle)
+        header = [normalize_column(col) for col in next(reader)]
+        rows = [row for row in reader if row]
+
+    columns = {name: [row[i].strip() if i < len(row) else "" for row in rows] for i, name in enumerate(header)}
+    arrays = {
+        "format": np.array(ARTIFACT_FORMAT),
+        "source": np.array(source_fingerprint(csv_path)),
+        "rows": np.array(len(rows)),
+    }
+    categorical, numeric = [], []
+
+    for name, values in columns.items():
+        present = [value for value in values if value]
+        if name == SUCCESS_COL or (present and all(_parse_float(value) is not None for value in present)):
+            # Non-numeric success values count as 0, like pd.to_numeric(errors="coerce").fillna(0)
+            fill = 0.0 if name == SUCCESS_COL else np.nan
+            parsed = [_parse_float(value) for value in values]
+            arrays[f"num__{name}"] = np.array([fill if v is None else v for v in parsed], dtype=np.float32)
+            numeric.append(name)
+        else:
+            vocab = sorted(set(present))
+            index = {value: code for code, value in enumerate(vocab)}
+            arrays[f"cat__{name}__vocab"] = np.array(vocab, dtype=str)
+            arrays[f"cat__{name}__codes"] = np.array([index.get(value, -1) for value in values], dtype=np.int32)
+            categorical.append(name)
+            if name in ROLE_COLS:
+                arrays[f"cat__{name}__tokens"] = np.array([" ".join(sorted(title_tokens(v))) for v in vocab], dtype=str)
+
+    arrays["categorical"] = np.array(categorical, dtype=str)
+    arrays["numeric"] = np.array(numeric, dtype=str)
+
+    # Pre-aggregated success per group; missing columns aggregate as code -1
+    if rows:
+        keys = np.stack([
+            arrays[f"cat__{name}__codes"] if f"cat__{name}__codes" in arrays else np.full(len(rows), -1, np.int32)
+            for name in GROUP_COLS
+        ], axis=1)
+        success = arrays.get(f"num__{SUCCESS_COL}", np.zeros(len(rows), dtype=np.float32)).astype(np.float64)
+        groups, inverse = np.unique(keys, axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+        arrays["group_keys"] = groups.astype(np.int32)
+        arrays["group_success"] = np.bincount(inverse, weights=success, minlength=len(groups))
+        arrays["group_count"] = np.bincount(inverse, minlength=len(groups)).astype(np.int32)
+    else:
+        arrays["group_keys"] = np.zeros((0, len(GROUP_COLS)), dtype=np.int32)
+        arrays["group_success"] = np.zeros(0)
+        arrays["group_count"] = np.zeros(0, dtype=np.int32)
+    arrays["has_success"] = np.array(SUCCESS_COL in numeric)
+    return arrays
+
+
+def write_artifact(csv_path, artifact_path):
+    arrays = compile_csv(csv_path)
+    artifact_path = Path(artifact_path)
+    artifact_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = artifact_path.with_name(artifact_path.name + ".tmp")
+    with open(tmp_path, "wb") as handle:
+        np.savez_compressed(handle, **arrays)
+    os.replace(tmp_path, artifact_path)
+    return arrays
+
+
+class UpskillingData:
+    """Read-only view over a compiled artifact (or freshly compiled arrays)."""
+
+    def __init__(self, arrays):
+        self.rows = int(arrays["rows"])
+        self.categorical = {str(name) for name in arrays["categorical"]}
+        self.has_success = bool(arrays["has_success"])
+        self.vocab = {name: [str(v) for v in arrays[f"cat__{name}__vocab"]] for name in self.categorical}
+        self.role_tokens = {
+            name: [frozenset(tokens.split()) for tokens in arrays[f"cat__{name}__tokens"]]
+            for name in ROLE_COLS if name in self.categorical
+        }
+        self.group_keys = np.asarray(arrays["group_keys"])
+        self.group_success = np.asarray(arrays["group_success"], dtype=np.float64)
+        self.group_count = np.asarray(arrays["group_count"], dtype=np.int64)
+
+    def __len__(self):
+        return self.rows
+
+    def _column(self, name):
+        return self.group_keys[:, GROUP_COLS.index(name)]
+
+    def match_groups(self, tokens, threshold=0.4):
+        """Boolean mask of groups whose job role or current title overlaps the query title."""
+        mask = np.zeros(len(self.group_keys), dtype=bool)
+        for name, vocab_tokens in self.role_tokens.items():
+            codes = [
+                code for code, value_tokens in enumerate(vocab_tokens)
+                if len(tokens & value_tokens) / max(len(tokens | value_tokens), 1) >= threshold
+            ]
+            if codes:
+                mask |= np.isin(self._column(name), codes)
+        return mask
+
+    def restrict_industry(self, mask, industry):
+        """Narrow ``mask`` to ``industry`` (case-insensitive) when that leaves anything."""
+        if "industry" not in self.categorical:
+            return mask
+        codes = [code for code, value in enumerate(self.vocab["industry"]) if value.lower() == industry.lower()]
+        narrowed = mask & np.isin(self._column("industry"), codes)
+        return narrowed if narrowed.any() else mask
+
+    def success(self, mask):
+        """(success_rate_fraction, sample_size) over the groups in ``mask``."""
+        count = int(self.group_count[mask].sum())
+        if not count:
+            return None, 0
+        return float(self.group_success[mask].sum() / count), count
+
+    def success_by_upskilling(self, mask):
+        """[(upskilling_type, mean_success, count)] for matched rows with a known type."""
+        if "ai_upskilling_type" not in self.categorical:
+            return []
+        codes = self._column("ai_upskilling_type")[mask]
+        keep = codes >= 0
+        codes = codes[keep]
+        if not len(codes):
+            return []
+        size = len(self.vocab["ai_upskilling_type"])
+        sums = np.bincount(codes, weights=self.group_success[mask][keep], minlength=size)
+        counts = np.bincount(codes, weights=self.group_count[mask][keep], minlength=size)
+        return [
+            (self.vocab["ai_upskilling_type"][code], sums[code] / counts[code], int(counts[code]))
+            for code in range(size) if counts[code]
+        ]
+
+
+def load():
+    """
+    Load the compiled artifact, or compile the CSV in-process when the
+    artifact is missing, unreadable or older than the CSV. Returns None when
+    neither exists.
+    """
+    csv_path, artifact_path = default_paths()
+    current = source_fingerprint(csv_path) if csv_path.exists() else None
+
+    if artifact_path.exists():
+        try:
+            with np.load(artifact_path, allow_pickle=False) as archive:
+                arrays = {key: archive[key] for key in archive.files}
+            if int(arrays["format"]) == ARTIFACT_FORMAT and current in (None, str(arrays["source"])):
+                return UpskillingData(arrays)
+            logger.warning(f"Upskilling artifact {artifact_path} is stale; recompiling in memory")
+        except Exception as exc:
+            logger.warning(f"Could not read upskilling artifact {artifact_path}: {exc}")
+
+    if current is None:
+        logger.warning(f"Upskilling dataset not found at {csv_path}; skipping market insights.")
+        return None
+    return UpskillingData(compile_csv(csv_path))
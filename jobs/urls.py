@@ -27,6 +27,9 @@ urlpatterns = [
     
     # API Endpoints
     path('api/rank/', views.rank_applications_api, name='rank_applications_api'),
+    path('api/rank/stream/', views.rank_applications_stream_api, name='rank_applications_stream_api'),
+    path('api/job/<int:job_id>/match/', views.job_match_api, name='job_match_api'),
+    path('api/skill-filter/', views.skill_filter_api, name='skill_filter_api'),
     path('api/track-view/', views.track_job_view, name='track_job_view'),
     path('api/track-preference/', views.track_job_preference, name='track_job_preference'),
 ]
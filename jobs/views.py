@@ -1,15 +1,16 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
+from django.conf import settings
 from django.db.models import Count
-from django.http import JsonResponse
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 import json
 import logging
 from .models import Job, JobApplication, JobView, JobPreference
 from .forms import JobForm, JobApplicationForm
-from .ai_service import get_job_recommendations, rank_applications
 
 logger = logging.getLogger('jobs')
 
@@ -46,6 +47,8 @@ def ensure_profile_exists(request, redirect_url='accounts:home'):
 @login_required
 def user_dashboard(request):
     """User/Job Seeker Dashboard"""
+    from .feed import get_feed
+
     profile, redirect_response = ensure_profile_exists(request)
     if redirect_response:
         return redirect_response
@@ -56,13 +59,8 @@ def user_dashboard(request):
     # Get user's applications
     my_applications = JobApplication.objects.filter(applicant=request.user).select_related('job')
     
-    # Get active jobs for recommendations (exclude already applied)
-    active_jobs = Job.objects.filter(is_active=True).exclude(
-        applications__applicant=request.user
-    )
-    
-    # Get AI recommendations
-    recommendations = get_job_recommendations(profile, active_jobs)[:5]
+    # Top of the materialized feed (refreshed in the background)
+    recommendations, feed = get_feed(profile, limit=5)
     
     # Calculate profile completion
     profile_fields = [profile.headline, profile.bio, profile.skills, profile.experience_years, 
@@ -74,6 +72,7 @@ def user_dashboard(request):
         'profile': profile,
         'recent_applications': my_applications[:5],
         'recommended_jobs': recommendations,
+        'feed': feed,
         'total_applications': my_applications.count(),
         'profile_completion': profile_completion,
     }
@@ -82,73 +81,106 @@ def user_dashboard(request):
 
 @login_required
 def browse_jobs(request):
-    """Browse all available jobs"""
+    """Browse all available jobs, a page at a time"""
+    from .candidate_generation import candidate_jobs
+    from .feed import _as_recommendation, feed_items, get_feed
+    from .search import search_jobs
+    from .snapshots import paginate
+
     profile = get_user_profile(request)
+    is_seeker = bool(profile and profile.user_type == 'jobseeker')
     
-    jobs = Job.objects.filter(is_active=True)
+    jobs = Job.objects.open()
     
-    # Simple search
-    query = request.GET.get('q', '')
+    # Full-text search (stemmed, ranked; see jobs/search.py)
+    query = request.GET.get('q', '').strip()
     if query:
-        jobs = jobs.filter(title__icontains=query) | jobs.filter(description__icontains=query)
+        jobs = search_jobs(jobs, query)
     
-    # Filter by job type
+    # Hard filters (type, location, open and not yet applied) in one candidate query
     job_type = request.GET.get('type', '')
-    if job_type:
-        jobs = jobs.filter(job_type=job_type)
+    location = request.GET.get('location', '').strip()
+    jobs = candidate_jobs(request.user, jobs, job_type=job_type or None, location=location or None)
+    
+    def build_snapshot():
+        # Feed order first (recommended = score >= 50), then the other matching jobs,
+        # best text match (or newest) first
+        ranked, recommended = [], 0
+        if is_seeker:
+            recommendations, _ = get_feed(profile, jobs=jobs)
+            ranked = [rec['job'].pk for rec in recommendations]
+            recommended = sum(1 for rec in recommendations if rec['score'] >= 50)
+        in_feed = set(ranked)
+        others = jobs.order_by('-search_rank', '-created_at') if query else jobs
+        rest = [pk for pk in others.values_list('pk', flat=True) if pk not in in_feed]
+        return {'ids': ranked + rest, 'recommended': recommended}
+    
+    # Later pages slice the stored order instead of re-ranking
+    page_ids, offset, snapshot, next_cursor = paginate(
+        request, json.dumps([query, job_type, location]), build_snapshot, cursor=request.GET.get('cursor')
+    )
+    
+    # Both lookups go through the candidate query, so jobs closed, applied to
+    # or dismissed since the snapshot was taken are skipped
+    items = {}
+    feed = None
+    if is_seeker:
+        for item in feed_items(request.user, jobs).filter(job_id__in=page_ids):
+            feed = item.feed
+            items[item.job_id] = _as_recommendation(item)
+    missing = [pk for pk in page_ids if pk not in items]
+    for job in jobs.filter(pk__in=missing):
+        items[job.pk] = {'job': job, 'score': 0, 'reason': '', 'personalized': False}
     
-    # Get recommendations if user is a job seeker with profile
     recommended_jobs = []
     other_jobs = []
+    for position, pk in enumerate(page_ids, start=offset):
+        if pk in items:
+            (recommended_jobs if position < snapshot['recommended'] else other_jobs).append(items[pk])
     
-    if profile and profile.user_type == 'jobseeker':
-        recommendations = get_job_recommendations(profile, jobs, use_personalization=True)
-        recommended_jobs = [rec for rec in recommendations if rec['score'] >= 50]
-        other_jobs = [rec for rec in recommendations if rec['score'] < 50]
-    else:
-        other_jobs = [{'job': job, 'score': 0, 'reason': '', 'personalized': False} for job in jobs]
+    next_query = None
+    if next_cursor:
+        params = request.GET.copy()
+        params['cursor'] = next_cursor
+        next_query = params.urlencode()
     
     context = {
         'recommended_jobs': recommended_jobs,
         'other_jobs': other_jobs,
+        'feed': feed,
         'query': query,
         'job_type': job_type,
+        'location': location,
         'job_types': Job.JOB_TYPE_CHOICES,
-        'has_profile': profile and profile.user_type == 'jobseeker',
+        'has_profile': is_seeker,
+        'page_start': offset + 1,
+        'page_end': offset + len(page_ids),
+        'total_jobs': len(snapshot['ids']),
+        'next_query': next_query,
     }
     return render(request, 'jobs/browse_jobs.html', context)
 
 
 @login_required
 def job_detail(request, job_id):
-    """View job details"""
+    """View job details (the match score is fetched afterwards from job_match_api)"""
     job = get_object_or_404(Job, id=job_id)
     has_applied = JobApplication.objects.filter(job=job, applicant=request.user).exists()
+    is_jobseeker = hasattr(request.user, 'profile') and request.user.profile.user_type == 'jobseeker'
     
     # Track job view (create or update)
-    if hasattr(request.user, 'profile') and request.user.profile.user_type == 'jobseeker':
+    if is_jobseeker:
         JobView.objects.create(
             user=request.user,
             job=job,
             source=request.GET.get('source', 'direct')
         )
     
-    match_score = None
-    match_reason = None
-    match_improvements = []
-    if hasattr(request.user, 'profile') and request.user.profile.user_type == 'jobseeker':
-        recommendations = get_job_recommendations(request.user.profile, [job], use_personalization=True)
-        if recommendations:
-            match_score = recommendations[0]['score']
-            match_reason = recommendations[0]['reason']
-            match_improvements = recommendations[0].get('improvements', [])
-    
     context = {
         'job': job,
         'has_applied': has_applied,
-        'match_score': match_score,
-        'match_reason': match_reason,
-        'match_improvements': match_improvements,
+        # Applied jobs get no match score
+        'show_match': is_jobseeker and not has_applied,
     }
     return render(request, 'jobs/job_detail.html', context)
 
@@ -156,7 +188,7 @@ def job_detail(request, job_id):
 @login_required
 def apply_job(request, job_id):
     """Apply for a job"""
-    job = get_object_or_404(Job, id=job_id, is_active=True)
+    job = get_object_or_404(Job.objects.open(), id=job_id)
     
     if JobApplication.objects.filter(job=job, applicant=request.user).exists():
         messages.warning(request, 'You have already applied for this job.')
@@ -304,9 +336,34 @@ def delete_job(request, job_id):
     return render(request, 'jobs/delete_job.html', {'job': job})
 
 
+def _skill_filter_bits(request, expression, min_years):
+    """Skill index bitset of applicants passing the skill filter, or None when no filter is set."""
+    from .skill_index import SkillQueryError, match_bits
+
+    try:
+        return match_bits(expression, int(min_years) if min_years else None)
+    except (SkillQueryError, ValueError) as e:
+        messages.error(request, f'Invalid skill filter: {e}')
+        return None
+
+
+DEGRADED_NOTES = ('Keyword relevance only (', 'Profile scoring only (')
+
+
+def _ranking_degraded(applications):
+    """True if any application was scored by a fallback instead of the AI model."""
+    return any(
+        (getattr(app, 'xai_data', None) or {}).get('degraded')
+        or any(note in (app.ranking_notes or '') for note in DEGRADED_NOTES)
+        for app in applications
+    )
+
+
 @login_required
 def view_all_applications(request):
     """View all applications across all jobs grouped by job with AI ranking"""
+    from .skill_index import restrict_applications
+
     profile = get_user_profile(request)
     if not profile or profile.user_type != 'recruiter':
         messages.error(request, 'Please log in as a recruiter to view applications.')
@@ -325,19 +382,29 @@ def view_all_applications(request):
     # Filter by status if specified
     status_filter = request.GET.get('status')
     
+    # Hard skill/experience filter, evaluated on the skill index before ranking
+    skill_filter = request.GET.get('skills', '').strip()
+    min_years = request.GET.get('min_years', '').strip()
+    skill_bits = _skill_filter_bits(request, skill_filter, min_years)
+    
     # Group applications by job
     jobs_with_applications = []
     total_applications = 0
     
     for job in jobs:
-        applications = job.applications.select_related('applicant', 'applicant__profile').order_by('-applied_at')
+        # Stored ranking order (scores are maintained by the background worker)
+        applications = job.applications.select_related('applicant', 'applicant__profile').order_by(
+            '-match_score', '-applied_at'
+        )
         
         # Filter by status if specified
         if status_filter:
             applications = applications.filter(status=status_filter)
+        if skill_bits is not None:
+            applications = restrict_applications(applications, skill_bits)
         
         if applications.exists() or not job_filter:  # Show all jobs if no filter, or only jobs with apps if filtered
-            ranked_applications = rank_applications(job, applications)
+            ranked_applications = list(applications)
             jobs_with_applications.append({
                 'job': job,
                 'applications': ranked_applications,
@@ -345,11 +412,16 @@ def view_all_applications(request):
             })
             total_applications += len(ranked_applications)
     
+    if any(_ranking_degraded(entry['applications']) for entry in jobs_with_applications):
+        messages.warning(request, 'Some candidates were scored without the AI model; they are ranked by keywords and profile data.')
+    
     context = {
         'jobs_with_applications': jobs_with_applications,
         'jobs': Job.objects.filter(posted_by=request.user),
         'selected_job': int(job_filter) if job_filter else None,
         'selected_status': status_filter,
+        'skill_filter': skill_filter,
+        'min_years': min_years,
         'total_applications': total_applications,
     }
     return render(request, 'jobs/view_applications.html', context)
@@ -357,7 +429,9 @@ def view_all_applications(request):
 
 @login_required
 def view_applications(request, job_id):
-    """View and rank applications for a job"""
+    """View applications for a job, best match first"""
+    from .skill_index import restrict_applications
+
     profile = get_user_profile(request)
     if not profile or profile.user_type != 'recruiter':
         messages.error(request, 'Please log in as a recruiter to view applications.')
@@ -366,11 +440,22 @@ def view_applications(request, job_id):
     job = get_object_or_404(Job, id=job_id, posted_by=request.user)
     applications = JobApplication.objects.filter(job=job).select_related('applicant')
     
-    # Rank applications using AI
-    ranked_applications = rank_applications(job, applications)
+    skill_filter = request.GET.get('skills', '').strip()
+    min_years = request.GET.get('min_years', '').strip()
+    skill_bits = _skill_filter_bits(request, skill_filter, min_years)
+    if skill_bits is not None:
+        applications = restrict_applications(applications, skill_bits)
+    
+    # Plain ordered read: new applications are scored incrementally by the worker,
+    # and job edits re-rank the pool in the background
+    ranked_applications = list(applications.order_by('-match_score', '-applied_at'))
+    if _ranking_degraded(ranked_applications):
+        messages.warning(request, 'Some candidates were scored without the AI model; they are ranked by keywords and profile data.')
     
     context = {
         'job': job,
+        'skill_filter': skill_filter,
+        'min_years': min_years,
         'applications': ranked_applications,
         'top_candidates': ranked_applications[:3] if len(ranked_applications) >= 3 else ranked_applications,
     }
@@ -435,11 +520,14 @@ def view_candidate(request, application_id):
         profile = None
     
     # Generate fresh XAI data for AI Analysis
-    from .ai_service import _build_xai, _build_resume_text, _build_job_text, _calculate_feature_importance
-    from .ai_lazy_loader import get_ranker, get_sklearn
+    from .ai_service import (
+        _build_xai, _build_resume_text, _build_job_text, _calculate_feature_importance,
+        _encode_resumes, _job_vectors,
+    )
+    from .ai_lazy_loader import get_ranker
+    from .similarity import cosine
     
     ranker = get_ranker()
-    cosine_similarity = get_sklearn()
     
     xai_data = None
     feature_importance = None
@@ -461,11 +549,12 @@ def view_candidate(request, application_id):
             )
             
             # Calculate scores
-            job_text = _build_job_text(application.job, application.job.description)
+            job_text = _build_job_text(application.job)
             if job_text:
-                job_emb = ranker.model.encode(job_text)
-                resume_emb = ranker.model.encode(resume_text)
-                similarity_score = float(cosine_similarity([resume_emb], [job_emb])[0][0] * 100)
+                job_emb = _job_vectors([application.job], [job_text])
+                resume_emb = _encode_resumes([application], [resume_text])
+                if job_emb is not None and resume_emb is not None:
+                    similarity_score = cosine(resume_emb[0], job_emb[0]) * 100
             
             # Calculate skill score
             from .ai_service import _split_skills
@@ -509,104 +598,147 @@ def view_candidate(request, application_id):
 
 # Legacy view
 def job_list(request):
-    jobs = Job.objects.filter(is_active=True)
+    jobs = Job.objects.open()
     return render(request, 'jobs/job_list.html', {'jobs': jobs})
 
 
 # ============== API ENDPOINTS ==============
 
+RANK_API_RESULTS = 10  # candidates returned by the ranking APIs
+
+
+def _ranking_request(request, job_id=None):
+    """
+    Parse a ranking API request (shared by the plain and streaming endpoints).
+    Returns (job, applications, job_description, None), or
+    (None, None, None, error_response) when the request is rejected.
+    """
+    from .skill_index import SkillQueryError, match_bits, restrict_applications
+
+    profile = get_user_profile(request)
+    if not profile or profile.user_type != 'recruiter':
+        return None, None, None, JsonResponse({'error': 'Recruiter access required'}, status=403)
+    
+    # Parse request body
+    data = json.loads(request.body)
+    job_description = data.get('job_description', '')
+    
+    if not job_description:
+        return None, None, None, JsonResponse({'error': 'Job description required'}, status=400)
+    
+    # Optional hard filter ("python AND django", min_years) applied before the encoder
+    try:
+        skill_bits = match_bits(data.get('skills'), data.get('min_years'))
+    except (SkillQueryError, ValueError, TypeError) as e:
+        return None, None, None, JsonResponse({'error': f'Invalid skill filter: {e}'}, status=400)
+    
+    # Get applications based on job_id or filtered applications
+    if job_id:
+        # Rank for specific job
+        job = get_object_or_404(Job, id=job_id, posted_by=request.user)
+        applications = JobApplication.objects.filter(job=job).select_related('applicant', 'applicant__profile')
+    else:
+        # Rank all applications (from applications page)
+        job_filter = data.get('job_id')
+        applications = JobApplication.objects.filter(
+            job__posted_by=request.user
+        ).select_related('job', 'applicant', 'applicant__profile')
+        
+        if job_filter:
+            applications = applications.filter(job_id=job_filter)
+            job = get_object_or_404(Job, id=job_filter, posted_by=request.user)
+        else:
+            job = None
+    
+    if skill_bits is not None:
+        applications = restrict_applications(applications, skill_bits)
+    return job, applications, job_description, None
+
+
+def _candidate_payloads(applications):
+    """API representation of ranked (or provisionally ranked) applications."""
+    candidates = []
+    for app in applications:
+        try:
+            xai_data = getattr(app, 'xai_data', None)
+            explanation = app.ranking_notes or ''
+            matched_skills = []
+            missing_skills = []
+            experience_years = 0
+            similar_role = False
+            similar_role_success = None
+
+            if xai_data:
+                explanation = xai_data.get('explanation', explanation)
+                matched_skills = xai_data.get('matched_skills', [])
+                missing_skills = xai_data.get('missing_skills', [])
+                experience_years = xai_data.get('experience_years') or 0
+                similar_role = bool(xai_data.get('similar_role'))
+                similar_role_success = xai_data.get('similar_role_success')
+
+            candidates.append({
+                'id': app.id,
+                'name': app.applicant.get_full_name() or app.applicant.username,
+                'email': app.applicant.email,
+                'rank_score': round(app.match_score, 1),
+                'skills_list': matched_skills,
+                'missing_skills': missing_skills,
+                'experience_years': experience_years,
+                'similar_role': similar_role,
+                'explanation': explanation,
+                'similar_role_success': similar_role_success,
+                'degraded': bool(xai_data and xai_data.get('degraded')),
+            })
+        except Exception as e:
+            logger.warning(f"Error formatting candidate {app.id}: {str(e)}")
+            continue
+    return candidates
+
+
+def _ranking_result(ranked_applications):
+    candidates = _candidate_payloads(ranked_applications[:RANK_API_RESULTS])
+    pending = sum(1 for app in ranked_applications if getattr(app, 'ranking_status', None) == 'pending')
+    logger.info(f"Ranked {len(candidates)} candidates ({pending} not reached)")
+    result = {
+        'success': True,
+        'candidates': candidates,
+        'total': len(candidates),
+        'degraded': _ranking_degraded(ranked_applications),
+        'pending': pending,
+    }
+    if pending:
+        result['message'] = (
+            f"{pending} candidates were not reached within the time budget and keep their keyword "
+            f"pre-screen score; use the streaming ranking for a longer pass"
+        )
+    return result
+
+
+NO_APPLICATIONS = {'success': True, 'candidates': [], 'total': 0, 'message': 'No applications found'}
+
+
 @require_http_methods(["POST"])
 @login_required
 def rank_applications_api(request, job_id=None):
     """API endpoint for ranking candidates using AI"""
+    from .ai_service import rank_applications
+
     try:
-        profile = get_user_profile(request)
-        if not profile or profile.user_type != 'recruiter':
-            return JsonResponse({'error': 'Recruiter access required'}, status=403)
-        
-        # Parse request body
-        data = json.loads(request.body)
-        job_description = data.get('job_description', '')
-        
-        if not job_description:
-            return JsonResponse({'error': 'Job description required'}, status=400)
-        
-        # Get applications based on job_id or filtered applications
-        if job_id:
-            # Rank for specific job
-            job = get_object_or_404(Job, id=job_id, posted_by=request.user)
-            applications = JobApplication.objects.filter(job=job).select_related('applicant', 'applicant__profile')
-        else:
-            # Rank all applications (from applications page)
-            job_filter = data.get('job_id')
-            applications = JobApplication.objects.filter(
-                job__posted_by=request.user
-            ).select_related('job', 'applicant', 'applicant__profile')
-            
-            if job_filter:
-                applications = applications.filter(job_id=job_filter)
-                job = get_object_or_404(Job, id=job_filter, posted_by=request.user)
-            else:
-                job = None
+        job, applications, job_description, error = _ranking_request(request, job_id)
+        if error:
+            return error
         
         if not applications.exists():
-            return JsonResponse({
-                'success': True,
-                'candidates': [],
-                'total': 0,
-                'message': 'No applications found'
-            })
+            return JsonResponse(NO_APPLICATIONS)
         
-        # Rank applications using AI
+        # Rank applications using AI within RANK_TIME_BUDGET and ENCODE_DEADLINE;
+        # candidates not reached are reported as pending (the stream goes further)
         ranked_applications = rank_applications(
             job,
             applications,
             job_description=job_description,
         )
-        
-        # Format response
-        candidates = []
-        for app in ranked_applications[:10]:  # Top 10 candidates
-            try:
-                xai_data = getattr(app, 'xai_data', None)
-                explanation = app.ranking_notes or ''
-                matched_skills = []
-                missing_skills = []
-                experience_years = 0
-                similar_role = False
-                similar_role_success = None
-
-                if xai_data:
-                    explanation = xai_data.get('explanation', explanation)
-                    matched_skills = xai_data.get('matched_skills', [])
-                    missing_skills = xai_data.get('missing_skills', [])
-                    experience_years = xai_data.get('experience_years') or 0
-                    similar_role = bool(xai_data.get('similar_role'))
-                    similar_role_success = xai_data.get('similar_role_success')
-
-                candidates.append({
-                    'id': app.id,
-                    'name': app.applicant.get_full_name() or app.applicant.username,
-                    'email': app.applicant.email,
-                    'rank_score': round(app.match_score, 1),
-                    'skills_list': matched_skills,
-                    'missing_skills': missing_skills,
-                    'experience_years': experience_years,
-                    'similar_role': similar_role,
-                    'explanation': explanation,
-                    'similar_role_success': similar_role_success,
-                })
-            except Exception as e:
-                logger.warning(f"Error formatting candidate {app.id}: {str(e)}")
-                continue
-        
-        logger.info(f"Ranked {len(candidates)} candidates")
-        
-        return JsonResponse({
-            'success': True,
-            'candidates': candidates,
-            'total': len(candidates)
-        })
+        return JsonResponse(_ranking_result(ranked_applications))
     
     except json.JSONDecodeError:
         return JsonResponse({'error': 'Invalid JSON request'}, status=400)
@@ -615,6 +747,127 @@ def rank_applications_api(request, job_id=None):
         return JsonResponse({'error': str(e)}, status=500)
 
 
+@require_http_methods(["POST"])
+@login_required
+def rank_applications_stream_api(request, job_id=None):
+    """
+    Streaming variant of rank_applications_api (same request body). Events
+    are sent while candidates are scored, one per line as NDJSON, or as
+    Server-Sent Events when the client sends ``Accept: text/event-stream``:
+
+    - {"event": "start", "total": applications to rank}
+    - {"event": "progress", "scored": n, "total": shortlist size, "candidates": provisional top 10}
+      after the lexical shortlist and after every encoded chunk
+    - {"event": "result", ...}: rank_applications_api's response
+    - {"event": "error", "error": "..."}
+
+    The connection stays active throughout, so the shortlist is scored for
+    up to RANK_STREAM_TIME_BUDGET seconds (kept under the gunicorn timeout)
+    instead of stopping at RANK_TIME_BUDGET; candidates not reached by then
+    keep their lexical pre-screen score.
+    """
+    from .ai_service import iter_rank_applications
+
+    try:
+        job, applications, job_description, error = _ranking_request(request, job_id)
+    except json.JSONDecodeError:
+        return JsonResponse({'error': 'Invalid JSON request'}, status=400)
+    except Exception as e:
+        logger.error(f"Error ranking applications: {str(e)}")
+        return JsonResponse({'error': str(e)}, status=500)
+    if error:
+        return error
+
+    sse = 'text/event-stream' in request.headers.get('Accept', '')
+
+    def encode(event, payload):
+        data = json.dumps({'event': event, **payload}, cls=DjangoJSONEncoder)
+        return f"event: {event}\ndata: {data}\n\n" if sse else f"{data}\n"
+
+    def events():
+        try:
+            yield encode('start', {'total': applications.count()})
+            steps = iter_rank_applications(
+                job, applications, job_description=job_description,
+                time_budget=getattr(settings, 'RANK_STREAM_TIME_BUDGET', 90.0), progress_top=RANK_API_RESULTS,
+            )
+            for event, payload in steps:
+                if event == 'progress':
+                    yield encode('progress', {
+                        'scored': payload['scored'],
+                        'total': payload['total'],
+                        'candidates': _candidate_payloads(payload['top']),
+                    })
+                else:
+                    yield encode('result', _ranking_result(payload) if payload else NO_APPLICATIONS)
+        except Exception as e:
+            logger.error(f"Error streaming ranking: {str(e)}")
+            yield encode('error', {'error': str(e)})
+
+    response = StreamingHttpResponse(
+        events(), content_type='text/event-stream' if sse else 'application/x-ndjson'
+    )
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # nginx: forward events as they are written
+    return response
+
+
+@require_http_methods(["GET"])
+@login_required
+def skill_filter_api(request):
+    """
+    Evaluate a boolean skill expression over the skill index.
+    GET ?skills=python AND (django OR flask)&min_years=3[&job_id=]
+    """
+    from .skill_index import SkillQueryError, match_bits, restrict_applications
+
+    profile = get_user_profile(request)
+    if not profile or profile.user_type != 'recruiter':
+        return JsonResponse({'error': 'Recruiter access required'}, status=403)
+    
+    try:
+        min_years = request.GET.get('min_years')
+        skill_bits = match_bits(request.GET.get('skills'), int(min_years) if min_years else None)
+    except (SkillQueryError, ValueError) as e:
+        return JsonResponse({'error': f'Invalid skill filter: {e}'}, status=400)
+    
+    applications = JobApplication.objects.filter(job__posted_by=request.user)
+    job_id = request.GET.get('job_id')
+    if job_id:
+        applications = applications.filter(job_id=job_id)
+    if skill_bits is not None:
+        applications = restrict_applications(applications, skill_bits)
+    
+    application_ids = list(applications.values_list('id', flat=True))
+    return JsonResponse({
+        'success': True,
+        'application_ids': application_ids,
+        'total': len(application_ids),
+    })
+
+
+@login_required
+@require_http_methods(["GET"])
+def job_match_api(request, job_id):
+    """
+    Match score, reason and improvements for one job, loaded by the job
+    detail page after it renders. ``match`` is null for jobs that get no
+    score (applied, dismissed or expired).
+    """
+    from .match_scores import job_match
+
+    profile = get_user_profile(request)
+    if profile is None or profile.user_type != 'jobseeker':
+        return JsonResponse({'error': 'Match scores are only available to job seekers'}, status=403)
+
+    job = get_object_or_404(Job, id=job_id)
+    try:
+        return JsonResponse({'match': job_match(profile, job)})
+    except Exception as e:
+        logger.error(f"Error scoring job {job_id} for {request.user.username}: {e}")
+        return JsonResponse({'error': 'Match score unavailable'}, status=500)
+
+
 # ============== BEHAVIORAL TRACKING APIs ==============
 
 @login_required